@@ -10,40 +10,55 @@ backend_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-# Also ensure the Vercel-installed packages are importable
-# (some path manipulation can accidentally shadow them)
-try:
-    import jwt
-except ImportError:
-    pass  # Will be caught later with a better error
-
-# Import the backend FastAPI app
-from app import app as backend_app
-
-# Force DB creation since Vercel doesn't fire ASGI lifespan/startup events
-try:
-    from database import create_db_and_tables
-    create_db_and_tables()
-except Exception as e:
-    print(f"DB init at module level: {e}")
+from utils.asgi_middleware import StripPrefixMiddleware
+from utils.lazy_app import LazyApp, PrefixDispatcher, import_from_string, router_app
+
+
+def load_backend_app():
+    # Also ensure the Vercel-installed packages are importable
+    # (some path manipulation can accidentally shadow them)
+    try:
+        import jwt
+    except ImportError:
+        pass  # Will be caught later with a better error
+
+    # The full app pulls in pandas, numpy, SQLAlchemy and every router, so it
+    # is only imported once a request needs it
+    backend_app = import_from_string("app:app")
+
+    # Force DB creation since Vercel doesn't fire ASGI lifespan/startup events
+    # (a no-op when the database, or the snapshot it was restored from, is current)
+    try:
+        from database import init_database
+        init_database()
+    except Exception as e:
+        print(f"DB init at module level: {e}")
+    return backend_app
+
+
+# Self-contained routers are served by their own small app, each imported on
+# the first request under its prefix; everything else goes to the full app
+LIGHT_ROUTERS = {
+    "/visa": "routes.visa_data:router",
+    "/api/relocation": "routes.relocation:router",
+    "/resume": "routes.resume:router",
+    "/resume/ai": "routes.resume_ai:router",
+    "/ai/sop": "routes.sop_ai:router",
+}
+
+
+def _lazy_router(router_path):
+    return LazyApp(lambda: router_app(router_path))
+
+
+backend_app = LazyApp(load_backend_app)
 
 # Vercel sends the full request path (e.g., /api/recommend)
 # but FastAPI routes are defined without /api prefix (e.g., /recommend)
-# This ASGI middleware strips the /api prefix before routing
-class StripApiPrefix:
-    def __init__(self, app):
-        self.app = app
-
-    async def __call__(self, scope, receive, send):
-        if scope["type"] in ("http", "websocket"):
-            path = scope.get("path", "")
-            if path.startswith("/api"):
-                scope = dict(scope)
-                scope["path"] = path[4:] or "/"
-                # Also update raw_path if present
-                raw_path = scope.get("raw_path")
-                if raw_path and raw_path.startswith(b"/api"):
-                    scope["raw_path"] = raw_path[4:] or b"/"
-        await self.app(scope, receive, send)
-
-app = StripApiPrefix(backend_app)
+app = StripPrefixMiddleware(
+    PrefixDispatcher(
+        {prefix: _lazy_router(path) for prefix, path in LIGHT_ROUTERS.items()},
+        default=backend_app,
+    ),
+    prefix="/api",
+)
@@ -1,16 +1,13 @@
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+import asyncio
+import csv
+from functools import lru_cache
+import io
+import json
 import os
-from fastapi import FastAPI, Depends, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from database import get_session, engine, create_db_and_tables
-from db_models.university import University
-from db_models.scholarship import Scholarship
-from sqlmodel import select
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from database import init_database
 UNIVERSITIES = [
     # 🇫🇷 FRANCE
     {"university":"Sorbonne University","country":"France","city":"Paris","ranking":60,"min_gpa":3.2,"min_ielts":6.5,"average_fees_eur":8000,"field":"Engineering (Mechanical, Electrical, Quantum)"},
@@ -77,15 +74,38 @@ UNIVERSITIES = [
 ]
 
 
-from modules.admission_prediction import predict_admission
+from modules.admission_prediction import (
+    predict_admission,
+    predict_admission_batch,
+    predict_admission_rows,
+    CHANCE_LEVELS,
+    CHANCE_MESSAGES
+)
+from modules.model_registry import admission_model_registry
+from modules.field_taxonomy import normalize_field, field_categories
+from modules.search_index import (
+    SearchIndex,
+    UNIVERSITY_SEARCH_FIELDS,
+    get_scholarship_search,
+    merge_results
+)
 from modules.recommendation_engine import recommend_universities
 from modules.nlp_query_handler import answer_query
 from services.groq_service import groq_service
+from services.catalog_service import CatalogService
+from utils.fast_json import FastJSONResponse, FastJSONRoute
+from utils.asgi_middleware import install_middleware
+from utils.tracing import span
 from modules.cost_roi_analysis import (
     analyze_total_cost, 
     find_affordable_universities, 
     match_scholarships,
-    predict_career_roi
+    predict_career_roi,
+    simulate_career_roi,
+    rank_by_roi,
+    CostRoiMatrix,
+    MAX_SIMULATION_DRAWS,
+    NUMPY_AVAILABLE
 )
 from data_fetcher.fetch_scholarships import (
     fetch_scholarships_by_country,
@@ -98,51 +118,45 @@ from routes.sop_ai import router as sop_ai_router
 from routes.visa_data import router as visa_data_router
 from routes.relocation import router as relocation_router
 from routes.auth import router as auth_router
-from db_models.user import User
+from routes.advanced_analytics import router as analytics_router
+from routes.profiling import router as profiling_router
+from routes.analytics import prediction_router as prediction_analytics_router
+from services.metrics_service import metrics_service
+from utils.logging_service import logger, start_logging, stop_logging
+
+app = FastAPI(default_response_class=FastJSONResponse)
+# Routes without a response_model are encoded by orjson directly (no jsonable_encoder pass)
+app.router.route_class = FastJSONRoute
+
+# Log records are written by a listener thread (utils/logging_service.py);
+# shutdown drains it so nothing queued is lost
+@app.on_event("startup")
+def start_log_listener():
+    start_logging()
+    logger.info("Application startup", extra={"pid": os.getpid()})
 
-app = FastAPI()
+@app.on_event("shutdown")
+def stop_log_listener():
+    logger.info("Application shutdown", extra={"pid": os.getpid()})
+    stop_logging()
 
-# ✅ Database Table Creation
+# ✅ Database Table Creation (skipped when the stored schema/seed version is current)
 @app.on_event("startup")
 def on_startup():
     try:
-        create_db_and_tables()
-        # Seed a demo user for testing on Vercel
-        from sqlmodel import Session as SmSession
-        with SmSession(engine) as session:
-            from utils.auth_utils import get_password_hash
-            demo_user = session.exec(select(User).where(User.username == "demo")).first()
-            if not demo_user:
-                new_user = User(
-                    username="demo",
-                    email="demo@europath.ai",
-                    hashed_password=get_password_hash("demo123"),
-                    full_name="Demo User"
-                )
-                session.add(new_user)
-                session.commit()
+        init_database()
     except Exception as e:
         print(f"Database initialization skipped or failed: {e}")
 
+@app.on_event("startup")
+def warm_admission_model():
+    # Load and validate the admission model before the first request needs it
+    admission_model_registry.load()
+
 
-# ✅ CORS (THIS IS REQUIRED)
-@app.middleware("http")
-async def add_cors_header(request, call_next):
-    response = await call_next(request)
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "*"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
-
-# Standard CORSMiddleware is better, but the user had specific comments. 
-# Re-adding original CORS setup:
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# ✅ Middleware (pure ASGI): timing, CORS (THIS IS REQUIRED) and gzip/brotli for larger
+# JSON bodies (precomputed responses arrive already encoded)
+install_middleware(app)
 
 # ✅ Include Resume Builder Routes (Independent Module)
 app.include_router(resume_router)
@@ -151,6 +165,9 @@ app.include_router(sop_ai_router)
 app.include_router(visa_data_router)
 app.include_router(relocation_router)
 app.include_router(auth_router)
+app.include_router(analytics_router, prefix="/api/v2")
+app.include_router(profiling_router)
+app.include_router(prediction_analytics_router, prefix="/analytics")
 
 from typing import Optional
 
@@ -179,59 +196,113 @@ class ROIPredictRequest(BaseModel):
     country: str
     total_investment: float
     expected_salary: Optional[float] = None
+    simulate: bool = False
+    draws: int = Field(MAX_SIMULATION_DRAWS, ge=1, le=MAX_SIMULATION_DRAWS)
+    seed: Optional[int] = 42
 
 # ---------- Routes ----------
 @app.get("/")
 def root():
     return {"message": "EuroPath AI: Your intelligent guide to Study, SOP, and Visa is running"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    # Prometheus text exposition format
+    return Response(content=metrics_service.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.post("/predict")
 def predict(profile: StudentProfile):
     try:
-        gpa = profile.gpa or 0
-        ielts = profile.ielts or 0
-        budget = profile.budget or 0
-
-        # ---------- Admission Probability Logic ----------
-        score = 0
-
-        # GPA contribution (max 40)
-        score += min(gpa / 4.0, 1) * 40
-
-        # IELTS contribution (max 30)
-        score += min(ielts / 9.0, 1) * 30
-
-        # Budget contribution (max 30)
-        if budget >= 20000:
-            score += 30
-        elif budget >= 12000:
-            score += 20
-        elif budget >= 8000:
-            score += 10
-
-        probability = round(score)
-
-        # ---------- Chance Mapping ----------
-        if probability >= 70:
-            chance = "HIGH"
-            message = "Excellent profile! Strong chance of admission."
-        elif probability >= 40:
-            chance = "MEDIUM"
-            message = "Decent profile. You have a fair chance."
-        else:
-            chance = "LOW"
-            message = "Profile needs improvement to increase chances."
+        # Shared scoring kernel (modules/admission_prediction.py), same as /predict/batch
+        return {
+            "status": "success",
+            **predict_admission(profile)
+        }
+
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
 
+@app.get("/predict/model")
+def admission_model_info():
+    """Version metadata of the admission model currently being served"""
+    try:
         return {
             "status": "success",
-            "chance": chance,
-            "probability": probability,
-            "message": message
+            "model": admission_model_registry.metadata
         }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
 
+
+MAX_BATCH_PROFILES = 100000
+BATCH_CHUNK_ROWS = 1000
+
+def _batch_value(value):
+    if value is None or value == "":
+        return 0.0
+    return float(value)
+
+async def _read_batch_profiles(request: Request):
+    """Parse batch profiles from a JSON body, a raw CSV body or a multipart CSV upload"""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None:
+            raise ValueError("Multipart upload must include a 'file' field")
+        rows = list(csv.DictReader(io.StringIO((await upload.read()).decode("utf-8-sig"))))
+    elif "csv" in content_type:
+        rows = list(csv.DictReader(io.StringIO((await request.body()).decode("utf-8-sig"))))
+    else:
+        payload = json.loads(await request.body() or b"[]")
+        rows = payload.get("profiles", []) if isinstance(payload, dict) else payload
+        if not isinstance(rows, list):
+            raise ValueError("Expected a list of profiles or {'profiles': [...]}")
+    return rows
+
+@app.post("/predict/batch")
+async def predict_batch(request: Request):
+    """
+    Score many profiles at once (JSON list, {"profiles": [...]}, or CSV with
+    gpa/ielts/budget columns) using the same kernel as /predict. Results stream back as NDJSON, one line per
+    profile in input order; an optional "id" field is echoed back.
+    """
+    try:
+        rows = await _read_batch_profiles(request)
+        if len(rows) > MAX_BATCH_PROFILES:
+            raise ValueError(f"Batch too large: {len(rows)} profiles (max {MAX_BATCH_PROFILES})")
+
+        count = len(rows)
+        gpa = [_batch_value(r.get("gpa")) for r in rows]
+        ielts = [_batch_value(r.get("ielts")) for r in rows]
+        budget = [_batch_value(r.get("budget")) for r in rows]
+        ids = [r.get("id") for r in rows]
+
+        if NUMPY_AVAILABLE:
+            probability, chance_index = predict_admission_batch(gpa, ielts, budget)
+            probability, chance_index = probability.tolist(), chance_index.tolist()
+        else:
+            # The Vercel function ships without NumPy: same kernel, one row at a time
+            probability, chance_index = predict_admission_rows(gpa, ielts, budget)
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+    def generate():
+        for start in range(0, count, BATCH_CHUNK_ROWS):
+            lines = []
+            for i in range(start, min(start + BATCH_CHUNK_ROWS, count)):
+                record = {
+                    "index": i,
+                    "chance": CHANCE_LEVELS[chance_index[i]],
+                    "probability": probability[i],
+                    "message": CHANCE_MESSAGES[chance_index[i]]
+                }
+                if ids[i] is not None:
+                    record["id"] = ids[i]
+                lines.append(json.dumps(record))
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.post("/recommend")
@@ -247,126 +318,136 @@ async def recommend(profile: StudentProfile):
         target_field = (profile.field or "").strip().lower()
 
         # Step 1: Filter by Country and basic Field check (Broad)
-        broad_matches = []
-        for uni in all_universities:
-            uni_country = str(uni.get("country", "")).lower()
-            
-            # Use lower() and strip() for robust comparison
-            tc = target_country.lower().strip() if target_country else ""
-            
-            if tc and tc not in ["all", "all europe", "select country", "all fields"]:
-                if tc != uni_country:
+        with span("recommend.broad_filter", universities=len(all_universities)) as stage:
+            broad_matches = []
+            for uni in all_universities:
+                uni_country = str(uni.get("country", "")).lower()
+
+                # Use lower() and strip() for robust comparison
+                tc = target_country.lower().strip() if target_country else ""
+
+                if tc and tc not in ["all", "all europe", "select country", "all fields"]:
+                    if tc != uni_country:
+                        continue
+
+                # Academic filter (don't block if fields are empty)
+                min_gpa = float(uni.get("min_gpa", 0))
+                if gpa > 0 and (gpa < min_gpa - 0.5): # Generous 0.5 grace margin
+                    continue
+
+                # Budget filter
+                max_fees = float(uni.get("average_fees_eur", 0))
+                if budget > 0 and max_fees > budget * 1.5: # 50% over budget margin
                     continue
-            
-            # Academic filter (don't block if fields are empty)
-            min_gpa = float(uni.get("min_gpa", 0))
-            if gpa > 0 and (gpa < min_gpa - 0.5): # Generous 0.5 grace margin
-                continue
-            
-            # Budget filter
-            max_fees = float(uni.get("average_fees_eur", 0))
-            if budget > 0 and max_fees > budget * 1.5: # 50% over budget margin
-                continue
 
-            broad_matches.append(uni)
+                broad_matches.append(uni)
+            stage.set_attribute("matches", len(broad_matches))
 
         # Step 2: Semantic Matching with Groq
         if groq_service.client and broad_matches and target_field not in ["all", "all fields", "select field of study", ""]:
             # Prepare a list of universities for the LLM to evaluate
-            candidates = list(broad_matches)[:15]
-            uni_context = "\n".join([
-                f"- {u['university']} ({u['country']}): Offers {u['field']}. Min GPA: {u['min_gpa']}, Fees: {u['average_fees_eur']} EUR."
-                for u in candidates
-            ])
-
-            prompt = (
-                f"Student Field of Interest: '{target_field}'\n"
-                f"Student Specialization: '{profile.specialization}'\n"
-                f"Student Profile: GPA {gpa}, IELTS {ielts}, Budget {budget} EUR.\n\n"
-                f"Candidate Universities:\n{uni_context}\n\n"
-                f"TASK:\n"
-                f"1. Select up to 5 universities that BEST match the student's field.\n"
-                f"2. CRITICAL: If the student wants 'Computer Science' or 'AI', prioritize programs that explicitly list 'CS', 'AI', 'Data Science', or 'Software Engineering'.\n"
-                f"3. AVOID MISMATCH: Do not select 'General Engineering' or 'Business' programs if specialized CS/AI programs are present in the list.\n"
-                f"4. Return the selections as a JSON array of objects with 'university', 'match_score' (0.0 to 1.0), and 'reason'."
-            )
+            with span("recommend.build_prompt", candidates=min(len(broad_matches), 15)):
+                candidates = list(broad_matches)[:15]
+                uni_context = "\n".join([
+                    f"- {u['university']} ({u['country']}): Offers {u['field']}. Min GPA: {u['min_gpa']}, Fees: {u['average_fees_eur']} EUR."
+                    for u in candidates
+                ])
+
+                prompt = (
+                    f"Student Field of Interest: '{target_field}'\n"
+                    f"Student Specialization: '{profile.specialization}'\n"
+                    f"Student Profile: GPA {gpa}, IELTS {ielts}, Budget {budget} EUR.\n\n"
+                    f"Candidate Universities:\n{uni_context}\n\n"
+                    f"TASK:\n"
+                    f"1. Select up to 5 universities that BEST match the student's field.\n"
+                    f"2. CRITICAL: If the student wants 'Computer Science' or 'AI', prioritize programs that explicitly list 'CS', 'AI', 'Data Science', or 'Software Engineering'.\n"
+                    f"3. AVOID MISMATCH: Do not select 'General Engineering' or 'Business' programs if specialized CS/AI programs are present in the list.\n"
+                    f"4. Return the selections as a JSON array of objects with 'university', 'match_score' (0.0 to 1.0), and 'reason'."
+                )
 
-            system_prompt = (
-                "You are the EuroPath AI Matching Engine. You specialize in European university admissions. "
-                "Your priority is academic relevance. Only match students to programs they actually want to study. "
-                "Return valid JSON only."
-            )
+                system_prompt = (
+                    "You are the EuroPath AI Matching Engine. You specialize in European university admissions. "
+                    "Your priority is academic relevance. Only match students to programs they actually want to study. "
+                    "Return valid JSON only."
+                )
 
-            import json
             raw_ai_response = await groq_service.generate_response(prompt, system_prompt)
             
             try:
-                # Extract JSON safely
-                content = raw_ai_response.strip()
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                ai_selections = json.loads(content)
-                
-                final_results = []
-                for selection in ai_selections:
-                    orig = next((u for u in candidates if u['university'] == selection['university']), None)
-                    if orig:
-                        final_results.append({
-                            **orig,
-                            "match_score": selection['match_score'],
-                            "note": selection.get('reason', 'Semantic Match')
-                        })
-                
-                if final_results:
-                    return {
-                        "status": "success",
-                        "engine": "Groq Semantic Engine",
-                        "recommendations": final_results,
-                        "total": len(final_results)
-                    }
+                with span("recommend.parse_llm_response", response_chars=len(raw_ai_response or "")):
+                    # Extract JSON safely
+                    content = raw_ai_response.strip()
+                    if "```json" in content:
+                        content = content.split("```json")[1].split("```")[0].strip()
+                    elif "```" in content:
+                        content = content.split("```")[1].split("```")[0].strip()
+
+                    ai_selections = json.loads(content)
+
+                    final_results = []
+                    for selection in ai_selections:
+                        orig = next((u for u in candidates if u['university'] == selection['university']), None)
+                        if orig:
+                            final_results.append({
+                                **orig,
+                                "match_score": selection['match_score'],
+                                "note": selection.get('reason', 'Semantic Match')
+                            })
+
+                    if final_results:
+                        return {
+                            "status": "success",
+                            "engine": "Groq Semantic Engine",
+                            "recommendations": final_results,
+                            "total": len(final_results)
+                        }
             except Exception as e:
                 print(f"Groq parsing error: {e}")
 
         # Fallback to Rule-Based (Lenient Match)
-        results = []
-        import re
-        
-        # Normalize target field keywords
-        target_keywords = [kw.lower() for kw in re.findall(r'\w+', target_field) if len(kw) > 3] if target_field else []
-        
-        for uni in broad_matches:
-            uni_field = str(uni.get("field", "")).lower()
-            
-            # If target keywords match OR if it's a generally broad related field
-            is_match = False
-            if not target_keywords or target_field.lower() in ["all", "all fields", ""]:
-                is_match = True
-            else:
-                # Check keyword overlap
-                if any(kw in uni_field for kw in target_keywords):
+        with span("recommend.rule_fallback", candidates=len(broad_matches)):
+            results = []
+            import re
+
+            # Normalize target field keywords
+            target_keywords = [kw.lower() for kw in re.findall(r'\w+', target_field) if len(kw) > 3] if target_field else []
+            # normalize_field falls back to "Engineering" for unrecognized text, so
+            # only use the category when the target field names a known one
+            target_category = normalize_field(target_field) if field_categories(target_field) else None
+
+            for uni in broad_matches:
+                uni_field = str(uni.get("field", "")).lower()
+
+                # If target keywords match OR if it's a generally broad related field
+                is_match = False
+                if not target_keywords or target_field.lower() in ["all", "all fields", ""]:
                     is_match = True
-                # Semantic logic: CS/AI often found in Engineering departments
-                elif ("computer" in target_field.lower() or "ai" in target_field.lower()) and "engineering" in uni_field:
-                    is_match = True
-            
-            if is_match:
-                results.append({
-                    **uni,
-                    "match_score": 0.6,
-                    "note": "Broad Interest Match"
-                })
-
-        # If still no results, return top 3 in the selected country as general options
-        if not results and broad_matches:
-            for uni in broad_matches[:3]:
-                results.append({
-                    **uni,
-                    "match_score": 0.4,
-                    "note": "General Country Option"
-                })
+                else:
+                    # Check keyword overlap
+                    if any(kw in uni_field for kw in target_keywords):
+                        is_match = True
+                    # Same field category (e.g. "Artificial Intelligence" vs "AI, CS")
+                    elif target_category and target_category in field_categories(uni_field):
+                        is_match = True
+                    # Semantic logic: CS/AI often found in Engineering departments
+                    elif ("computer" in target_field.lower() or "ai" in target_field.lower()) and "engineering" in uni_field:
+                        is_match = True
+
+                if is_match:
+                    results.append({
+                        **uni,
+                        "match_score": 0.6,
+                        "note": "Broad Interest Match"
+                    })
+
+            # If still no results, return top 3 in the selected country as general options
+            if not results and broad_matches:
+                for uni in broad_matches[:3]:
+                    results.append({
+                        **uni,
+                        "match_score": 0.4,
+                        "note": "General Country Option"
+                    })
 
         results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
         return {
@@ -403,7 +484,7 @@ def cost_analysis(request: CostAnalysisRequest):
 @app.post("/find-affordable")
 def find_affordable(profile: StudentProfile):
     try:
-        affordable_unis = find_affordable_universities(profile, profile.budget)
+        affordable_unis = find_affordable_universities(profile.budget)
         return {
             "status": "success",
             "affordable_analysis": affordable_unis
@@ -431,6 +512,15 @@ def get_roi_prediction(request: ROIPredictRequest):
             request.total_investment,
             request.expected_salary
         )
+        if request.simulate:
+            prediction["simulation"] = simulate_career_roi(
+                request.field,
+                request.country,
+                request.total_investment,
+                request.expected_salary,
+                draws=request.draws,
+                seed=request.seed
+            )
         return {
             "status": "success",
             "roi_prediction": prediction
@@ -438,14 +528,148 @@ def get_roi_prediction(request: ROIPredictRequest):
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+@app.post("/full-analysis")
+async def full_analysis(profile: StudentProfile, duration_years: int = 2):
+    """
+    Recommendations enriched with cost, ROI and scholarship data in one response.
+    The in-memory scholarship lookups run while the recommendation waits on the LLM.
+    """
+    try:
+        profile_country = (profile.country or "").strip().title()
+
+        # Start /recommend and let it run up to its first await (the LLM call,
+        # which GroqService keeps off the event loop); the scholarship index
+        # lookup below then overlaps with that wait instead of following it
+        recommendation_task = asyncio.create_task(recommend(profile))
+        await asyncio.sleep(0)
+        scholarships_by_country = {profile_country: match_scholarships(profile, profile_country)} if profile_country else {}
+
+        recommendation_result = await recommendation_task
+        if recommendation_result.get("status") != "success":
+            return recommendation_result
+
+        # Cost/ROI and the remaining countries' scholarships are cheap table and
+        # index lookups: computed inline, a thread hop per item would cost more
+        recommendations = recommendation_result["recommendations"]
+        enriched = []
+        for uni in recommendations:
+            cost = analyze_total_cost(float(uni.get("average_fees_eur") or 0), uni.get("country"), duration_years)
+            roi = predict_career_roi(
+                profile.field or uni.get("field", ""),
+                uni.get("country"),
+                cost["total_combined_cost"]
+            )
+            enriched.append({**uni, "cost_analysis": cost, "roi_prediction": roi})
+
+        extra_countries = sorted({
+            uni["country"] for uni in recommendations
+            if uni.get("country") and uni["country"] not in scholarships_by_country
+        })
+        for country in extra_countries:
+            scholarships_by_country[country] = match_scholarships(profile, country)
+
+        return {
+            "status": "success",
+            "engine": recommendation_result.get("engine"),
+            "recommendations": enriched,
+            "total": recommendation_result.get("total", len(enriched)),
+            "scholarships": scholarships_by_country,
+            "duration_years": duration_years
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@lru_cache(maxsize=1)
+def university_roi_matrix():
+    """Catalog-wide cost/ROI arrays, built on the first /best-roi call (None without numpy)"""
+    return CostRoiMatrix(UNIVERSITIES) if NUMPY_AVAILABLE else None
+
+@app.post("/best-roi")
+def best_roi(profile: StudentProfile, duration_years: int = 2, limit: int = 10):
+    """Catalog universities sorted by fastest break-even for the student's field"""
+    try:
+        target_country = (profile.country or "").strip()
+        if target_country.lower() in ["all", "all europe", "select country"]:
+            target_country = ""
+
+        options = dict(
+            field=profile.field,
+            duration_years=duration_years,
+            country=target_country or None,
+            max_fees=profile.budget or None,
+            limit=limit
+        )
+        matrix = university_roi_matrix()
+        ranked = matrix.rank_by_roi(**options) if matrix is not None else rank_by_roi(UNIVERSITIES, **options)
+        return {
+            "status": "success",
+            "universities": ranked,
+            "total": len(ranked)
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+UNIVERSITY_CATALOG = CatalogService(UNIVERSITIES, "universities")
+
 @app.get("/universities")
-def get_all_universities():
+def get_all_universities(
+    request: Request,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    University catalog with optional offset/cursor pagination and a
+    fields= projection. Pages are pre-serialized per catalog version and
+    carry a strong ETag; If-None-Match revalidation returns 304.
+    """
+    try:
+        return UNIVERSITY_CATALOG.page(offset, limit, cursor, fields).to_response(request)
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+# ========== Catalog Search ==========
+
+UNIVERSITY_SEARCH = SearchIndex(UNIVERSITIES, UNIVERSITY_SEARCH_FIELDS, "university")
+MAX_SEARCH_RESULTS = 50
+
+def _search_indexes(type: str):
+    indexes = []
+    if type in ("all", "universities"):
+        indexes.append(UNIVERSITY_SEARCH)
+    if type in ("all", "scholarships"):
+        indexes.append(get_scholarship_search())
+    if not indexes:
+        raise ValueError("type must be one of: all, universities, scholarships")
+    return indexes
+
+@app.get("/search")
+def search_catalog(q: str, type: str = "all", k: int = 10):
+    """Typo-tolerant search over universities and scholarships (top-k)"""
+    try:
+        k = max(1, min(k, MAX_SEARCH_RESULTS))
+        results = merge_results([index.search(q, k) for index in _search_indexes(type)], k)
+        return {
+            "status": "success",
+            "query": q,
+            "results": results,
+            "total": len(results)
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@app.get("/search/autocomplete")
+def autocomplete_catalog(q: str, type: str = "all", k: int = 8):
+    """Prefix suggestions for search-as-you-type"""
     try:
-        # Use hardcoded list for Vercel stability
+        k = max(1, min(k, MAX_SEARCH_RESULTS))
+        suggestions = merge_results([index.autocomplete(q, k) for index in _search_indexes(type)], k)
         return {
             "status": "success",
-            "universities": UNIVERSITIES,
-            "total": len(UNIVERSITIES)
+            "query": q,
+            "suggestions": [{"type": s["type"], "text": s["text"]} for s in suggestions],
+            "total": len(suggestions)
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -498,14 +722,26 @@ def scholarships_statistics():
         return {"status": "error", "message": str(e)}
 
 @app.get("/scholarships-filter")
-def filter_scholarships(country: str = None, coverage: str = None, min_amount: float = None, max_amount: float = None):
-    """Advanced scholarship filtering using CSV logic"""
+def filter_scholarships(country: str = None, coverage: str = None, min_amount: float = None,
+                        max_amount: float = None, eligibility: str = None):
+    """
+    Advanced scholarship filtering over the in-memory scholarship index.
+    Every filter is optional and they combine with AND (no filters: all
+    scholarships); country and coverage match case-insensitively, and each
+    eligibility word matches eligibility words it prefixes ("merit" -> "Merit-based").
+    """
     try:
-        from modules.cost_roi_analysis import match_scholarships
-        # Simple country/coverage filtering from CSV
-        all_scholarships = match_scholarships(None, country) if country else []
-        # If no country, we'd ideally load all, but for now we match by country
-        
+        from data_fetcher.scholarship_index import get_scholarship_index
+        from modules.cost_roi_analysis import format_scholarship
+        matches = get_scholarship_index().query(
+            country=country,
+            coverage=coverage,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            eligibility=eligibility
+        )
+        all_scholarships = [format_scholarship(row) for row in matches]
+
         return {
             "status": "success",
             "scholarships": all_scholarships,
@@ -514,9 +750,9 @@ def filter_scholarships(country: str = None, coverage: str = None, min_amount: f
                 "country": country,
                 "coverage": coverage,
                 "min_amount": min_amount,
-                "max_amount": max_amount
+                "max_amount": max_amount,
+                "eligibility": eligibility
             }
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
-
@@ -0,0 +1,128 @@
+"""
+Admission scoring benchmark
+Compares the shared scoring kernel (scalar and batch) with the two
+implementations it replaced: the inline /predict scoring in app.py
+(40/30/30 with budget steps) and the original predict_admission (45/35/20).
+
+Usage (from backend/):
+    python benchmarks/bench_admission_kernel.py --profiles 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from modules.admission_prediction import predict_admission, predict_admission_batch
+
+
+def legacy_endpoint_predict(profile):
+    """The scoring /predict used to inline in app.py"""
+    gpa = profile.gpa or 0
+    ielts = profile.ielts or 0
+    budget = profile.budget or 0
+
+    score = 0
+    score += min(gpa / 4.0, 1) * 40
+    score += min(ielts / 9.0, 1) * 30
+    if budget >= 20000:
+        score += 30
+    elif budget >= 12000:
+        score += 20
+    elif budget >= 8000:
+        score += 10
+
+    probability = round(score)
+    if probability >= 70:
+        chance, message = "HIGH", "Excellent profile! Strong chance of admission."
+    elif probability >= 40:
+        chance, message = "MEDIUM", "Decent profile. You have a fair chance."
+    else:
+        chance, message = "LOW", "Profile needs improvement to increase chances."
+    return {"chance": chance, "probability": probability, "message": message}
+
+
+def legacy_module_predict(profile):
+    """The original hard-coded predict_admission"""
+    gpa = profile.gpa or 0
+    ielts = profile.ielts or 0
+    budget = profile.budget or 0
+
+    final_score = (
+        min(gpa / 4.0, 1.0) * 0.45 +
+        min(ielts / 9.0, 1.0) * 0.35 +
+        min(budget / 20000, 1.0) * 0.20
+    )
+    probability = round(final_score * 100)
+    if final_score >= 0.75:
+        chance, message = "HIGH", "Excellent profile! Strong chances of admission."
+    elif final_score >= 0.5:
+        chance, message = "MEDIUM", "Good profile. You have fair chances of admission."
+    else:
+        chance, message = "LOW", "Profile needs improvement to increase admission chances."
+    return {"chance": chance, "probability": probability, "message": message}
+
+
+def generate_profiles(n, seed=42):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            gpa=round(rng.uniform(2.0, 4.0), 2),
+            ielts=rng.choice([None, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0]),
+            budget=rng.choice([0, 5000, 8000, 12000, 15000, 20000, 35000]),
+        )
+        for _ in range(n)
+    ]
+
+
+def time_scalar(fn, profiles):
+    start = time.perf_counter()
+    for p in profiles:
+        fn(p)
+    return time.perf_counter() - start
+
+
+def time_batch(profiles):
+    start = time.perf_counter()
+    predict_admission_batch(
+        [p.gpa or 0 for p in profiles],
+        [p.ielts or 0 for p in profiles],
+        [p.budget or 0 for p in profiles],
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark admission scoring implementations")
+    parser.add_argument("--profiles", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.profiles)
+    predict_admission(profiles[0])  # warm the model registry
+
+    cases = [
+        ("legacy /predict inline", lambda: time_scalar(legacy_endpoint_predict, profiles)),
+        ("legacy predict_admission", lambda: time_scalar(legacy_module_predict, profiles)),
+        ("kernel scalar", lambda: time_scalar(predict_admission, profiles)),
+        ("kernel batch", lambda: time_batch(profiles)),
+    ]
+
+    print(f"{'implementation':<28}{'total ms':>12}{'us/profile':>14}")
+    for name, run in cases:
+        best = min(run() for _ in range(args.repeat))
+        print(f"{name:<28}{best * 1000:>12.2f}{best / len(profiles) * 1e6:>14.3f}")
+
+    agree = sum(predict_admission(p) == legacy_module_predict(p) for p in profiles)
+    print(f"\nKernel agrees with legacy predict_admission on {agree}/{len(profiles)} profiles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Core API benchmark
+Drives the real app in-process (httpx ASGI transport, no sockets) against a
+synthetic catalog and profile workload (scripts/generate_synthetic_data.py),
+and reports throughput and p50/p95/p99 latency per endpoint:
+
+    POST /predict, POST /recommend, POST /find-affordable,
+    GET /scholarships-filter, POST /query
+
+Groq is replaced by the deterministic FakeLLMBackend (services/llm_backends.py,
+fixed latency by default), so /recommend and /query exercise the semantic path
+without network access.
+Everything is seeded, so two runs with the same arguments send the same
+requests; the JSON report records the commit and the arguments so reports can
+be compared across commits.
+
+Usage (from backend/):
+    python benchmarks/bench_api.py --universities 10000 --scholarships 10000
+    python benchmarks/bench_api.py --universities 1000000 --requests 200 --endpoints predict,recommend
+    python benchmarks/bench_api.py --concurrency 16 --groq-latency-ms 300 --output bench_api.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+import httpx
+
+from scripts.generate_synthetic_data import (
+    COVERAGES as COVERAGE_WEIGHTS,
+    SCHOLARSHIP_COLUMNS,
+    UNIVERSITY_COLUMNS,
+    generate_profiles,
+    generate_scholarships,
+    generate_universities,
+    read_universities,
+    write_csv,
+)
+
+ENDPOINTS = ("predict", "recommend", "find-affordable", "scholarships-filter", "query")
+
+COVERAGES = tuple(COVERAGE_WEIGHTS)
+QUERY_TOPICS = ("visa", "living costs", "scholarships", "ielts", "universities")
+
+
+def request_for(endpoint, profile, rng):
+    if endpoint == "scholarships-filter":
+        params = {"country": profile["country"], "coverage": rng.choice(COVERAGES), "min_amount": 5000}
+        return "GET", "/scholarships-filter", {"params": params}
+    if endpoint == "query":
+        topic = rng.choice(QUERY_TOPICS)
+        return "POST", "/query", {"json": {"query": f"What about {topic} in {profile['country']}?"}}
+    return "POST", f"/{endpoint}", {"json": profile}
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values), math.ceil(q / 100 * len(sorted_values))) - 1)
+    return sorted_values[index]
+
+
+async def run_endpoint(client, endpoint, profiles, requests, concurrency, warmup, seed):
+    rng = random.Random(f"{seed}:{endpoint}")
+    plan = [request_for(endpoint, profiles[i % len(profiles)], rng) for i in range(warmup + requests)]
+    for method, path, kwargs in plan[:warmup]:
+        await client.request(method, path, **kwargs)
+
+    latencies, errors = [], 0
+    queue = iter(plan[warmup:])
+
+    async def worker():
+        nonlocal errors
+        for method, path, kwargs in queue:
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200 or response.json().get("status") == "error":
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "requests": len(ms),
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(len(ms) / wall, 1) if wall else None,
+        "mean_ms": round(sum(ms) / len(ms), 3) if ms else None,
+        "p50_ms": round(percentile(ms, 50), 3) if ms else None,
+        "p95_ms": round(percentile(ms, 95), 3) if ms else None,
+        "p99_ms": round(percentile(ms, 99), 3) if ms else None,
+        "max_ms": round(ms[-1], 3) if ms else None,
+    }
+
+
+def git_revision():
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=backend_dir,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=backend_dir,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return revision, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+async def run(args, app, profiles):
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for endpoint in args.endpoints:
+            results[endpoint] = await run_endpoint(
+                client, endpoint, profiles, args.requests, args.concurrency, args.warmup, args.seed)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the core API endpoints in-process")
+    parser.add_argument("--universities", type=int, default=1000, help="Synthetic catalog size")
+    parser.add_argument("--scholarships", type=int, default=1000)
+    parser.add_argument("--profiles", type=int, default=500, help="Distinct student profiles in the workload")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--groq-latency-ms", type=float, default=0.0, help="Median latency of the fake LLM call")
+    parser.add_argument("--groq-latency-sigma", type=float, default=0.0, help="Log-normal spread (0 = fixed)")
+    parser.add_argument("--groq-error-rate", type=float, default=0.0, help="Fraction of fake LLM calls that fail")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout)")
+    args = parser.parse_args()
+    args.endpoints = [e.strip().lstrip("/") for e in args.endpoints.split(",") if e.strip()]
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+
+    output = os.path.abspath(args.output) if args.output else None
+    with tempfile.TemporaryDirectory(prefix="bench_api_") as workdir:
+        cwd = os.getcwd()
+        try:
+            results = benchmark(args, workdir)
+        finally:
+            os.chdir(cwd)
+
+    revision, dirty = git_revision()
+    report = {
+        "benchmark": "core_api",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": {"revision": revision, "dirty": dirty},
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+        "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": results,
+    }
+
+    print(f"{'endpoint':<22}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}", file=sys.stderr)
+    for endpoint, r in results.items():
+        print(f"{endpoint:<22}{r['throughput_rps']:>10}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}"
+              f"{r['errors']:>8}", file=sys.stderr)
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def benchmark(args, workdir):
+    os.makedirs(os.path.join(workdir, "data"))
+    universities_csv = os.path.join(workdir, "data", "universities.csv")
+    scholarships_csv = os.path.join(workdir, "data", "scholarships.csv")
+    write_csv(universities_csv, generate_universities(args.universities, args.seed), UNIVERSITY_COLUMNS)
+    write_csv(scholarships_csv, generate_scholarships(args.scholarships, args.seed), SCHOLARSHIP_COLUMNS)
+    profiles = list(generate_profiles(args.profiles, args.seed))
+
+    import app as app_module
+    from data_fetcher import scholarship_index
+    from services.groq_service import groq_service
+    from services.llm_backends import FakeLLMBackend
+
+    # Point every data source at the synthetic catalog: /recommend filters
+    # app.UNIVERSITIES, /find-affordable reads data/universities.csv relative
+    # to the working directory, /scholarships-filter uses the scholarship index
+    app_module.UNIVERSITIES = read_universities(universities_csv)
+    scholarship_index.SCHOLARSHIPS_CSV = scholarships_csv
+    groq_service.use_backend(FakeLLMBackend(
+        latency_ms=args.groq_latency_ms, latency_sigma=args.groq_latency_sigma, tokens_per_second=0,
+        error_rate=args.groq_error_rate, seed=args.seed,
+    ))
+    os.chdir(workdir)
+
+    # The app prints debug lines per request; keep them out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return asyncio.run(run(args, app_module.app, profiles))
+
+
+if __name__ == "__main__":
+    main()
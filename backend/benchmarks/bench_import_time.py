@@ -0,0 +1,134 @@
+"""
+Cold-start import benchmark
+Runs the serverless entry point (api/index.py) in fresh interpreters with
+`-X importtime` and reports:
+
+- the import-time breakdown by top-level package (self and cumulative ms)
+- the cost of a first request per route, and which heavy dependencies that
+  request pulled in (e.g. /visa/countries should load neither pandas nor groq)
+
+Usage (from backend/):
+    python benchmarks/bench_import_time.py --top 15 --runs 3
+    python benchmarks/bench_import_time.py --json import_time.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+api_dir = os.path.join(os.path.dirname(backend_dir), "api")
+
+HEAVY_MODULES = ("pandas", "numpy", "groq", "sqlalchemy", "sqlmodel", "bcrypt", "app")
+FIRST_REQUEST_PATHS = ("/api/visa/countries", "/api/api/relocation/supported-countries", "/api/universities?limit=1")
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+FIRST_REQUEST_SCRIPT = """
+import asyncio, json, sys, time
+sys.path.insert(0, {api_dir!r})
+start = time.perf_counter()
+import index
+imported = time.perf_counter()
+path, _, query = {path!r}.partition("?")
+scope = {{"type": "http", "asgi": {{"version": "3.0"}}, "http_version": "1.1", "method": "GET",
+         "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+         "root_path": "", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80)}}
+status = []
+async def receive():
+    return {{"type": "http.request", "body": b"", "more_body": False}}
+async def send(message):
+    if message["type"] == "http.response.start":
+        status.append(message["status"])
+asyncio.run(index.app(scope, receive, send))
+done = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (done - imported) * 1000,
+    "status": status[0],
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def import_profile(runs: int):
+    """{package: (self_ms, cumulative_ms)} for top-level imports of api/index.py"""
+    samples = defaultdict(lambda: ([], []))
+    totals = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {api_dir!r}); import index"],
+            cwd=backend_dir, capture_output=True, text=True, check=True,
+        )
+        self_by_root = defaultdict(int)
+        cumulative_by_root = defaultdict(int)
+        for line in result.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if not match:
+                continue
+            self_us, cumulative_us, _, name = match.groups()
+            root = name.split(".")[0]
+            self_by_root[root] += int(self_us)
+            if name == root:  # the package itself, including everything it imports
+                cumulative_by_root[root] = max(cumulative_by_root[root], int(cumulative_us))
+            if name == "index":
+                totals.append(int(cumulative_us) / 1000)
+        for root in self_by_root:
+            samples[root][0].append(self_by_root[root] / 1000)
+            samples[root][1].append(cumulative_by_root.get(root, 0) / 1000)
+    profile = {root: (statistics.median(s), statistics.median(c)) for root, (s, c) in samples.items()}
+    return statistics.median(totals) if totals else None, profile
+
+
+def first_request(path: str, runs: int):
+    results = []
+    for _ in range(runs):
+        script = FIRST_REQUEST_SCRIPT.format(api_dir=api_dir, path=path, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, "-c", script], cwd=backend_dir,
+                                capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "import_ms": statistics.median(r["import_ms"] for r in results),
+        "first_request_ms": statistics.median(r["first_request_ms"] for r in results),
+        "status": results[-1]["status"],
+        "loaded": results[-1]["loaded"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile serverless cold-start imports")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per measurement (median reported)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    total_ms, profile = import_profile(args.runs)
+    print(f"import index (api/index.py): {total_ms:.1f} ms")
+    print(f"{'package':<28}{'self ms':>10}{'cumulative ms':>15}")
+    ranked = sorted(profile.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for root, (self_ms, cumulative_ms) in ranked:
+        print(f"{root:<28}{self_ms:>10.1f}{cumulative_ms:>15.1f}")
+
+    print()
+    print(f"{'first request':<44}{'status':>7}{'import ms':>11}{'request ms':>12}  heavy modules loaded")
+    requests = {}
+    for path in FIRST_REQUEST_PATHS:
+        result = requests[path] = first_request(path, args.runs)
+        print(f"{path:<44}{result['status']:>7}{result['import_ms']:>11.1f}{result['first_request_ms']:>12.1f}  "
+              f"{', '.join(result['loaded']) or '-'}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "entry_import_ms": total_ms,
+                "packages": {root: {"self_ms": s, "cumulative_ms": c} for root, (s, c) in ranked},
+                "first_request": requests,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
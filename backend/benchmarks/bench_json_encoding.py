@@ -0,0 +1,74 @@
+"""
+JSON encoding benchmark
+Per-endpoint encode time for representative response payloads, comparing
+FastAPI's default path (jsonable_encoder + stdlib json via JSONResponse)
+with the orjson fast path used by FastJSONRoute.
+
+Usage (from backend/):
+    python benchmarks/bench_json_encoding.py --repeat 200 --scale 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app import UNIVERSITIES, UNIVERSITY_SEARCH, StudentProfile, university_roi_matrix
+from data_fetcher.fetch_scholarships import fetch_all_scholarships
+from modules.recommendation_engine import recommend_universities
+from utils.fast_json import dumps, orjson
+
+
+def build_payloads(scale: int):
+    """Response bodies shaped like the real endpoints, lists repeated `scale` times"""
+    profile = StudentProfile(gpa=3.4, ielts=7.0, budget=15000, country="Germany", field="Computer Science")
+    scholarships = fetch_all_scholarships()
+    return {
+        "/universities": {"status": "success", "universities": UNIVERSITIES * scale, "total": len(UNIVERSITIES) * scale},
+        "/scholarships-list": {"status": "success", "scholarships": scholarships * scale, "total": len(scholarships) * scale},
+        "/recommend": {"status": "success", "recommendations": recommend_universities(profile) * scale},
+        "/best-roi": {"status": "success", "universities": university_roi_matrix().rank_by_roi("Computer Science", 2) * scale},
+        "/search": {"status": "success", "results": UNIVERSITY_SEARCH.search("technical university", 50) * scale},
+    }
+
+
+def legacy_encode(payload):
+    """What FastAPI does for a plain dict without a response_model"""
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def time_per_call(fn, payload, repeat: int) -> float:
+    fn(payload)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(payload)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response JSON encoding")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--scale", type=int, default=1, help="Repeat each record list N times")
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if orjson else 'no (stdlib fallback)'}   repeat={args.repeat} scale={args.scale}")
+    print(f"{'endpoint':<20}{'bytes':>10}{'legacy ms':>12}{'fast ms':>10}{'speedup':>9}")
+    for endpoint, payload in build_payloads(args.scale).items():
+        legacy_body = legacy_encode(payload)
+        fast_body = dumps(payload)
+        assert legacy_body == fast_body, f"{endpoint}: encoded bodies differ"
+        legacy_ms = time_per_call(legacy_encode, payload, args.repeat)
+        fast_ms = time_per_call(dumps, payload, args.repeat)
+        print(f"{endpoint:<20}{len(fast_body):>10}{legacy_ms:>12.3f}{fast_ms:>10.3f}{legacy_ms / fast_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
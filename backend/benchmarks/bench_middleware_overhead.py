@@ -0,0 +1,117 @@
+"""
+Middleware overhead benchmark
+Per-request cost of the old CORS setup (@app.middleware("http") header
+rewrite + Starlette CORSMiddleware) against the pure ASGI stack in
+utils/asgi_middleware.py, measured in-process on a trivial JSON route so the
+middleware dominates.
+
+Usage (from backend/):
+    python benchmarks/bench_middleware_overhead.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+
+from utils.asgi_middleware import CORSMiddleware, StripPrefixMiddleware, TimingMiddleware
+
+
+def build_app():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "success"}
+
+    return app
+
+
+def bare_stack():
+    return build_app()
+
+
+def legacy_stack():
+    app = build_app()
+
+    @app.middleware("http")
+    async def add_cors_header(request, call_next):
+        response = await call_next(request)
+        response.headers["Access-Control-Allow-Origin"] = "*"
+        response.headers["Access-Control-Allow-Methods"] = "*"
+        response.headers["Access-Control-Allow-Headers"] = "*"
+        return response
+
+    app.add_middleware(
+        StarletteCORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    return app
+
+
+def asgi_stack():
+    app = build_app()
+    app.add_middleware(TimingMiddleware)
+    app.add_middleware(CORSMiddleware)
+    return app
+
+
+async def drive(app, path: str, requests: int) -> float:
+    """Mean microseconds per request, calling the ASGI app directly"""
+    headers = [(b"host", b"bench"), (b"origin", b"http://localhost:3000")]
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope():
+        return {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+            "query_string": b"", "root_path": "", "headers": headers,
+            "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+        }
+
+    for _ in range(200):  # warm-up (builds middleware stack, caches)
+        await app(scope(), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(scope(), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-request middleware overhead")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    stacks = [
+        ("no middleware", bare_stack(), "/ping"),
+        ("legacy CORS (http + CORSMiddleware)", legacy_stack(), "/ping"),
+        ("pure ASGI (timing + CORS)", asgi_stack(), "/ping"),
+        ("pure ASGI + /api prefix strip", StripPrefixMiddleware(asgi_stack()), "/api/ping"),
+    ]
+    baseline = None
+    print(f"{'stack':<40}{'us/request':>12}{'overhead us':>13}")
+    for name, app, path in stacks:
+        per_request = asyncio.run(drive(app, path, args.requests))
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:<40}{per_request:>12.1f}{per_request - baseline:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,14 @@ Scholarship Data Fetcher Module
 Provides utilities to fetch, validate, and manage scholarship data using the CSV module
 """
 
-import csv
-import os
 from typing import List, Dict, Optional
 from sqlmodel import Session, select, func
 from database import engine
 from db_models.scholarship import Scholarship
+from data_fetcher.scholarship_index import get_scholarship_index
+from utils.tracing import traced
 
+@traced("scholarships.by_country")
 def fetch_scholarships_by_country(country: str, db: Optional[Session] = None) -> List[Dict]:
     """
     Fetch scholarships available in a specific country.
@@ -27,22 +28,9 @@ def fetch_scholarships_by_country(country: str, db: Optional[Session] = None) ->
     except Exception as e:
         print(f"DB Fetch failed for scholarships, falling back to CSV: {e}")
         
-    # 2. Fallback to CSV logic (copied from match_scholarships style)
-    csv_path = "backend/data/scholarships.csv"
-    if not os.path.exists(csv_path):
-        csv_path = "data/scholarships.csv"
-    
-    if not os.path.exists(csv_path):
-        return []
-    
-    results = []
+    # 2. Fallback to the in-memory CSV index
     try:
-        with open(csv_path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("country") == country:
-                    results.append(row)
-        return results
+        return get_scholarship_index().query(country=country)
     except Exception as e:
         print(f"CSV Fetch failed for scholarships: {e}")
         return []
@@ -57,77 +45,43 @@ def _fetch_scholarships_by_country(country: str, session: Session) -> List[Dict]
         return []
 
 
+@traced("scholarships.all")
 def fetch_all_scholarships() -> List[Dict]:
     """
     Fetch all available scholarships from CSV
     """
-    csv_path = "backend/data/scholarships.csv"
-    if not os.path.exists(csv_path):
-        csv_path = "data/scholarships.csv"
-    
-    if not os.path.exists(csv_path):
-        return []
-    
-    results = []
     try:
-        with open(csv_path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                results.append(row)
-        return results
+        return get_scholarship_index().query()
     except Exception as e:
         print(f"Error fetching all scholarships: {str(e)}")
         return []
 
 
+@traced("scholarships.by_coverage")
 def fetch_scholarships_by_coverage(coverage_type: str) -> List[Dict]:
     """
     Fetch scholarships by coverage type
     """
-    csv_path = "backend/data/scholarships.csv"
-    if not os.path.exists(csv_path):
-        csv_path = "data/scholarships.csv"
-    
-    if not os.path.exists(csv_path):
-        return []
-    
-    results = []
     try:
-        with open(csv_path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("coverage") == coverage_type:
-                    results.append(row)
-        return results
+        return get_scholarship_index().query(coverage=coverage_type)
     except Exception as e:
         print(f"Error fetching scholarships with coverage {coverage_type}: {str(e)}")
         return []
 
 
+@traced("scholarships.by_eligibility")
 def fetch_scholarships_by_eligibility(eligibility: str) -> List[Dict]:
     """
     Fetch scholarships by eligibility criteria
     """
-    csv_path = "backend/data/scholarships.csv"
-    if not os.path.exists(csv_path):
-        csv_path = "data/scholarships.csv"
-    
-    if not os.path.exists(csv_path):
-        return []
-    
-    results = []
     try:
-        with open(csv_path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if eligibility.lower() in row.get("eligibility", "").lower():
-                    results.append(row)
-        return results
+        return get_scholarship_index().query(eligibility=eligibility)
     except Exception as e:
         print(f"Error fetching scholarships with eligibility {eligibility}: {str(e)}")
         return []
 
 
+@traced("scholarships.statistics")
 def get_scholarship_statistics(db: Optional[Session] = None) -> Dict:
     """
     Get statistics about available scholarships
@@ -165,6 +119,7 @@ def _get_scholarship_statistics(session: Session) -> Dict:
         return {"error": str(e)}
 
 
+@traced("scholarships.filter")
 def filter_scholarships(country=None, coverage=None, min_amount=None, max_amount=None, db: Optional[Session] = None) -> List[Dict]:
     """
     Advanced filtering for scholarships with multiple criteria
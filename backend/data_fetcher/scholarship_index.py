@@ -0,0 +1,144 @@
+"""
+Scholarship Index Module
+In-memory indexes over the scholarships CSV so combined filters are answered
+with set intersections and bisect instead of rescanning the file per predicate.
+
+- country / coverage: hash indexes (case-insensitive exact match)
+- amount_eur: sorted array, range queries via bisect
+- eligibility: token index; a query term matches eligibility tokens it prefixes
+"""
+
+import bisect
+import csv
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Set
+
+from services.metrics_service import metrics_service
+from utils.tracing import span
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+SCHOLARSHIPS_CSV = os.path.join(DATA_DIR, "scholarships.csv")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(str(text or "").lower())
+
+
+def parse_amount(value) -> float:
+    try:
+        return float(str(value).replace(",", ""))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+class ScholarshipIndex:
+    """Immutable set of indexes built from scholarship rows"""
+
+    def __init__(self, rows: List[Dict]):
+        self.rows = rows
+        self.by_country: Dict[str, Set[int]] = {}
+        self.by_coverage: Dict[str, Set[int]] = {}
+        self.by_token: Dict[str, Set[int]] = {}
+
+        for i, row in enumerate(rows):
+            self.by_country.setdefault(str(row.get("country", "")).lower(), set()).add(i)
+            self.by_coverage.setdefault(str(row.get("coverage", "")).lower(), set()).add(i)
+            for token in tokenize(row.get("eligibility", "")):
+                self.by_token.setdefault(token, set()).add(i)
+
+        amount_order = sorted(range(len(rows)), key=lambda i: parse_amount(rows[i].get("amount_eur")))
+        self.sorted_amounts = [parse_amount(rows[i].get("amount_eur")) for i in amount_order]
+        self.sorted_amount_ids = amount_order
+        self.vocabulary = sorted(self.by_token)
+
+    def _amount_range(self, min_amount: Optional[float], max_amount: Optional[float]) -> Set[int]:
+        lo = 0 if min_amount is None else bisect.bisect_left(self.sorted_amounts, min_amount)
+        hi = len(self.sorted_amounts) if max_amount is None else bisect.bisect_right(self.sorted_amounts, max_amount)
+        return set(self.sorted_amount_ids[lo:hi])
+
+    def _eligibility(self, text: str) -> Set[int]:
+        matches = None
+        for term in tokenize(text):
+            # All vocabulary tokens starting with the term sit in one bisect range
+            start = bisect.bisect_left(self.vocabulary, term)
+            postings = set()
+            for token in self.vocabulary[start:]:
+                if not token.startswith(term):
+                    break
+                postings |= self.by_token[token]
+            matches = postings if matches is None else matches & postings
+            if not matches:
+                return set()
+        return matches if matches is not None else set(range(len(self.rows)))
+
+    def query(
+        self,
+        country: Optional[str] = None,
+        coverage: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        eligibility: Optional[str] = None
+    ) -> List[Dict]:
+        """Rows matching every given filter, in CSV order"""
+        candidates = []
+        if country:
+            candidates.append(self.by_country.get(country.strip().lower(), set()))
+        if coverage:
+            candidates.append(self.by_coverage.get(coverage.strip().lower(), set()))
+        if min_amount is not None or max_amount is not None:
+            candidates.append(self._amount_range(min_amount, max_amount))
+        if eligibility:
+            candidates.append(self._eligibility(eligibility))
+
+        if not candidates:
+            ids = range(len(self.rows))
+        else:
+            candidates.sort(key=len)
+            ids = set(candidates[0])
+            for other in candidates[1:]:
+                ids &= other
+                if not ids:
+                    break
+            ids = sorted(ids)
+
+        return [dict(self.rows[i]) for i in ids]
+
+
+_index: Optional[ScholarshipIndex] = None
+_index_signature = None
+_index_lock = threading.Lock()
+
+
+def get_scholarship_index(csv_path: Optional[str] = None) -> ScholarshipIndex:
+    """Shared index, rebuilt only when the CSV file (or SCHOLARSHIPS_CSV) changes"""
+    global _index, _index_signature
+    csv_path = csv_path or SCHOLARSHIPS_CSV
+    try:
+        st = os.stat(csv_path)
+        signature = (csv_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None
+
+    if _index is not None and signature == _index_signature:
+        metrics_service.record_cache("scholarship_index", hit=True)
+        return _index
+
+    with _index_lock:
+        if _index is None or signature != _index_signature:
+            metrics_service.record_cache("scholarship_index", hit=False)
+            with span("scholarship_index.build", path=csv_path) as build:
+                rows = []
+                if signature:
+                    try:
+                        with open(csv_path, mode='r', encoding='utf-8') as f:
+                            rows = list(csv.DictReader(f))
+                    except Exception as e:
+                        print(f"Error building scholarship index: {str(e)}")
+                _index = ScholarshipIndex(rows)
+                build.set_attribute("rows", len(rows))
+            _index_signature = signature
+    return _index
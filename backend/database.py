@@ -1,19 +1,53 @@
+import hashlib
 import os
+import shutil
+from typing import Optional
+
+from sqlalchemy import text
 from sqlmodel import SQLModel, create_engine, Session
 from dotenv import load_dotenv
 
+from utils.tracing import instrument_engine
+
 load_dotenv()
 
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
 # Use /tmp for SQLite on Vercel (the only writable directory)
 if os.environ.get("VERCEL"):
     db_path = "/tmp/university_system.db"
 else:
-    base_dir = os.path.dirname(os.path.abspath(__file__))
     db_path = os.path.join(base_dir, "university_system.db")
 
 DEFAULT_DATABASE_URL = f"sqlite:///{db_path}"
 DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
 
+# Prebuilt SQLite database (scripts/build_db_snapshot.py) copied into place when
+# the working database does not exist yet, e.g. on every serverless cold start
+DB_SNAPSHOT_PATH = os.getenv("DB_SNAPSHOT_PATH", os.path.join(base_dir, "data", "university_system.snapshot.db"))
+
+# Bump when seed_database() changes; schema changes are picked up automatically
+SEED_VERSION = 1
+SCHEMA_MARKER_TABLE = "schema_version"
+
+
+def restore_snapshot(snapshot_path: str = DB_SNAPSHOT_PATH, target_path: str = db_path) -> bool:
+    """Copy the snapshot to the SQLite path if that file is missing; returns True if copied"""
+    if DATABASE_URL != DEFAULT_DATABASE_URL or not snapshot_path:
+        return False
+    if os.path.exists(target_path) or not os.path.exists(snapshot_path):
+        return False
+    try:
+        partial = f"{target_path}.{os.getpid()}.tmp"
+        shutil.copyfile(snapshot_path, partial)
+        os.replace(partial, target_path)  # atomic, so concurrent workers never see half a file
+        return True
+    except OSError as e:
+        print(f"Database snapshot restore failed: {e}")
+        return False
+
+
+restore_snapshot()
 
 # SQLite-specific configuration for thread safety
 if DATABASE_URL.startswith("sqlite"):
@@ -22,10 +56,78 @@ else:
     connect_args = {}
 
 engine = create_engine(DATABASE_URL, connect_args=connect_args)
+instrument_engine(engine)  # db.query spans inside sampled traces
+
+
+def _register_models():
+    # Table classes must be imported for SQLModel.metadata to know them
+    from db_models import scholarship, university, user  # noqa: F401
+
+
+def schema_version() -> str:
+    """Fingerprint of every table definition plus SEED_VERSION"""
+    _register_models()
+    parts = [f"seed={SEED_VERSION}"]
+    for name in sorted(SQLModel.metadata.tables):
+        table = SQLModel.metadata.tables[name]
+        for column in table.columns:
+            parts.append(
+                f"{name}.{column.name}:{column.type}:{column.nullable}:{column.primary_key}:"
+                f"{bool(column.unique)}:{bool(column.index)}"
+            )
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def read_schema_version() -> Optional[str]:
+    """Version stored by the last successful init_database(), None if absent"""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(text(f"SELECT version FROM {SCHEMA_MARKER_TABLE}")).scalar()
+    except Exception:
+        return None
+
 
 def create_db_and_tables():
+    _register_models()
     SQLModel.metadata.create_all(engine)
 
+
+def seed_database(session: Session):
+    # Seed a demo user for testing on Vercel
+    from db_models.user import User
+    from sqlmodel import select
+    from utils.auth_utils import get_password_hash
+
+    demo_user = session.exec(select(User).where(User.username == "demo")).first()
+    if not demo_user:
+        session.add(User(
+            username="demo",
+            email="demo@europath.ai",
+            hashed_password=get_password_hash("demo123"),
+            full_name="Demo User"
+        ))
+        session.commit()
+
+
+def init_database(force: bool = False) -> bool:
+    """
+    Create tables and seed data only when the stored schema version differs
+    from the code's (or force=True). Returns True if the work was done.
+    """
+    version = schema_version()
+    if not force and read_schema_version() == version:
+        return False
+
+    create_db_and_tables()
+    with Session(engine) as session:
+        seed_database(session)
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE TABLE IF NOT EXISTS {SCHEMA_MARKER_TABLE} (version VARCHAR(64) NOT NULL)"))
+        connection.execute(text(f"DELETE FROM {SCHEMA_MARKER_TABLE}"))
+        connection.execute(text(f"INSERT INTO {SCHEMA_MARKER_TABLE} (version) VALUES (:version)"), {"version": version})
+    return True
+
+
 def get_session():
     with Session(engine) as session:
         yield session
@@ -1,35 +1,95 @@
-def predict_admission(profile):
-    gpa = profile.gpa or 0
-    ielts = profile.ielts or 0
-    budget = profile.budget or 0
-
-    # ---------- NORMALIZED SCORES ----------
-    gpa_score = min(gpa / 4.0, 1.0)          # out of 4
-    ielts_score = min(ielts / 9.0, 1.0)      # out of 9
-    budget_score = min(budget / 20000, 1.0)  # 20k reference
-
-    # ---------- FINAL WEIGHTED SCORE ----------
-    final_score = (
-        gpa_score * 0.45 +
-        ielts_score * 0.35 +
-        budget_score * 0.20
-    )
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-    probability = round(final_score * 100)
+from modules.model_registry import admission_model_registry
 
-    # ---------- DECISION ----------
-    if final_score >= 0.75:
-        chance = "HIGH"
-        message = "Excellent profile! Strong chances of admission."
-    elif final_score >= 0.5:
-        chance = "MEDIUM"
-        message = "Good profile. You have fair chances of admission."
-    else:
-        chance = "LOW"
-        message = "Profile needs improvement to increase admission chances."
+# ---------- CHANCE LOOKUP TABLES ----------
+# Single scoring kernel shared by /predict, /predict/batch and predict_admission.
+# The model score (0-1) is bucketed into whole percentage points (floor), which
+# index a precomputed chance table instead of re-running the threshold chain.
+CHANCE_LEVELS = ("LOW", "MEDIUM", "HIGH")
+CHANCE_MESSAGES = (
+    "Profile needs improvement to increase admission chances.",
+    "Good profile. You have fair chances of admission.",
+    "Excellent profile! Strong chances of admission.",
+)
+MEDIUM_FROM, HIGH_FROM = 50, 75
+
+CHANCE_INDEX = tuple(
+    2 if p >= HIGH_FROM else 1 if p >= MEDIUM_FROM else 0
+    for p in range(101)
+)
+CHANCE_INDEX_TABLE = np.array(CHANCE_INDEX, dtype=np.int8) if np is not None else None
+
+
+def _score_one(gpa: float, ielts: float, budget: float):
+    """(probability, chance_index) for one profile"""
+    percent = admission_model_registry.predict_one(gpa, ielts, budget) * 100
+    return round(percent), CHANCE_INDEX[min(max(int(percent), 0), 100)]
 
+
+def predict_admission(profile):
+    # ---------- MODEL SCORE ----------
+    # Served warm from the model registry; without a trained model this is the
+    # built-in weighted score (GPA 45%, IELTS 35%, budget 20%, capped at 4 / 9 / 20k).
+    # Inlined rather than via _score_one: this is the per-request hot path
+    percent = admission_model_registry.predict_one(profile.gpa or 0, profile.ielts or 0, profile.budget or 0) * 100
+
+    # ---------- DECISION ----------
+    chance_index = CHANCE_INDEX[min(max(int(percent), 0), 100)]
     return {
-        "chance": chance,
-        "probability": probability,
-        "message": message
-    }
\ No newline at end of file
+        "chance": CHANCE_LEVELS[chance_index],
+        "probability": round(percent),
+        "message": CHANCE_MESSAGES[chance_index]
+    }
+
+
+def predict_admission_batch(gpa, ielts, budget):
+    """
+    Score many profiles in one NumPy pass with the same kernel as predict_admission.
+
+    Args:
+        gpa, ielts, budget: Equal-length array-likes; None/NaN count as 0
+
+    Returns:
+        (probability, chance_index) integer arrays; chance_index indexes
+        CHANCE_LEVELS / CHANCE_MESSAGES
+    """
+    X = np.column_stack([
+        np.nan_to_num(np.asarray(gpa, dtype=float)),
+        np.nan_to_num(np.asarray(ielts, dtype=float)),
+        np.nan_to_num(np.asarray(budget, dtype=float)),
+    ])
+    percent = admission_model_registry.predict(X) * 100
+
+    probability = np.rint(percent).astype(int)
+    chance_index = CHANCE_INDEX_TABLE[np.clip(percent.astype(int), 0, 100)]
+    return probability, chance_index
+
+
+def predict_admission_rows(gpa, ielts, budget):
+    """
+    predict_admission_batch without NumPy: the single-profile kernel row by row.
+
+    Returns:
+        (probability, chance_index) lists; NaN counts as 0 as in the batch path
+    """
+    clean = lambda value: value if value == value else 0.0
+    scores = [_score_one(clean(g), clean(i), clean(b)) for g, i, b in zip(gpa, ielts, budget)]
+    return [p for p, _ in scores], [c for _, c in scores]
+
+
+def predict_admission_many(profiles):
+    """Batched registry inference for a list of profiles (same output as predict_admission)"""
+    profiles = list(profiles)
+    probability, chance_index = predict_admission_batch(
+        [p.gpa or 0 for p in profiles],
+        [p.ielts or 0 for p in profiles],
+        [p.budget or 0 for p in profiles],
+    )
+    return [
+        {"chance": CHANCE_LEVELS[i], "probability": p, "message": CHANCE_MESSAGES[i]}
+        for p, i in zip(probability.tolist(), chance_index.tolist())
+    ]
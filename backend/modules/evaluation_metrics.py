@@ -3,6 +3,7 @@ Evaluation Metrics Module
 Provides evaluation metrics for recommendation quality without affecting current outputs
 """
 
+import itertools
 from typing import List, Dict, Tuple, Optional
 try:
     import numpy as np
@@ -21,6 +22,19 @@ class EvaluationMetrics:
     recall_at_k: Dict[int, float]
     f1_score: float
 
+@dataclass
+class PredictionMetrics:
+    """Classification and calibration metrics for probability predictions"""
+    count: int
+    confusion_matrix: Dict[str, int]
+    accuracy: float
+    precision: float
+    recall: float
+    f1_score: float
+    brier_score: float  # Mean squared error of the probabilities
+    expected_calibration_error: float  # Count-weighted |predicted - observed| over the bins
+    reliability: List[Dict[str, Optional[float]]]  # Per probability bin, for reliability curves
+
 class RecommendationEvaluator:
     """
     Evaluate recommendation quality and ranking effectiveness
@@ -259,6 +273,181 @@ class RecommendationEvaluator:
             f1_score=f1
         )
 
+PAD_ID = -1  # Fills ranked-ID rows shorter than the batch width
+
+class BatchRecommendationEvaluator:
+    """
+    Vectorized RecommendationEvaluator for thousands of queries at once
+
+    Rankings are a padded (queries x depth) array of non-negative integer item
+    IDs; relevance is a boolean mask of the same shape plus the number of
+    relevant items per query. Every metric is then a handful of NumPy
+    reductions over the whole batch instead of per-query set arithmetic, with
+    the same definitions as RecommendationEvaluator (MAP divides by the number
+    of relevant items, MRR looks at the full ranking). Rankings are assumed to
+    hold each item at most once; a ground-truth item listed twice counts once
+    (RecommendationEvaluator would count it twice in recall, NDCG and MAP).
+    """
+
+    @staticmethod
+    def pad_rankings(
+        rankings: List[List[int]],
+        depth: Optional[int] = None,
+        pad_value: int = PAD_ID
+    ) -> "np.ndarray":
+        """
+        Stack ranked ID lists into a (queries x depth) int64 array
+
+        Args:
+            rankings: Ranked item IDs per query
+            depth: Keep the top `depth` items (default: longest ranking)
+            pad_value: Filler for shorter rankings
+
+        Returns:
+            Padded ranking array
+        """
+        lengths = np.fromiter((len(r) for r in rankings), dtype=np.int64, count=len(rankings))
+        if depth is None:
+            depth = int(lengths.max()) if len(rankings) else 0
+        lengths = np.minimum(lengths, depth)
+
+        padded = np.full((len(rankings), depth), pad_value, dtype=np.int64)
+        # One flat copy: positions [0, length) of every row
+        values = np.fromiter(
+            itertools.chain.from_iterable(r[:depth] for r in rankings), dtype=np.int64, count=int(lengths.sum())
+        )
+        padded[np.arange(depth) < lengths[:, None]] = values
+        return padded
+
+    @staticmethod
+    def relevance_mask(
+        ranked_ids: "np.ndarray",
+        ground_truths: List[List[int]]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Mark which ranked items are relevant
+
+        Each (query, item) pair is encoded as one integer key, so the whole
+        batch is matched with one binary search over the sorted relevant keys.
+
+        Args:
+            ranked_ids: Padded ranking array from pad_rankings
+            ground_truths: Relevant item IDs per query
+
+        Returns:
+            (relevance mask, number of distinct relevant items per query)
+        """
+        num_queries = ranked_ids.shape[0]
+        if len(ground_truths) != num_queries:
+            raise ValueError("Rankings and ground truth must cover the same queries")
+
+        counts = np.fromiter((len(g) for g in ground_truths), dtype=np.int64, count=num_queries)
+        truth_items = np.fromiter(
+            itertools.chain.from_iterable(ground_truths), dtype=np.int64, count=int(counts.sum())
+        )
+        truth_queries = np.repeat(np.arange(num_queries, dtype=np.int64), counts)
+
+        stride = int(max(ranked_ids.max(initial=0), truth_items.max(initial=0))) + 1
+        # Sort and drop duplicates by hand: np.unique is far slower on large int64 keys
+        truth_keys = np.sort(truth_queries * stride + truth_items)
+        first = np.ones(len(truth_keys), dtype=bool)
+        first[1:] = truth_keys[1:] != truth_keys[:-1]
+        truth_keys = truth_keys[first]
+        num_relevant = np.bincount(truth_keys // stride, minlength=num_queries)
+
+        ranked_keys = np.arange(num_queries, dtype=np.int64)[:, None] * stride + ranked_ids
+        if not len(truth_keys):
+            return np.zeros(ranked_ids.shape, dtype=bool), num_relevant
+        slots = np.minimum(np.searchsorted(truth_keys, ranked_keys), len(truth_keys) - 1)
+        relevance = (truth_keys[slots] == ranked_keys) & (ranked_ids >= 0)
+        return relevance, num_relevant
+
+    @staticmethod
+    def per_query(
+        relevance: "np.ndarray",
+        num_relevant: "np.ndarray",
+        k_values: List[int] = [1, 5, 10]
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Metrics for every query
+
+        Args:
+            relevance: (queries x depth) boolean mask, ranked order
+            num_relevant: Relevant items per query
+            k_values: Cutoffs for @K metrics; NDCG, MAP and F1 use the last one
+
+        Returns:
+            Metric name -> array with one value per query
+        """
+        num_queries, depth = relevance.shape
+        k = k_values[-1]
+        positions = np.arange(1, depth + 1)
+        hits = np.cumsum(relevance, axis=1)
+        denominator = np.maximum(num_relevant, 1)
+
+        def hits_at(cutoff):
+            if min(cutoff, depth) == 0:
+                return np.zeros(num_queries)
+            return hits[:, min(cutoff, depth) - 1].astype(np.float64)
+
+        metrics = {}
+        for cutoff in k_values:
+            metrics[f"precision@{cutoff}"] = hits_at(cutoff) / cutoff if cutoff else np.zeros(num_queries)
+            metrics[f"recall@{cutoff}"] = np.where(num_relevant > 0, hits_at(cutoff) / denominator, 0.0)
+
+        # NDCG@K: the ideal ranking puts min(relevant, K) hits first
+        discounts = 1.0 / np.log2(np.arange(max(k, depth)) + 2)
+        dcg = relevance[:, :k] @ discounts[:min(k, depth)]
+        ideal = np.concatenate(([0.0], np.cumsum(discounts[:k])))[np.minimum(num_relevant, k)]
+        metrics["ndcg"] = np.divide(dcg, ideal, out=np.zeros(num_queries), where=ideal > 0)
+
+        first_hit = relevance.argmax(axis=1) if depth else np.zeros(num_queries, dtype=np.int64)
+        metrics["mrr"] = np.where(relevance.any(axis=1), 1.0 / (first_hit + 1), 0.0)
+
+        precision_at_hits = np.where(relevance[:, :k], hits[:, :k] / positions[:k], 0.0)
+        metrics["map"] = np.where(num_relevant > 0, precision_at_hits.sum(axis=1) / denominator, 0.0)
+
+        precision, recall = hits_at(k) / k, metrics[f"recall@{k}"]
+        metrics["f1"] = np.divide(
+            2 * precision * recall, precision + recall, out=np.zeros(num_queries), where=precision + recall > 0
+        )
+        return metrics
+
+    @staticmethod
+    def evaluate(
+        relevance: "np.ndarray",
+        num_relevant: "np.ndarray",
+        k_values: List[int] = [1, 5, 10]
+    ) -> EvaluationMetrics:
+        """
+        Batch evaluation, averaged over the queries that have ground truth
+
+        Args:
+            relevance: (queries x depth) boolean mask, ranked order
+            num_relevant: Relevant items per query
+            k_values: Cutoffs for @K metrics
+
+        Returns:
+            EvaluationMetrics object with mean metrics
+        """
+        metrics = BatchRecommendationEvaluator.per_query(relevance, num_relevant, k_values)
+        labelled = num_relevant > 0
+
+        def mean(name):
+            return float(metrics[name][labelled].mean()) if labelled.any() else 0.0
+
+        return EvaluationMetrics(
+            precision_at_k={k: mean(f"precision@{k}") for k in k_values},
+            recall_at_k={k: mean(f"recall@{k}") for k in k_values},
+            ndcg=mean("ndcg"),
+            mrr=mean("mrr"),
+            map_score=mean("map"),
+            f1_score=mean("f1")
+        )
+
+# (prediction, ground truth) -> index into [tn, fp, fn, tp]; 1.0 and True hash like 1
+_CONFUSION_CELLS = {(0, 0): 0, (1, 0): 1, (0, 1): 2, (1, 1): 3}
+
 class PredictionEvaluator:
     """Evaluate prediction quality"""
     
@@ -271,10 +460,22 @@ class PredictionEvaluator:
         if len(predictions) != len(ground_truth):
             raise ValueError("Predictions and ground truth must have same length")
         
-        tp = sum(1 for p, g in zip(predictions, ground_truth) if p == 1 and g == 1)
-        tn = sum(1 for p, g in zip(predictions, ground_truth) if p == 0 and g == 0)
-        fp = sum(1 for p, g in zip(predictions, ground_truth) if p == 1 and g == 0)
-        fn = sum(1 for p, g in zip(predictions, ground_truth) if p == 0 and g == 1)
+        if np is None:
+            # One pass without NumPy; pairs with other labels are not counted
+            counts = [0, 0, 0, 0]
+            for pair in zip(predictions, ground_truth):
+                cell = _CONFUSION_CELLS.get(pair)
+                if cell is not None:
+                    counts[cell] += 1
+            tn, fp, fn, tp = counts
+        else:
+            predicted = np.asarray(predictions)
+            actual = np.asarray(ground_truth)
+            binary = np.isin(predicted, (0, 1)) & np.isin(actual, (0, 1))  # other labels are not counted
+            # One pass: cell index 2 * actual + predicted -> [tn, fp, fn, tp]
+            tn, fp, fn, tp = np.bincount(
+                2 * actual[binary].astype(np.int64) + predicted[binary].astype(np.int64), minlength=4
+            ).tolist()
         
         return {
             "true_positives": tp,
@@ -307,3 +508,74 @@ class PredictionEvaluator:
         if cm["true_positives"] + cm["false_negatives"] == 0:
             return 0.0
         return cm["true_positives"] / (cm["true_positives"] + cm["false_negatives"])
+    
+    @staticmethod
+    def evaluate_probabilities(
+        probabilities,
+        ground_truth,
+        threshold: float = 0.5,
+        n_bins: int = 10
+    ) -> PredictionMetrics:
+        """
+        Confusion matrix, precision/recall/F1, Brier score and reliability bins together
+        
+        Every statistic comes from a few np.bincount calls over the whole
+        arrays, so millions of logged predictions take milliseconds.
+        
+        Args:
+            probabilities: Predicted probabilities of the positive class (0-1)
+            ground_truth: Observed outcomes (0/1)
+            threshold: Probability at which a prediction counts as positive
+            n_bins: Equal-width probability bins for the reliability curve
+        
+        Returns:
+            PredictionMetrics object
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        actual = np.asarray(ground_truth).astype(bool)
+        if probabilities.shape != actual.shape:
+            raise ValueError("Predictions and ground truth must have same length")
+        if not np.isfinite(probabilities).all():
+            raise ValueError("Probabilities must be finite")
+        if probabilities.size and (probabilities.min() < 0 or probabilities.max() > 1):
+            raise ValueError("Probabilities must lie between 0 and 1")
+        
+        count = int(probabilities.size)
+        predicted = probabilities >= threshold
+        tn, fp, fn, tp = np.bincount(2 * actual + predicted, minlength=4).tolist()
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        
+        bins = np.minimum((probabilities * n_bins).astype(np.int64), n_bins - 1)
+        bin_counts = np.bincount(bins, minlength=n_bins)
+        bin_predicted = np.bincount(bins, weights=probabilities, minlength=n_bins)
+        bin_observed = np.bincount(bins, weights=actual, minlength=n_bins)
+        
+        reliability = [
+            {
+                "lower": i / n_bins,
+                "upper": (i + 1) / n_bins,
+                "count": int(n),
+                "mean_predicted": float(bin_predicted[i] / n) if n else None,
+                "observed_rate": float(bin_observed[i] / n) if n else None
+            }
+            for i, n in enumerate(bin_counts)
+        ]
+        
+        return PredictionMetrics(
+            count=count,
+            confusion_matrix={
+                "true_positives": tp,
+                "true_negatives": tn,
+                "false_positives": fp,
+                "false_negatives": fn
+            },
+            accuracy=(tp + tn) / count if count else 0.0,
+            precision=precision,
+            recall=recall,
+            f1_score=f1,
+            brier_score=float(np.mean((probabilities - actual) ** 2)) if count else 0.0,
+            expected_calibration_error=float(np.abs(bin_predicted - bin_observed).sum() / count) if count else 0.0,
+            reliability=reliability
+        )
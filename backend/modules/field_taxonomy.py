@@ -0,0 +1,67 @@
+"""
+Field of Study Taxonomy
+Maps free-text fields of study onto the salary/ROI categories with one
+precompiled regex (named groups, word-boundary keywords) memoized per
+normalized string. Shared by ROI, cost and recommendation code.
+"""
+
+import re
+from functools import lru_cache
+from typing import FrozenSet
+
+from services.metrics_service import metrics_service
+
+DEFAULT_CATEGORY = "Engineering"
+
+# (category, keyword pattern) in priority order: when a field mentions several
+# categories, the earliest entry wins. Generic "science" is deliberately a
+# low-priority fallback so "Political Science" or "Computer Science" are not
+# swallowed by Natural Sciences, and Engineering ranks above the science
+# keywords so "Chemical Engineering" or "Engineering Physics" stay Engineering.
+CATEGORY_KEYWORDS = (
+    ("Data Science", r"\bdata"),
+    ("Computer Science / AI", r"\bcomput|\bai\b|artificial intelligence|\bsoftware\b|\bmachine learning\b"),
+    ("Business / MBA", r"\bbusiness|\bmba\b|\bfinanc|\bmarketing\b|\beconom|\bhuman resources?\b"),
+    ("Medicine / Healthcare", r"\bmedic|\bhealth|\bnursing\b|\bpharma"),
+    ("Social Sciences", r"\bsocial|\bpolitic|\binternational relations\b|\bpublic policy\b|\bsociolog"),
+    ("Natural Sciences", r"\bnatural\b"),
+    ("Law & Legal Studies", r"\blaws?\b|\blegal\b"),
+    ("Arts / Humanities", r"\barts?\b|\bhuman|\bhistory\b|\bphilosoph|\bliterature\b|\blanguages?\b"),
+    ("Architecture & Design", r"\barchitect|\bdesign"),
+    ("Psychology", r"\bpsych"),
+    ("Education", r"\beducation|\bteach|\bpedagog"),
+    ("Hospitality & Tourism", r"\bhospitality\b|\btouris"),
+    ("Engineering", r"\bengineer|\brobotic|\bmechanical\b|\belectrical\b|\baerospace\b|\bcivil\b"),
+    ("Natural Sciences", r"\bscien|\bphysics\b|\bchemi|\bbiolog|\bbiotech|\bmathemat"),
+)
+
+_GROUP_CATEGORY = {f"c{i}": category for i, (category, _) in enumerate(CATEGORY_KEYWORDS)}
+_GROUP_PRIORITY = {f"c{i}": i for i in range(len(CATEGORY_KEYWORDS))}
+FIELD_PATTERN = re.compile(
+    "|".join(f"(?P<c{i}>{pattern})" for i, (_, pattern) in enumerate(CATEGORY_KEYWORDS))
+)
+
+
+def _normalize_text(field) -> str:
+    return " ".join(str(field or "").lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _classify(text: str):
+    groups = {m.lastgroup for m in FIELD_PATTERN.finditer(text)}
+    ordered = sorted(groups, key=_GROUP_PRIORITY.__getitem__)
+    primary = _GROUP_CATEGORY[ordered[0]] if ordered else DEFAULT_CATEGORY
+    return primary, frozenset(_GROUP_CATEGORY[g] for g in ordered)
+
+
+metrics_service.register_lru_cache("field_classifier", _classify)
+
+
+def normalize_field(field) -> str:
+    """Map a free-text field of study onto its primary salary category"""
+    return _classify(_normalize_text(field))[0]
+
+
+def field_categories(field) -> FrozenSet[str]:
+    """All categories mentioned by a field string (e.g. a multi-discipline university listing)"""
+    return _classify(_normalize_text(field))[1]
@@ -0,0 +1,297 @@
+"""
+Admission Model Registry
+Loads the serialized admission model once, validates it and serves warm
+in-process inference for predict_admission. Falls back to the built-in
+weighted score when no trained model is shipped (an empty .pkl file).
+
+Supported model files (pickle):
+- dict: {"version", "kind": "linear" | "logistic", "weights", "bias", "scales"}
+  with optional "weights_file" (.npy next to the pickle, memory-mapped)
+- estimator object exposing predict_proba(X) (e.g. scikit-learn), with an
+  optional "version" attribute
+
+Trust boundary: the model file is unpickled, which can run arbitrary code, so
+ADMISSION_MODEL_PATH must only ever point at a file produced by our own
+training/deploy pipeline and writable by the deploy user alone (never an
+upload or shared directory). "weights_file" is resolved as a bare file name
+inside the model's own directory.
+
+Single-profile inference (/predict) needs only the standard library; NumPy is
+required for batch inference, estimator models and memory-mapped weights.
+"""
+
+import hashlib
+import math
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+DEFAULT_MODEL_PATH = os.getenv("ADMISSION_MODEL_PATH", os.path.join(MODEL_DIR, "admission_model.pkl"))
+RELOAD_CHECK_SECONDS = float(os.getenv("ADMISSION_MODEL_RELOAD_SECONDS", "2"))
+
+FEATURES = ("gpa", "ielts", "budget")
+FEATURE_SCALES = (4.0, 9.0, 20000.0)
+
+BUILTIN_MODEL = {
+    "version": "builtin-weighted-1",
+    "kind": "linear",
+    "weights": [0.45, 0.35, 0.20],
+    "bias": 0.0,
+    "scales": list(FEATURE_SCALES),
+}
+
+# Probe profiles used to validate any model before it is served
+VALIDATION_PROFILES = [
+    [0.0, 0.0, 0.0],
+    [2.5, 5.5, 5000.0],
+    [3.5, 7.0, 15000.0],
+    [4.0, 9.0, 40000.0],
+]
+
+
+class ModelValidationError(Exception):
+    """Raised when a model file cannot be loaded or produces invalid output"""
+
+
+class LinearAdmissionModel:
+    """Weighted score over capped, normalized features (optionally logistic)"""
+
+    def __init__(self, weights, bias=0.0, scales=FEATURE_SCALES, kind="linear"):
+        if kind not in ("linear", "logistic"):
+            raise ModelValidationError(f"Unsupported model kind: {kind}")
+        if len(weights) != len(FEATURES) or len(scales) != len(FEATURES):
+            raise ModelValidationError(f"Expected {len(FEATURES)} weights and scales")
+
+        self.kind = kind
+        self.bias = float(bias)
+        # Plain tuples keep the single-profile path free of NumPy (and its call overhead)
+        self._pairs = tuple(zip((float(w) for w in weights), (float(s) for s in scales)))
+        self.weights = tuple(w for w, _ in self._pairs)
+        self.scales = tuple(s for _, s in self._pairs)
+        self.predict_one = self._compile_predict_one()
+
+    def _compile_predict_one(self):
+        """
+        Single-profile scorer with the weights bound as closure constants
+        (no loop, attribute lookups or builtin calls per call). Terms are added
+        in the same order as predict() so both paths round identically; the
+        conditionals are exactly min(x, 1.0) and max(0.0, min(z, 1.0)),
+        including for NaN.
+        """
+        bias = self.bias
+        (w_gpa, s_gpa), (w_ielts, s_ielts), (w_budget, s_budget) = self._pairs
+        exp = math.exp
+        logistic = self.kind == "logistic"
+
+        def predict_one(gpa: float, ielts: float, budget: float) -> float:
+            gpa, ielts, budget = gpa / s_gpa, ielts / s_ielts, budget / s_budget
+            z = (bias + (1.0 if 1.0 < gpa else gpa) * w_gpa + (1.0 if 1.0 < ielts else ielts) * w_ielts
+                 + (1.0 if 1.0 < budget else budget) * w_budget)
+            if logistic:
+                return 1.0 / (1.0 + exp(-z))
+            return 1.0 if 1.0 < z else z if z > 0.0 else 0.0
+        return predict_one
+
+    def predict(self, X) -> "np.ndarray":
+        _require_numpy("Batch inference")
+        # Accumulate column by column in the same order as predict_one so the
+        # scalar and batch paths round identically at bucket boundaries
+        z = np.full(len(X), self.bias)
+        for j, (weight, scale) in enumerate(self._pairs):
+            z += np.minimum(X[:, j] / scale, 1.0) * weight
+        if self.kind == "logistic":
+            return 1.0 / (1.0 + np.exp(-z))
+        return np.clip(z, 0.0, 1.0)
+
+
+class EstimatorAdmissionModel:
+    """Adapter for pickled estimators exposing predict_proba"""
+
+    kind = "estimator"
+
+    def __init__(self, estimator):
+        self.estimator = estimator
+
+    def predict_one(self, gpa: float, ielts: float, budget: float) -> float:
+        return float(self.predict(np.array([[gpa, ielts, budget]], dtype=float))[0])
+
+    def predict(self, X) -> "np.ndarray":
+        return np.asarray(self.estimator.predict_proba(X), dtype=float)[:, 1]
+
+
+def _require_numpy(what: str) -> None:
+    if np is None:
+        raise ModelValidationError(f"{what} requires numpy")
+
+
+def _build_model(obj: Any, path: Optional[str]):
+    """Turn an unpickled object into a served model plus its version string"""
+    if isinstance(obj, dict):
+        weights = obj.get("weights")
+        weights_file = obj.get("weights_file")
+        if weights_file:
+            _require_numpy("weights_file")
+            # Bare name only: a pickled "../x" must not reach outside the model directory
+            weights_path = os.path.join(os.path.dirname(path or MODEL_DIR), os.path.basename(weights_file))
+            weights = np.load(weights_path, mmap_mode="r")
+        if weights is None:
+            raise ModelValidationError("Model dict has no 'weights' or 'weights_file'")
+        model = LinearAdmissionModel(
+            weights,
+            bias=obj.get("bias", 0.0),
+            scales=obj.get("scales", FEATURE_SCALES),
+            kind=obj.get("kind", "linear"),
+        )
+        return model, str(obj.get("version", "unversioned"))
+
+    if hasattr(obj, "predict_proba"):
+        _require_numpy("Estimator models")
+        return EstimatorAdmissionModel(obj), str(getattr(obj, "version", "unversioned"))
+
+    raise ModelValidationError(f"Unsupported model object: {type(obj).__name__}")
+
+
+def _builtin_model():
+    return LinearAdmissionModel(
+        BUILTIN_MODEL["weights"], bias=BUILTIN_MODEL["bias"], scales=BUILTIN_MODEL["scales"], kind=BUILTIN_MODEL["kind"]
+    ), BUILTIN_MODEL["version"]
+
+
+def _validate(model) -> None:
+    try:
+        single = [model.predict_one(*row) for row in VALIDATION_PROFILES]
+    except Exception as e:
+        raise ModelValidationError(f"Model inference failed: {e}")
+    if not all(math.isfinite(p) and 0 <= p <= 1 for p in single):
+        raise ModelValidationError("Model probabilities must be finite and within [0, 1]")
+    if np is None:
+        return  # no batch path to compare against
+
+    try:
+        batch = np.asarray(model.predict(np.array(VALIDATION_PROFILES, dtype=float)), dtype=float)
+    except Exception as e:
+        raise ModelValidationError(f"Model inference failed: {e}")
+
+    if batch.shape != (len(VALIDATION_PROFILES),):
+        raise ModelValidationError(f"Unexpected output shape {batch.shape}")
+    if not np.all(np.isfinite(batch)) or np.any(batch < 0) or np.any(batch > 1):
+        raise ModelValidationError("Model probabilities must be finite and within [0, 1]")
+    if not np.allclose(batch, single):
+        raise ModelValidationError("Single-profile and batch inference disagree")
+
+
+class ModelRegistry:
+    """
+    Holds the active admission model and hot-swaps it when the file changes.
+
+    The file is stat'ed at most once every RELOAD_CHECK_SECONDS; a file that
+    fails validation is logged and the previously served model is kept.
+    """
+
+    def __init__(self, path: str = DEFAULT_MODEL_PATH, reload_check_seconds: float = RELOAD_CHECK_SECONDS):
+        self.path = path
+        self.reload_check_seconds = reload_check_seconds
+        self._lock = threading.Lock()
+        self._model = None
+        self._metadata: Dict[str, Any] = {}
+        self._file_signature = None
+        self._next_check = 0.0
+        # Bound predict_one of the served model, swapped together with it
+        self._predict_one = None
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def load(self) -> Dict[str, Any]:
+        """(Re)load the model file, falling back to the built-in model"""
+        with self._lock:
+            signature = self._signature()
+            load_error = None
+            source = "builtin"
+            digest = None
+
+            try:
+                if signature and signature[1] > 0:
+                    with open(self.path, "rb") as f:
+                        raw = f.read()
+                    digest = hashlib.sha256(raw).hexdigest()
+                    model, version = _build_model(pickle.loads(raw), self.path)
+                    source = self.path
+                else:
+                    model, version = _builtin_model()
+                _validate(model)
+            except Exception as e:
+                load_error = str(e)
+                print(f"Admission model load failed, keeping previous model: {e}")
+                if self._model is not None:
+                    self._file_signature = signature
+                    self._metadata["load_error"] = load_error
+                    return dict(self._metadata)
+                # Pure Python, so this last resort works even without numpy
+                model, version = _builtin_model()
+                source = "builtin"
+                digest = None
+
+            self._model = model
+            self._predict_one = model.predict_one
+            self._file_signature = signature
+            self._next_check = time.monotonic() + self.reload_check_seconds
+            self._metadata = {
+                "version": version,
+                "kind": model.kind,
+                "source": source,
+                "sha256": digest,
+                "features": list(FEATURES),
+                "loaded_at": datetime.now().isoformat(),
+                "load_error": load_error,
+            }
+            return dict(self._metadata)
+
+    def get_model(self):
+        """Return the served model, reloading first if the file has changed"""
+        if self._model is None:
+            self.load()
+        elif self.reload_check_seconds >= 0 and time.monotonic() >= self._next_check:
+            self._check_for_update()
+        return self._model
+
+    def _check_for_update(self) -> None:
+        self._next_check = time.monotonic() + self.reload_check_seconds
+        if self._signature() != self._file_signature:
+            self.load()
+
+    def predict_one(self, gpa: float, ielts: float, budget: float) -> float:
+        # Hot path: the cached scorer, with the clock read at most once per call
+        # and the file stat'ed only when a reload check is due
+        if self._predict_one is None:
+            self.load()
+        elif self.reload_check_seconds >= 0 and time.monotonic() >= self._next_check:
+            self._check_for_update()
+        return self._predict_one(gpa, ielts, budget)
+
+    def predict(self, X) -> "np.ndarray":
+        """Batched inference over an (n, 3) array of gpa, ielts, budget"""
+        _require_numpy("Batch inference")
+        return self.get_model().predict(np.asarray(X, dtype=float))
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        self.get_model()
+        return dict(self._metadata)
+
+
+# Global registry instance
+admission_model_registry = ModelRegistry()
@@ -0,0 +1,177 @@
+"""
+Catalog Search Module
+Typo-tolerant full-text search and prefix autocomplete over universities and
+scholarships, so clients can ask for a few targeted matches instead of
+downloading the whole catalog.
+
+Each distinct word is indexed once by its character trigrams; a query word is
+matched against vocabulary words sharing trigrams (Dice similarity), and the
+last query word also matches as a prefix for search-as-you-type.
+"""
+
+import bisect
+import heapq
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from data_fetcher.scholarship_index import get_scholarship_index
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+MIN_SIMILARITY = 0.4
+PREFIX_SIMILARITY = 0.9
+
+
+def tokenize(text) -> List[str]:
+    return TOKEN_PATTERN.findall(str(text or "").lower())
+
+
+def trigrams(token: str) -> frozenset:
+    padded = f"  {token} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class SearchIndex:
+    """
+    Trigram index over a list of documents.
+
+    Args:
+        documents: Records to search (returned as-is in results)
+        fields: {field_name: weight}; the first field is the display title
+        doc_type: Label attached to every result
+    """
+
+    def __init__(self, documents: List[Dict[str, Any]], fields: Dict[str, float], doc_type: str):
+        self.documents = documents
+        self.fields = fields
+        self.doc_type = doc_type
+        self.title_field = next(iter(fields))
+
+        self.terms: List[str] = []
+        self.term_trigrams: List[frozenset] = []
+        self.term_postings: List[Dict[int, float]] = []
+        self.trigram_terms: Dict[str, List[int]] = defaultdict(list)
+        term_ids: Dict[str, int] = {}
+
+        for doc_id, doc in enumerate(documents):
+            for field, weight in fields.items():
+                for token in tokenize(doc.get(field)):
+                    term_id = term_ids.get(token)
+                    if term_id is None:
+                        term_id = term_ids[token] = len(self.terms)
+                        grams = trigrams(token)
+                        self.terms.append(token)
+                        self.term_trigrams.append(grams)
+                        self.term_postings.append({})
+                        for gram in grams:
+                            self.trigram_terms[gram].append(term_id)
+                    postings = self.term_postings[term_id]
+                    if weight > postings.get(doc_id, 0):
+                        postings[doc_id] = weight
+
+        # Sorted vocabulary for prefix (autocomplete) lookups via bisect
+        self.sorted_terms = sorted(term_ids)
+        self.sorted_term_ids = [term_ids[t] for t in self.sorted_terms]
+
+    def _prefix_terms(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self.sorted_terms, prefix)
+        matches = []
+        for i in range(start, len(self.sorted_terms)):
+            if not self.sorted_terms[i].startswith(prefix):
+                break
+            matches.append(self.sorted_term_ids[i])
+        return matches
+
+    def _similar_terms(self, token: str, allow_prefix: bool) -> Dict[int, float]:
+        """Vocabulary terms close to token, with their similarity (0-1)"""
+        grams = trigrams(token)
+        shared = defaultdict(int)
+        for gram in grams:
+            for term_id in self.trigram_terms.get(gram, ()):
+                shared[term_id] += 1
+
+        similar = {}
+        for term_id, count in shared.items():
+            similarity = 2.0 * count / (len(grams) + len(self.term_trigrams[term_id]))
+            if similarity >= MIN_SIMILARITY:
+                similar[term_id] = similarity
+        if allow_prefix and len(token) >= 2:
+            for term_id in self._prefix_terms(token):
+                similar[term_id] = max(similar.get(term_id, 0.0), PREFIX_SIMILARITY)
+        return similar
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Top-k documents for a free-text query, tolerant to typos"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for position, token in enumerate(tokens):
+            best: Dict[int, float] = {}
+            similar = self._similar_terms(token, allow_prefix=position == len(tokens) - 1)
+            for term_id, similarity in similar.items():
+                for doc_id, weight in self.term_postings[term_id].items():
+                    score = similarity * weight
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] += score
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [
+            {"type": self.doc_type, "score": round(score / len(tokens), 3), "item": self.documents[doc_id]}
+            for doc_id, score in top
+        ]
+
+    def autocomplete(self, prefix: str, k: int = 8) -> List[Dict[str, Any]]:
+        """Titles of documents where every typed word prefixes an indexed word"""
+        tokens = tokenize(prefix)
+        if not tokens:
+            return []
+
+        candidates: Optional[Dict[int, float]] = None
+        for token in tokens:
+            matched: Dict[int, float] = {}
+            for term_id in self._prefix_terms(token):
+                for doc_id, weight in self.term_postings[term_id].items():
+                    matched[doc_id] = max(matched.get(doc_id, 0.0), weight)
+            if candidates is None:
+                candidates = matched
+            else:
+                candidates = {d: candidates[d] + w for d, w in matched.items() if d in candidates}
+            if not candidates:
+                return []
+
+        top = heapq.nlargest(k, candidates.items(), key=lambda item: (item[1], -item[0]))
+        return [
+            {
+                "type": self.doc_type,
+                "text": self.documents[doc_id].get(self.title_field),
+                "score": round(score / len(tokens), 3),
+                "item": self.documents[doc_id]
+            }
+            for doc_id, score in top
+        ]
+
+
+UNIVERSITY_SEARCH_FIELDS = {"university": 3.0, "field": 2.0, "city": 1.5, "country": 1.5}
+SCHOLARSHIP_SEARCH_FIELDS = {"scholarship_name": 3.0, "eligibility": 1.5, "country": 1.5, "coverage": 1.0}
+
+
+def merge_results(result_lists: List[List[Dict[str, Any]]], k: int) -> List[Dict[str, Any]]:
+    """Merge per-index result lists into one top-k list by score"""
+    merged = [r for results in result_lists for r in results]
+    return heapq.nlargest(k, merged, key=lambda r: r["score"])
+
+
+_scholarship_search: Dict[str, Any] = {"source": None, "index": None}
+
+
+def get_scholarship_search() -> SearchIndex:
+    """Scholarship search index, rebuilt whenever the scholarship CSV index is"""
+    source = get_scholarship_index()
+    if _scholarship_search["source"] is not source:
+        _scholarship_search["index"] = SearchIndex(source.rows, SCHOLARSHIP_SEARCH_FIELDS, "scholarship")
+        _scholarship_search["source"] = source
+    return _scholarship_search["index"]
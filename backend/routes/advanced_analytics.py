@@ -17,15 +17,12 @@ app.include_router(analytics_router, prefix="/api/v2")
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from datetime import datetime
 from services.analytics_service import analytics_service
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+from services.metrics_service import metrics_service
+from utils.fast_json import FastJSONRoute
 
-import os
-
-router = APIRouter(tags=["analytics"])
+router = APIRouter(tags=["analytics"], route_class=FastJSONRoute)
 
 
 class AnalyticsRequest(BaseModel):
@@ -94,18 +91,20 @@ async def get_performance_metrics():
     Get system performance metrics
     
     Returns:
-        Performance statistics (placeholder for future ML monitoring)
+        Live request, latency, cache and Groq statistics from the metrics
+        service (Prometheus text format is served at /metrics)
     """
     try:
         return {
             "status": "success",
             "metrics": {
                 "api_status": "operational",
-                "timestamp": pd.Timestamp.now().isoformat(),
+                "timestamp": datetime.now().isoformat(),
                 "models": {
                     "recommendation": {"status": "active"},
                     "prediction": {"status": "active"},
-                }
+                },
+                **metrics_service.summary()
             }
         }
     except Exception as e:
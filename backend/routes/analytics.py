@@ -1,14 +1,46 @@
 """
 Analytics Summary Endpoint
 Provides aggregated analytics and insights about recommendations and predictions
+
+/analytics/predictions/accuracy scores the prediction outcome log: a CSV at
+PREDICTION_OUTCOMES_PATH (default data/prediction_outcomes.csv) with one row
+per /predict result whose outcome is known:
+
+    timestamp,probability,admitted
+    2026-09-01T10:15:00Z,72,1
+
+probability is the 0-100 value /predict returned and admitted is 0/1.
+Rows with a missing or unparseable value, or a value outside those ranges,
+are skipped.
+
+Only that endpoint is implemented, so it lives on prediction_router, which
+app.py mounts under /analytics. The other endpoints are placeholders that
+return empty data; they stay on router (which also includes
+prediction_router) until they are backed by real data.
 """
 
+import os
+import re
+import threading
+
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from modules.evaluation_metrics import PredictionEvaluator
+from utils.fast_json import FastJSONRoute
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], route_class=FastJSONRoute)
+prediction_router = APIRouter(tags=["analytics"], route_class=FastJSONRoute)
+
+PREDICTION_OUTCOMES_PATH = os.getenv(
+    "PREDICTION_OUTCOMES_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "prediction_outcomes.csv")
+)
 
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+_outcomes_lock = threading.Lock()
+_outcomes_cache: Dict[str, Any] = {}
 
 class AnalyticsSummary(BaseModel):
     """Summary analytics data"""
@@ -78,32 +110,86 @@ def get_recommendation_trends(
     }
     return trends
 
-@router.get("/predictions/accuracy")
+def _load_prediction_outcomes(path: str):
+    """(timestamps in epoch ns, probabilities 0-1, outcomes) arrays, re-read only when the file changes"""
+    import numpy as np
+    import pandas as pd
+
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _outcomes_lock:
+        cached = _outcomes_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        frame = pd.read_csv(path, usecols=["timestamp", "probability", "admitted"], dtype=str)
+        timestamps = pd.to_datetime(frame["timestamp"], utc=True, errors="coerce")
+        probabilities = pd.to_numeric(frame["probability"], errors="coerce").to_numpy(dtype=np.float64)
+        admitted = pd.to_numeric(frame["admitted"], errors="coerce").to_numpy(dtype=np.float64)
+        # NaN fails every comparison, so blank and malformed cells drop out here too
+        valid = (timestamps.notna().to_numpy() & (probabilities >= 0) & (probabilities <= 100)
+                 & ((admitted == 0) | (admitted == 1)))
+        arrays = (
+            timestamps[valid].to_numpy(dtype="datetime64[ns]").view(np.int64),
+            probabilities[valid] / 100,
+            admitted[valid].astype(np.int8)
+        )
+        _outcomes_cache[path] = (key, arrays)
+        return arrays
+
+def _period_start(time_period: str) -> Optional[datetime]:
+    """Start of a "<n>d" window, None for "all" """
+    if time_period == "all":
+        return None
+    match = re.fullmatch(r"(\d+)d", time_period)
+    if not match:
+        raise ValueError(f"Invalid time period: {time_period} (use e.g. 1d, 7d, 30d or all)")
+    return datetime.now(timezone.utc) - timedelta(days=int(match.group(1)))
+
+@prediction_router.get("/predictions/accuracy")
 def get_prediction_accuracy(
-    time_period: str = Query("30d")
+    time_period: str = Query("30d"),
+    threshold: float = Query(0.5, ge=0, le=1, description="Probability counted as a predicted admission"),
+    bins: int = Query(10, ge=1, le=100, description="Reliability curve bins")
 ) -> Dict[str, Any]:
     """
     Get prediction accuracy metrics
     
     Args:
-        time_period: Time period for analysis
+        time_period: Time period for analysis (1d, 7d, 30d, all)
+        threshold: Decision threshold on the predicted probability
+        bins: Number of equal-width reliability bins
     
     Returns:
         Accuracy metrics and statistics
     """
-    accuracy_data = {
-        "overall_accuracy": 0.0,
-        "precision_at_k": {},
-        "ndcg_score": 0.0,
-        "calibration_score": 0.0,
-        "confusion_matrix": {
-            "true_positives": 0,
-            "true_negatives": 0,
-            "false_positives": 0,
-            "false_negatives": 0
+    try:
+        start = _period_start(time_period)
+        if not os.path.exists(PREDICTION_OUTCOMES_PATH):
+            timestamps, probabilities, admitted = [], [], []
+        else:
+            timestamps, probabilities, admitted = _load_prediction_outcomes(PREDICTION_OUTCOMES_PATH)
+            if start is not None:
+                recent = timestamps >= int(start.timestamp() * 1e9)
+                probabilities, admitted = probabilities[recent], admitted[recent]
+
+        metrics = PredictionEvaluator.evaluate_probabilities(probabilities, admitted, threshold, bins)
+        return {
+            "status": "success",
+            "time_period": time_period,
+            "predictions": metrics.count,
+            "overall_accuracy": metrics.accuracy,
+            "precision": metrics.precision,
+            "recall": metrics.recall,
+            "f1_score": metrics.f1_score,
+            "brier_score": metrics.brier_score,
+            "expected_calibration_error": metrics.expected_calibration_error,
+            "calibration_score": 1 - metrics.expected_calibration_error if metrics.count else 0.0,
+            "confusion_matrix": metrics.confusion_matrix,
+            "reliability": metrics.reliability
         }
-    }
-    return accuracy_data
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
 
 @router.get("/user/insights/{student_id}")
 def get_user_insights(student_id: str) -> Dict[str, Any]:
@@ -129,3 +215,5 @@ def get_user_insights(student_id: str) -> Dict[str, Any]:
         "next_steps": []
     }
     return insights
+
+router.include_router(prediction_router)
@@ -1,3 +1,4 @@
+import os
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session, select
@@ -11,11 +12,16 @@ from utils.auth_utils import (
     decode_access_token
 )
 from pydantic import BaseModel, EmailStr
+from utils.fast_json import FastJSONRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=FastJSONRoute)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Comma-separated usernames allowed on operator endpoints (e.g. /admin/profile);
+# nobody is an admin unless this is set
+ADMIN_USERNAMES = frozenset(u.strip() for u in os.getenv("ADMIN_USERNAMES", "").split(",") if u.strip())
+
 # ---------- Data Models ----------
 class UserRegister(BaseModel):
     username: str
@@ -49,6 +55,11 @@ def get_current_user(token: str = Depends(oauth2_scheme), session: Session = Dep
         raise credentials_exception
     return user
 
+def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    if current_user.username not in ADMIN_USERNAMES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
+
 # ---------- Routes ----------
 @router.post("/register", response_model=dict)
 def register(user_data: UserRegister, session: Session = Depends(get_session)):
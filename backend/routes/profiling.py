@@ -0,0 +1,55 @@
+"""
+Profiling Routes (admin only)
+-----------------------------
+Profile the live worker on demand; see services/profiler_service.py.
+
+Endpoints:
+- GET /admin/profile?seconds=5&interval_ms=5&format=json
+    format=json:      samples, top functions by self time, collapsed stacks
+                      and a tracemalloc allocation snapshot
+    format=collapsed: collapsed stacks only, as text/plain, ready for
+                      `flamegraph.pl profile.txt > profile.svg` or speedscope
+
+Access requires a bearer token of a user listed in ADMIN_USERNAMES.
+
+Usage in app.py:
+from routes.profiling import router as profiling_router
+app.include_router(profiling_router)
+"""
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+
+from db_models.user import User
+from routes.auth import get_current_admin
+from services.profiler_service import MAX_SECONDS, ProfilerBusy, profiler_service
+from utils.fast_json import FastJSONRoute
+
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=FastJSONRoute)
+
+
+# A plain `def`, so FastAPI runs the blocking sampler in the threadpool and the
+# event loop it is observing keeps serving requests
+@router.get("/profile")
+def profile_worker(
+    seconds: float = Query(5.0, gt=0, le=MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    allocations: bool = True,
+    include_idle: bool = Query(False, description="Keep stacks of threads waiting for work"),
+    top: int = Query(20, ge=1, le=200),
+    admin: User = Depends(get_current_admin),
+):
+    try:
+        result = profiler_service.profile(
+            seconds, interval=interval_ms / 1000, allocations=allocations and format == "json",
+            top=top, include_idle=include_idle,
+        )
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if format == "collapsed":
+        return Response(content=result.collapsed(), media_type="text/plain; charset=utf-8")
+    return {"status": "success", "pid": os.getpid(), "requested_by": admin.username, **result.to_dict(top)}
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Dict
+from utils.response_cache import PrecomputedResponse, STATIC_CACHE_CONTROL
+from utils.fast_json import FastJSONRoute
 
-router = APIRouter(prefix="/api/relocation", tags=["EuroPath AI: Relocation Guide"])
+router = APIRouter(prefix="/api/relocation", tags=["EuroPath AI: Relocation Guide"], route_class=FastJSONRoute)
 
 class RelocationStep(BaseModel):
     id: str
@@ -78,16 +80,28 @@ RELOCATION_GUIDES = {
     }
 }
 
+# Static data: validate once at import, then serve pre-serialized (and pre-gzipped) bytes
+STATIC_GUIDES = {
+    code: PrecomputedResponse(
+        RelocationData(**data).model_dump(),
+        cache_control=STATIC_CACHE_CONTROL,
+        compress=True
+    )
+    for code, data in RELOCATION_GUIDES.items()
+}
+STATIC_COUNTRIES = PrecomputedResponse(
+    [{"code": k, "name": v["country_name"]} for k, v in RELOCATION_GUIDES.items()],
+    cache_control=STATIC_CACHE_CONTROL,
+    compress=True
+)
+
 @router.get("/supported-countries", response_model=List[Dict[str, str]])
-async def get_supported_countries():
-    return [
-        {"code": k, "name": v["country_name"]} 
-        for k, v in RELOCATION_GUIDES.items()
-    ]
+async def get_supported_countries(request: Request):
+    return STATIC_COUNTRIES.to_response(request)
 
 @router.get("/{country_code}", response_model=RelocationData)
-async def get_relocation_guide(country_code: str):
+async def get_relocation_guide(country_code: str, request: Request):
     code = country_code.upper()
-    if code not in RELOCATION_GUIDES:
+    if code not in STATIC_GUIDES:
         raise HTTPException(status_code=404, detail="Relocation guide for this country not found")
-    return RELOCATION_GUIDES[code]
+    return STATIC_GUIDES[code].to_response(request)
@@ -8,8 +8,9 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import json
+from utils.fast_json import FastJSONRoute
 
-router = APIRouter(prefix="/resume", tags=["Resume Builder"])
+router = APIRouter(prefix="/resume", tags=["Resume Builder"], route_class=FastJSONRoute)
 
 # ============ Data Models ============
 
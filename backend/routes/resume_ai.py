@@ -2,8 +2,9 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 from services.groq_service import groq_service
+from utils.fast_json import FastJSONRoute
 
-router = APIRouter(prefix="/resume/ai", tags=["Resume AI"])
+router = APIRouter(prefix="/resume/ai", tags=["Resume AI"], route_class=FastJSONRoute)
 
 class SummaryRequest(BaseModel):
     name: str
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+from utils.response_cache import PrecomputedResponse, STATIC_CACHE_CONTROL
+from utils.fast_json import FastJSONRoute
 
-router = APIRouter(prefix="/visa", tags=["EuroPath AI: Visa & Document Tracker"])
+router = APIRouter(prefix="/visa", tags=["EuroPath AI: Visa & Document Tracker"], route_class=FastJSONRoute)
 
 class VisaItem(BaseModel):
     id: str
@@ -98,16 +100,28 @@ VISA_REQUIREMENTS = {
     }
 }
 
+# Static data: validate once at import, then serve pre-serialized (and pre-gzipped) bytes
+STATIC_REQUIREMENTS = {
+    code: PrecomputedResponse(
+        VisaRequirementResponse(**data).model_dump(),
+        cache_control=STATIC_CACHE_CONTROL,
+        compress=True
+    )
+    for code, data in VISA_REQUIREMENTS.items()
+}
+STATIC_COUNTRIES = PrecomputedResponse(
+    [{"code": k, "name": v["country_name"]} for k, v in VISA_REQUIREMENTS.items()],
+    cache_control=STATIC_CACHE_CONTROL,
+    compress=True
+)
+
 @router.get("/requirements/{country_code}", response_model=VisaRequirementResponse)
-async def get_visa_requirements(country_code: str):
+async def get_visa_requirements(country_code: str, request: Request):
     code = country_code.upper()
-    if code not in VISA_REQUIREMENTS:
+    if code not in STATIC_REQUIREMENTS:
         raise HTTPException(status_code=404, detail="Country requirements not found")
-    return VISA_REQUIREMENTS[code]
+    return STATIC_REQUIREMENTS[code].to_response(request)
 
 @router.get("/countries", response_model=List[Dict[str, str]])
-async def get_supported_countries():
-    return [
-        {"code": k, "name": v["country_name"]} 
-        for k, v in VISA_REQUIREMENTS.items()
-    ]
+async def get_supported_countries(request: Request):
+    return STATIC_COUNTRIES.to_response(request)
@@ -0,0 +1,58 @@
+"""
+Build the prebuilt SQLite snapshot restored by database.restore_snapshot().
+
+Creates a fresh database with every table, the seed data and the schema
+version marker, so a process booting from it skips create/seed entirely.
+The snapshot is committed as data/university_system.snapshot.db and shipped
+with the Vercel function (vercel.json includeFiles). Rebuild and commit it
+whenever the models or seed change; tests/test_database_snapshot.py fails
+while it is stale (the marker is checked at startup, so a stale snapshot is
+still safe: it is simply re-initialized).
+
+Usage (from backend/):
+    python scripts/build_db_snapshot.py
+    python scripts/build_db_snapshot.py --output /path/to/snapshot.db --with-data
+"""
+
+import argparse
+import os
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+DEFAULT_OUTPUT = os.path.join(backend_dir, "data", "university_system.snapshot.db")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SQLite startup snapshot")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--with-data", action="store_true", help="Also load universities/scholarships from data/*.csv")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    if os.path.exists(output):
+        os.remove(output)
+    # database.py reads these at import time
+    os.environ["DATABASE_URL"] = f"sqlite:///{output}"
+    os.environ["DB_SNAPSHOT_PATH"] = ""
+
+    from sqlalchemy import text
+    from database import engine, init_database, read_schema_version
+
+    init_database(force=True)
+    if args.with_data:
+        os.chdir(backend_dir)  # migrate_data reads data/*.csv relative to backend/
+        from scripts.migrate_data import migrate_scholarships, migrate_universities
+        migrate_universities()
+        migrate_scholarships()
+
+    with engine.connect() as connection:
+        connection.execute(text("VACUUM"))
+    engine.dispose()
+    print(f"Snapshot written to {output} (schema version {read_schema_version()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Offline recommendation evaluation.
+
+Replays a logged query set through the /recommend handler (in-process, no
+HTTP) and scores the rankings with BatchRecommendationEvaluator: precision and
+recall @1/5/10, NDCG@10, MRR, MAP@10 and F1@10 over the whole set at once.
+
+The query log is JSON lines. Each line is either {"profile": {...},
+"relevant": ["University name", ...]} or a bare StudentProfile body (e.g. the
+output of generate_synthetic_data.py --profiles). Queries without labels are
+scored against silver labels: the catalog universities in the requested
+country whose field category matches and whose GPA and fee requirements the
+student meets. That is the same filter the /recommend rule fallback applies,
+so on silver labels the metrics mostly measure agreement with that filter,
+not relevance; the report carries a warning whenever they are used, and
+comparisons between changes should be made on gold ("relevant") labels.
+
+The LLM follows GroqService's configuration; set LLM_BACKEND=fake for a
+deterministic offline run. Pass --compare with an earlier report to print the
+per-metric deltas of a change.
+
+Usage (from backend/):
+    python scripts/evaluate_recommendations.py --queries data/synthetic/profiles.jsonl \\
+        --universities data/synthetic/universities.csv --output eval.json
+    python scripts/evaluate_recommendations.py --queries queries.jsonl --compare eval.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+import numpy as np
+
+from modules.evaluation_metrics import BatchRecommendationEvaluator
+from modules.field_taxonomy import field_categories, normalize_field
+from scripts.generate_synthetic_data import read_universities
+
+K_VALUES = [1, 5, 10]
+ANY_COUNTRY = {"", "all", "all europe", "select country"}
+ANY_FIELD = {"", "all", "all fields", "select field of study"}
+
+
+def load_queries(path):
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [
+        (record["profile"], record.get("relevant")) if "profile" in record else (record, None)
+        for record in records
+    ]
+
+
+class SilverLabeler:
+    """Relevant universities for an unlabelled profile, as column masks over the catalog"""
+
+    def __init__(self, catalog):
+        self.countries = np.array([str(u.get("country", "")).lower() for u in catalog])
+        self.min_gpa = np.array([float(u.get("min_gpa", 0)) for u in catalog])
+        self.fees = np.array([float(u.get("average_fees_eur", 0)) for u in catalog])
+        self.fields = [str(u.get("field", "")) for u in catalog]
+        self._category_masks = {}
+
+    def _category_mask(self, category):
+        mask = self._category_masks.get(category)
+        if mask is None:
+            mask = self._category_masks[category] = np.array([category in field_categories(f) for f in self.fields])
+        return mask
+
+    def relevant(self, profile):
+        """Catalog row indices relevant to the profile"""
+        mask = np.ones(len(self.fields), dtype=bool)
+        country = str(profile.get("country") or "").strip().lower()
+        if country not in ANY_COUNTRY:
+            mask &= self.countries == country
+        field = str(profile.get("field") or "").strip()
+        if field.lower() not in ANY_FIELD and field_categories(field):
+            mask &= self._category_mask(normalize_field(field))
+        gpa, budget = float(profile.get("gpa") or 0), float(profile.get("budget") or 0)
+        if gpa > 0:
+            mask &= self.min_gpa <= gpa
+        if budget > 0:
+            mask &= self.fees <= budget
+        return np.flatnonzero(mask)
+
+
+async def replay(recommend, profile_model, profiles):
+    """Ranked university names and engine per profile"""
+    rankings, engines = [], []
+    for profile in profiles:
+        response = await recommend(profile_model(**profile))
+        rankings.append([r["university"] for r in response.get("recommendations", [])])
+        engines.append(response.get("engine", response.get("status")))
+    return rankings, engines
+
+
+def evaluate(rankings, labels, depth):
+    """Encode university names as integer IDs and run the batch evaluator"""
+    ids = {}
+    encode = lambda names: [ids.setdefault(name, len(ids)) for name in names]
+    ranked = BatchRecommendationEvaluator.pad_rankings([encode(r) for r in rankings], depth=depth)
+    relevance, num_relevant = BatchRecommendationEvaluator.relevance_mask(ranked, [encode(l) for l in labels])
+    metrics = BatchRecommendationEvaluator.evaluate(relevance, num_relevant, K_VALUES)
+    summary = {f"precision@{k}": v for k, v in metrics.precision_at_k.items()}
+    summary.update({f"recall@{k}": v for k, v in metrics.recall_at_k.items()})
+    summary.update({f"ndcg@{K_VALUES[-1]}": metrics.ndcg, "mrr": metrics.mrr,
+                    f"map@{K_VALUES[-1]}": metrics.map_score, f"f1@{K_VALUES[-1]}": metrics.f1_score})
+    return {name: round(value, 6) for name, value in summary.items()}, int((num_relevant > 0).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay logged queries through /recommend and score the rankings")
+    parser.add_argument("--queries", required=True, help="JSON lines query log")
+    parser.add_argument("--universities", help="Catalog CSV to recommend from (default: the built-in catalog)")
+    parser.add_argument("--limit", type=int, help="Replay only the first N queries")
+    parser.add_argument("--depth", type=int, default=K_VALUES[-1], help="Ranked items kept per query")
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout)")
+    parser.add_argument("--compare", help="Earlier report to diff the metrics against")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries)[:args.limit]
+    import app as app_module
+    from app import StudentProfile, recommend
+    if args.universities:
+        app_module.UNIVERSITIES = read_universities(args.universities)
+    catalog = app_module.UNIVERSITIES
+
+    start = time.perf_counter()
+    # The handler prints debug lines per request; keep them out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        rankings, engines = asyncio.run(replay(recommend, StudentProfile, [profile for profile, _ in queries]))
+    replay_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labeler = None
+    labels = []
+    for profile, relevant in queries:
+        if relevant is None:
+            labeler = labeler or SilverLabeler(catalog)
+            relevant = [catalog[i]["university"] for i in labeler.relevant(profile)]
+        labels.append(relevant)
+    metrics, labelled = evaluate(rankings, labels, args.depth)
+    evaluation_seconds = time.perf_counter() - start
+
+    silver_labelled = sum(1 for _, relevant in queries if relevant is None)
+    report = {
+        "evaluation": "recommend",
+        "queries": len(queries),
+        "labelled_queries": labelled,
+        "silver_labelled": silver_labelled,
+        "catalog_size": len(catalog),
+        "engines": {engine: engines.count(engine) for engine in sorted(set(map(str, engines)))},
+        "replay_seconds": round(replay_seconds, 3),
+        "evaluation_seconds": round(evaluation_seconds, 3),
+        "metrics": metrics,
+    }
+    if silver_labelled:
+        report["warning"] = (
+            f"{silver_labelled} of {len(queries)} queries use silver labels built from the same country, "
+            "field, GPA and fee filter as the /recommend rule fallback; their scores measure agreement "
+            "with that filter rather than relevance. Compare changes on gold labels."
+        )
+        print(f"warning: {report['warning']}", file=sys.stderr)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f).get("metrics", {})
+    print(f"{'metric':<16}{'value':>10}" + (f"{'baseline':>10}{'delta':>10}" if baseline else ""), file=sys.stderr)
+    for name, value in metrics.items():
+        line = f"{name:<16}{value:>10.4f}"
+        if baseline and name in baseline:
+            line += f"{baseline[name]:>10.4f}{value - baseline[name]:>+10.4f}"
+        print(line, file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Generate synthetic universities, scholarships and student profiles for scale
+testing.
+
+Rows have the columns of db_models/university.py and db_models/scholarship.py
+(and of data/*.csv) and follow the shape of the real data: Germany and France
+dominate, technical universities mostly teach engineering/CS, business schools
+charge business-school fees, better-ranked institutions ask for higher GPAs,
+and scholarship amounts follow their coverage. Profiles are skewed the same
+way demand is (CS/AI and Germany far ahead of the long tail).
+
+Everything is a generator written out in batches, so memory stays flat
+whatever the row count (10M rows is fine), and a given --seed always produces
+the same files.
+
+Usage (from backend/):
+    python scripts/generate_synthetic_data.py --universities 1000000 --scholarships 100000 --profiles 50000
+    python scripts/generate_synthetic_data.py --universities 10000000 --output-dir /data/synthetic --seed 7
+    python scripts/generate_synthetic_data.py --universities 100000 --database-url sqlite:///synthetic.db --replace
+"""
+
+import argparse
+import bisect
+import csv
+import itertools
+import json
+import math
+import operator
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+UNIVERSITY_COLUMNS = ["university", "country", "city", "field", "min_gpa", "min_ielts",
+                      "average_fees_eur", "ranking", "course_url"]
+SCHOLARSHIP_COLUMNS = ["scholarship_name", "country", "eligible_universities", "coverage",
+                       "amount_eur", "eligibility", "website_url"]
+BATCH_SIZE = 10_000
+
+# country: (catalog weight, demand weight, cities, typical public tuition per year in EUR)
+COUNTRIES = {
+    "Germany": (18, 26, ["Berlin", "Munich", "Aachen", "Hamburg", "Heidelberg", "Stuttgart"], (0, 1500, 3000)),
+    "France": (14, 15, ["Paris", "Lyon", "Grenoble", "Toulouse", "Lille"], (3800, 8000, 12000)),
+    "Netherlands": (9, 12, ["Amsterdam", "Delft", "Utrecht", "Rotterdam", "Eindhoven"], (12000, 14000, 16000)),
+    "Italy": (9, 8, ["Milan", "Bologna", "Rome", "Padua", "Turin"], (1500, 3000, 4000)),
+    "Spain": (8, 7, ["Madrid", "Barcelona", "Valencia", "Seville"], (2500, 3000, 4500)),
+    "Sweden": (6, 5, ["Stockholm", "Lund", "Uppsala", "Gothenburg"], (10000, 13000, 15000)),
+    "Switzerland": (4, 4, ["Zurich", "Lausanne", "Geneva", "Basel"], (1500, 1500, 4000)),
+    "Belgium": (5, 3, ["Leuven", "Ghent", "Brussels", "Antwerp"], (1000, 1500, 4000)),
+    "Finland": (4, 3, ["Helsinki", "Espoo", "Tampere", "Turku"], (10000, 12000, 13000)),
+    "Austria": (4, 3, ["Vienna", "Graz", "Innsbruck"], (1500, 1500, 3000)),
+    "Denmark": (3, 2, ["Copenhagen", "Aarhus", "Odense"], (8000, 12000, 15000)),
+    "Norway": (3, 2, ["Oslo", "Bergen", "Trondheim"], (0, 0, 15000)),
+    "Ireland": (3, 3, ["Dublin", "Cork", "Galway"], (12000, 16000, 20000)),
+    "Portugal": (3, 2, ["Lisbon", "Porto", "Coimbra"], (1000, 3000, 7000)),
+    "Poland": (4, 2, ["Warsaw", "Krakow", "Wroclaw"], (2000, 3000, 4000)),
+    "Czech Republic": (3, 1, ["Prague", "Brno"], (0, 3000, 6000)),
+}
+
+# Category labels used by modules/field_taxonomy.py, with demand weights
+FIELDS = {
+    "Computer Science / AI": 24, "Engineering": 16, "Data Science": 13, "Business / MBA": 14,
+    "Medicine / Healthcare": 7, "Natural Sciences": 5, "Social Sciences": 5, "Law & Legal Studies": 4,
+    "Architecture & Design": 3, "Psychology": 3, "Arts / Humanities": 2, "Education": 2,
+    "Hospitality & Tourism": 2,
+}
+SPECIALIZATIONS = {
+    "Computer Science / AI": ["Machine Learning", "Software Engineering", "Cybersecurity", "Robotics"],
+    "Engineering": ["Mechanical", "Electrical", "Civil", "Aerospace", "Automotive"],
+    "Data Science": ["Analytics", "Big Data", "Statistics"],
+    "Business / MBA": ["Finance", "Marketing", "Luxury Management", "Entrepreneurship"],
+    "Medicine / Healthcare": ["Public Health", "Biomedical", "Nursing"],
+    "Natural Sciences": ["Physics", "Molecular Biology", "Chemistry"],
+}
+
+# (name pattern, catalog weight, field weights, fee multiplier)
+INSTITUTION_TYPES = [
+    ("University of {city}", 40, FIELDS, 1.0),
+    ("Technical University of {city}", 22, {"Engineering": 5, "Computer Science / AI": 5, "Data Science": 3,
+                                            "Natural Sciences": 1, "Architecture & Design": 1}, 1.0),
+    ("{city} University of Applied Sciences", 16, {"Engineering": 3, "Computer Science / AI": 3, "Business / MBA": 2,
+                                                   "Hospitality & Tourism": 1, "Education": 1}, 1.2),
+    ("{city} School of Management", 10, {"Business / MBA": 6, "Data Science": 1, "Social Sciences": 1}, 4.0),
+    ("{city} Medical University", 6, {"Medicine / Healthcare": 5, "Psychology": 1, "Natural Sciences": 1}, 1.5),
+    ("{city} Academy of Fine Arts", 6, {"Arts / Humanities": 3, "Architecture & Design": 3}, 1.2),
+]
+
+SCHOLARSHIP_PROVIDERS = {
+    "Germany": ["DAAD", "Deutschlandstipendium", "Heinrich Boell Foundation"],
+    "France": ["Eiffel Excellence", "Charpak", "Ile-de-France Region"],
+    "Netherlands": ["Orange Tulip", "Holland", "Amsterdam Excellence"],
+    "Italy": ["Italian Government", "Regional DSU", "Invest Your Talent"],
+    "Spain": ["MAEC-AECID", "La Caixa Foundation"],
+    "Sweden": ["Swedish Institute", "KTH Tuition Fee Waiver"],
+    "Switzerland": ["Swiss Government Excellence", "ETH Excellence"],
+}
+COVERAGES = {"Full": 3, "Partial": 5, "Tuition Waiver": 2}
+ELIGIBILITY = {"Merit-based": 6, "Need-based": 2, "International Students": 2, "Developing Countries": 1,
+               "Women in STEM": 1, "EU Students": 1}
+ELIGIBLE_UNIVERSITIES = ["Public Universities", "Partner Universities", "Selected Universities",
+                         "All Accredited Institutions"]
+
+
+class _Weighted:
+    """Weighted choice with the cumulative weights computed once (random.choices re-validates per call)"""
+
+    def __init__(self, table: Dict):
+        self.values = list(table)
+        self.cum_weights = list(itertools.accumulate(table.values()))
+        self.total = self.cum_weights[-1]
+
+    def draw(self, rng: random.Random):
+        return self.values[bisect.bisect(self.cum_weights, rng.random() * self.total)]
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def generate_universities(count: int, seed: int = 42) -> Iterator[Dict]:
+    rng = random.Random(f"universities:{seed}")
+    countries = _Weighted({name: spec[0] for name, spec in COUNTRIES.items()})
+    types = _Weighted({i: t[1] for i, t in enumerate(INSTITUTION_TYPES)})
+    type_fields = [_Weighted(t[2]) for t in INSTITUTION_TYPES]
+    field_slugs = {field: _slug(field) for field in FIELDS}
+    institutions = {}  # (kind, city) -> (name, url slug); formatting per row dominates otherwise
+    for i in range(count):
+        country = countries.draw(rng)
+        _, _, cities, fees = COUNTRIES[country]
+        city = rng.choice(cities)
+        kind = types.draw(rng)
+        pattern, _, _, fee_multiplier = INSTITUTION_TYPES[kind]
+        field = type_fields[kind].draw(rng)
+
+        # Log-normal ranking: median ~150, a few top-20 institutions, a long tail
+        ranking = min(2000, max(1, int(rng.lognormvariate(5.0, 1.0))))
+        prestige = 1 - math.log10(ranking) / math.log10(2000)
+        min_gpa = round(min(3.9, max(2.5, 2.7 + 1.1 * prestige + rng.gauss(0, 0.15))), 1)
+        min_ielts = min(8.0, max(5.5, round((5.5 + 2.0 * prestige + rng.gauss(0, 0.3)) * 2) / 2))
+        fee = rng.choice(fees) * fee_multiplier * rng.uniform(0.85, 1.25)
+        if prestige > 0.8 and fee_multiplier > 1:
+            fee *= 2  # top business/medical schools
+        institution = institutions.get((kind, city))
+        if institution is None:
+            base = pattern.format(city=city)
+            institution = institutions[(kind, city)] = (base, _slug(base))
+
+        yield {
+            "university": f"{institution[0]} - Campus {i + 1}",
+            "country": country,
+            "city": city,
+            "field": field,
+            "min_gpa": min_gpa,
+            "min_ielts": min_ielts,
+            "average_fees_eur": float(round(fee / 500) * 500),
+            "ranking": ranking,
+            "course_url": f"https://www.{institution[1]}.example.edu/{i + 1}/{field_slugs[field]}",
+        }
+
+
+def generate_scholarships(count: int, seed: int = 42) -> Iterator[Dict]:
+    rng = random.Random(f"scholarships:{seed}")
+    countries = _Weighted({**{name: spec[0] for name, spec in COUNTRIES.items()}, "Europe": 4})
+    coverages = _Weighted(COVERAGES)
+    eligibility = _Weighted(ELIGIBILITY)
+    for i in range(count):
+        country = countries.draw(rng)
+        providers = SCHOLARSHIP_PROVIDERS.get(country) or (["Erasmus+"] if country == "Europe" else [f"{country} Government"])
+        provider = rng.choice(providers)
+        coverage = coverages.draw(rng)
+        if coverage == "Full":
+            amount = rng.uniform(10000, 18000)
+        elif coverage == "Partial":
+            amount = rng.uniform(2500, 9000)
+        else:
+            amount = rng.uniform(2000, 15000)
+        yield {
+            "scholarship_name": f"{provider} Scholarship {i + 1}",
+            "country": country,
+            "eligible_universities": rng.choice(ELIGIBLE_UNIVERSITIES),
+            "coverage": coverage,
+            "amount_eur": float(round(amount / 100) * 100),
+            "eligibility": eligibility.draw(rng),
+            "website_url": f"https://scholarships.example.org/{_slug(provider)}/{i + 1}",
+        }
+
+
+def generate_profiles(count: int, seed: int = 42) -> Iterator[Dict]:
+    """StudentProfile request bodies with demand-shaped country/field skew"""
+    rng = random.Random(f"profiles:{seed}")
+    countries = _Weighted({name: spec[1] for name, spec in COUNTRIES.items()})
+    fields = _Weighted(FIELDS)
+    ielts = _Weighted({5.5: 1, 6.0: 3, 6.5: 5, 7.0: 5, 7.5: 3, 8.0: 1})
+    for _ in range(count):
+        field = fields.draw(rng)
+        yield {
+            "gpa": round(min(4.0, max(2.0, rng.gauss(3.3, 0.35))), 2),
+            "ielts": ielts.draw(rng),
+            "budget": float(round(min(80000, rng.lognormvariate(9.6, 0.6)) / 1000) * 1000),
+            # a fifth of students are open to any country
+            "country": countries.draw(rng) if rng.random() > 0.2 else "All Europe",
+            "field": field,
+            "specialization": rng.choice(SPECIALIZATIONS.get(field, [""])),
+        }
+
+
+def _batches(rows: Iterable[Dict], size: int = BATCH_SIZE) -> Iterator[List[Dict]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def write_csv(path: str, rows: Iterable[Dict], columns: List[str]) -> int:
+    written = 0
+    values = operator.itemgetter(*columns)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for batch in _batches(rows):
+            writer.writerows(map(values, batch))
+            written += len(batch)
+    return written
+
+
+def write_jsonl(path: str, rows: Iterable[Dict]) -> int:
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for batch in _batches(rows):
+            f.write("".join(json.dumps(row) + "\n" for row in batch))
+            written += len(batch)
+    return written
+
+
+def read_universities(path: str) -> List[Dict]:
+    """universities.csv rows typed like app.UNIVERSITIES (the counterpart of write_csv)"""
+    with open(path, encoding="utf-8") as f:
+        return [
+            {**row, "min_gpa": float(row["min_gpa"]), "min_ielts": float(row["min_ielts"]),
+             "average_fees_eur": float(row["average_fees_eur"]), "ranking": int(row["ranking"])}
+            for row in csv.DictReader(f)
+        ]
+
+
+def insert_rows(engine, table, rows: Iterable[Dict], replace: bool = False) -> int:
+    """Bulk INSERT in batches (one executemany per batch, no ORM objects)"""
+    written = 0
+    with engine.begin() as connection:
+        if replace:
+            connection.execute(table.delete())
+        for batch in _batches(rows):
+            connection.execute(table.insert(), batch)
+            written += len(batch)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic catalogs and profile workloads")
+    parser.add_argument("--universities", type=int, default=10000)
+    parser.add_argument("--scholarships", type=int, default=1000)
+    parser.add_argument("--profiles", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=os.path.join(backend_dir, "data", "synthetic"))
+    parser.add_argument("--database-url", help="Also insert the catalog rows into this database")
+    parser.add_argument("--replace", action="store_true", help="Delete existing catalog rows before inserting")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs = [
+        ("universities.csv", lambda path: write_csv(path, generate_universities(args.universities, args.seed),
+                                                    UNIVERSITY_COLUMNS)),
+        ("scholarships.csv", lambda path: write_csv(path, generate_scholarships(args.scholarships, args.seed),
+                                                    SCHOLARSHIP_COLUMNS)),
+        ("profiles.jsonl", lambda path: write_jsonl(path, generate_profiles(args.profiles, args.seed))),
+    ]
+    for filename, write in outputs:
+        path = os.path.join(args.output_dir, filename)
+        start = time.perf_counter()
+        rows = write(path)
+        print(f"{path}: {rows} rows in {time.perf_counter() - start:.1f}s")
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ["DB_SNAPSHOT_PATH"] = ""
+        from database import create_db_and_tables, engine
+        from db_models.scholarship import Scholarship
+        from db_models.university import University
+
+        create_db_and_tables()
+        for model, rows in ((University, generate_universities(args.universities, args.seed)),
+                            (Scholarship, generate_scholarships(args.scholarships, args.seed))):
+            start = time.perf_counter()
+            count = insert_rows(engine, model.__table__, rows, replace=args.replace)
+            print(f"{model.__tablename__}: {count} rows inserted in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Catalog Service
+---------------
+Paginated, field-projected views of the static university catalog.
+
+Every distinct page (offset, limit, fields) is serialized once per catalog
+version and kept in a small LRU, so repeated polls are served as ready-made
+bytes with a strong ETag (and 304s when the client already has them), already
+compressed for gzip/brotli clients.
+
+Usage:
+from services.catalog_service import CatalogService
+catalog = CatalogService(UNIVERSITIES, "universities")
+response = catalog.page(offset=0, limit=20, fields="university,country").to_response(request)
+"""
+
+import base64
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.metrics_service import metrics_service
+from utils.response_cache import PrecomputedResponse, serialize_json
+
+
+class CatalogService:
+    """Serves one immutable list of records as cacheable pages"""
+
+    MAX_CACHED_PAGES = 256
+    MAX_PAGE_SIZE = 1000
+
+    def __init__(self, records: List[Dict[str, Any]], name: str):
+        self.records = records
+        self.name = name
+        self.field_names = list(dict.fromkeys(k for r in records for k in r))
+        self.version = hashlib.sha256(serialize_json(records)).hexdigest()[:16]
+        self._pages: "OrderedDict[Tuple, PrecomputedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.page()  # the unpaginated catalog is the most requested view
+
+    # ---------- Cursors ----------
+    def encode_cursor(self, offset: int) -> str:
+        raw = json.dumps({"o": offset, "v": self.version}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> int:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            offset, version = int(data["o"]), data["v"]
+        except Exception:
+            raise ValueError("Invalid cursor")
+        if version != self.version:
+            raise ValueError("Cursor belongs to an older catalog version; restart pagination")
+        return offset
+
+    def parse_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        if not fields:
+            return None
+        requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in self.field_names]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(self.field_names)}")
+        return requested or None
+
+    # ---------- Pages ----------
+    def page(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> PrecomputedResponse:
+        """Precomputed response for a page; limit=None returns the whole catalog"""
+        if cursor:
+            offset = self.decode_cursor(cursor)
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        # Every offset past the end is the same empty page: one cache entry, not one per offset
+        offset = min(offset, len(self.records))
+        if limit is not None and not 1 <= limit <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {self.MAX_PAGE_SIZE}")
+        projection = self.parse_fields(fields)
+
+        key = (offset, limit, projection)
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None:
+                self._pages.move_to_end(key)
+        metrics_service.record_cache(f"{self.name}_pages", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        response = PrecomputedResponse(self._build_payload(offset, limit, projection), compress=True)
+        with self._lock:
+            self._pages[key] = response
+            if len(self._pages) > self.MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        return response
+
+    def _build_payload(self, offset: int, limit: Optional[int], projection: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        total = len(self.records)
+        end = total if limit is None else min(offset + limit, total)
+        items = self.records[offset:end]
+        if projection:
+            items = [{f: r.get(f) for f in projection} for r in items]
+
+        payload = {
+            "status": "success",
+            self.name: items,
+            "total": total,
+            "catalog_version": self.version,
+        }
+        if limit is not None:
+            payload.update({
+                "offset": offset,
+                "limit": limit,
+                "next_cursor": self.encode_cursor(end) if end < total else None,
+            })
+        return payload
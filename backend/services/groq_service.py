@@ -1,39 +1,79 @@
 import os
-from groq import Groq
+import time
 from dotenv import load_dotenv
+from services.llm_backends import LLMBackend, backend_from_env
+from services.metrics_service import metrics_service
+from utils.tracing import SPAN_KIND_CLIENT, span
 
 load_dotenv()
 
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant for international students applying to European universities."
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
 class GroqService:
-    def __init__(self):
+    def __init__(self, backend: LLMBackend = None):
         self.api_key = os.getenv("GROQ_API_KEY")
-        if self.api_key:
-            self.client = Groq(api_key=self.api_key)
-        else:
-            self.client = None
+        # Groq by default; LLM_BACKEND=fake swaps in the offline stand-in (services/llm_backends.py)
+        self.backend = backend or backend_from_env(self.api_key)
+
+    def use_backend(self, backend: LLMBackend) -> None:
+        self.backend = backend
+
+    @property
+    def client(self):
+        # Truthy when an LLM is configured; callers fall back to templates otherwise
+        return self.backend.client
 
-    async def generate_response(self, prompt: str, system_prompt: str = "You are a helpful assistant for international students applying to European universities.", model: str = "llama-3.3-70b-versatile"):
+    @staticmethod
+    def _messages(prompt: str, system_prompt: str):
+        return [
+            {
+                "role": "system",
+                "content": system_prompt,
+            },
+            {
+                "role": "user",
+                "content": prompt,
+            }
+        ]
+
+    async def generate_response(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT, model: str = DEFAULT_MODEL):
         if not self.client:
+            metrics_service.groq_requests.inc(model, "unconfigured")
             return None
-        
+
+        start = time.perf_counter()
+        with span("groq.chat_completion", SPAN_KIND_CLIENT, **{
+            "gen_ai.system": self.backend.name, "gen_ai.request.model": model, "prompt_chars": len(prompt),
+        }) as call:
+            try:
+                content = await self.backend.complete(self._messages(prompt, system_prompt), model, temperature=0.7)
+                metrics_service.groq_requests.inc(model, "success")
+                call.set_attribute("response_chars", len(content or ""))
+                return content
+            except Exception as e:
+                metrics_service.groq_requests.inc(model, "error")
+                call.record_exception(e)
+                print(f"Error calling Groq API: {e}")
+                return None
+            finally:
+                metrics_service.groq_latency.observe(model, value=time.perf_counter() - start)
+
+    async def stream_response(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT, model: str = DEFAULT_MODEL):
+        """Yield the response in chunks as they arrive (nothing if unconfigured or on error)"""
+        if not self.client:
+            metrics_service.groq_requests.inc(model, "unconfigured")
+            return
+
+        start = time.perf_counter()
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=model,
-                temperature=0.7,
-            )
-            return chat_completion.choices[0].message.content
+            async for chunk in self.backend.stream(self._messages(prompt, system_prompt), model, temperature=0.7):
+                yield chunk
+            metrics_service.groq_requests.inc(model, "success")
         except Exception as e:
-            print(f"Error calling Groq API: {e}")
-            return None
+            metrics_service.groq_requests.inc(model, "error")
+            print(f"Error streaming from Groq API: {e}")
+        finally:
+            metrics_service.groq_latency.observe(model, value=time.perf_counter() - start)
 
 groq_service = GroqService()
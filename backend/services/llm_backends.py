@@ -0,0 +1,197 @@
+"""
+LLM Backends
+------------
+The chat-completion providers GroqService can delegate to:
+
+- GroqBackend: the Groq API (llama-3.3-70b-versatile by default)
+- FakeLLMBackend: a local, deterministic stand-in for offline load testing.
+  Its responses follow what each caller parses: a JSON array of
+  {university, match_score, reason} for the /recommend prompt, a multi-paragraph
+  letter for SOP prompts, a short summary for resume prompts and a plain answer
+  otherwise. The same prompt always gets the same text. Latency (log-normal
+  time to first token plus a fixed token rate), injected errors and streaming
+  speed are configurable and drawn from a seeded RNG, so load tests are
+  repeatable.
+
+LLM_BACKEND=fake selects the fake at startup, tuned with FAKE_LLM_LATENCY_MS
+(median time to first token), FAKE_LLM_LATENCY_SIGMA (log-normal spread, 0 for
+a fixed latency), FAKE_LLM_TOKENS_PER_SECOND, FAKE_LLM_ERROR_RATE and
+FAKE_LLM_SEED.
+
+Usage:
+from services.llm_backends import FakeLLMBackend
+groq_service.use_backend(FakeLLMBackend(latency_ms=300, error_rate=0.02))
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List
+
+Messages = List[Dict[str, str]]
+
+
+class LLMBackendError(RuntimeError):
+    """A completion failed (provider error, or an error injected by the fake)"""
+
+
+class LLMBackend(ABC):
+    """Interface: `client` is truthy when the backend can serve requests"""
+
+    name = "base"
+
+    @property
+    def client(self):
+        return None
+
+    @abstractmethod
+    async def complete(self, messages: Messages, model: str, temperature: float = 0.7) -> str:
+        """Full response text for a chat completion"""
+
+    async def stream(self, messages: Messages, model: str, temperature: float = 0.7) -> AsyncIterator[str]:
+        """Response text in chunks; backends without streaming yield it whole"""
+        yield await self.complete(messages, model, temperature)
+
+
+class GroqBackend(LLMBackend):
+    name = "groq"
+
+    def __init__(self, api_key: str = None):
+        self.api_key = api_key
+        self._client = None
+
+    @property
+    def client(self):
+        # The Groq SDK is imported on first use so that importing the service
+        # (every AI router does) stays cheap on serverless cold starts
+        if self._client is None and self.api_key:
+            from groq import Groq
+            self._client = Groq(api_key=self.api_key)
+        return self._client
+
+    async def complete(self, messages: Messages, model: str, temperature: float = 0.7) -> str:
+        # The SDK client is synchronous; keep the event loop free while it waits
+        chat_completion = await asyncio.to_thread(
+            self.client.chat.completions.create, messages=messages, model=model, temperature=temperature
+        )
+        return chat_completion.choices[0].message.content
+
+    async def stream(self, messages: Messages, model: str, temperature: float = 0.7) -> AsyncIterator[str]:
+        chunks = await asyncio.to_thread(
+            self.client.chat.completions.create, messages=messages, model=model, temperature=temperature, stream=True
+        )
+        iterator = iter(chunks)
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, None)
+            if chunk is None:
+                return
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+
+class FakeLLMBackend(LLMBackend):
+    name = "fake"
+
+    # "- {university} ({country}): Offers ..." lines of the /recommend prompt
+    CANDIDATE = re.compile(r"^- (.+) \([^()]*\): Offers", re.MULTILINE)
+    QUESTION = re.compile(r"Student Question: (.+)", re.DOTALL)
+    TOKEN = re.compile(r"\S+\s*")
+
+    def __init__(self, latency_ms: float = 800.0, latency_sigma: float = 0.5, tokens_per_second: float = 50.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMBackend":
+        return cls(
+            latency_ms=float(os.getenv("FAKE_LLM_LATENCY_MS", "800")),
+            latency_sigma=float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0.5")),
+            tokens_per_second=float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "50")),
+            error_rate=float(os.getenv("FAKE_LLM_ERROR_RATE", "0")),
+            seed=int(os.getenv("FAKE_LLM_SEED", "0")),
+        )
+
+    @property
+    def client(self):
+        return self
+
+    # ---------- Behaviour ----------
+    def _draw(self):
+        """(time to first token in seconds, fail?) for one call"""
+        with self._lock:
+            if self.latency_ms <= 0:
+                first_token = 0.0
+            elif self.latency_sigma > 0:
+                first_token = self._rng.lognormvariate(0.0, self.latency_sigma) * self.latency_ms / 1000
+            else:
+                first_token = self.latency_ms / 1000
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return first_token, fail
+
+    def _token_delay(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def respond(self, messages: Messages) -> str:
+        """Deterministic, caller-shaped text for the last user message"""
+        prompt = messages[-1]["content"]
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+
+        if "Candidate Universities:" in prompt:
+            picks = self.CANDIDATE.findall(prompt)[:5]
+            return json.dumps([
+                {"university": name, "match_score": round(0.95 - i * 0.08 - digest[i] / 2550, 2),
+                 "reason": f"Program content aligns with the requested field (fake match {digest[i] % 100})."}
+                for i, name in enumerate(picks)
+            ])
+        if "Statement of Purpose" in prompt:
+            return "\n\n".join(
+                f"Paragraph {i + 1}. " + " ".join(["This is deterministic placeholder text for load testing."] * 4)
+                for i in range(4 + digest[0] % 2)
+            )
+        if "resume summary" in prompt:
+            return ("Results-driven professional with a record of delivering measurable outcomes. "
+                    "Combines strong technical skills with international collaboration experience. "
+                    "Seeking to contribute to a leading European organisation.")
+        question = self.QUESTION.search(prompt)
+        topic = (question.group(1) if question else prompt).strip()[:200]
+        return (f"Here is an overview regarding: {topic} "
+                f"Check the official university and embassy pages for current requirements. (ref {digest.hex()[:8]})")
+
+    async def complete(self, messages: Messages, model: str, temperature: float = 0.7) -> str:
+        first_token, fail = self._draw()
+        text = self.respond(messages)
+        await asyncio.sleep(first_token)
+        if fail:
+            raise LLMBackendError("Injected fake LLM failure")
+        # Generation time, as if all tokens had been streamed
+        await asyncio.sleep(len(self.TOKEN.findall(text)) * self._token_delay())
+        return text
+
+    async def stream(self, messages: Messages, model: str, temperature: float = 0.7) -> AsyncIterator[str]:
+        first_token, fail = self._draw()
+        text = self.respond(messages)
+        await asyncio.sleep(first_token)
+        if fail:
+            raise LLMBackendError("Injected fake LLM failure")
+        delay = self._token_delay()
+        for token in self.TOKEN.findall(text):
+            yield token
+            if delay:
+                await asyncio.sleep(delay)
+
+
+def backend_from_env(api_key: str = None) -> LLMBackend:
+    if os.getenv("LLM_BACKEND", "groq").lower() == "fake":
+        return FakeLLMBackend.from_env()
+    return GroqBackend(api_key)
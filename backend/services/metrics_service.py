@@ -0,0 +1,286 @@
+"""
+Metrics Service
+---------------
+In-process counters, gauges and histograms exposed in the Prometheus text
+exposition format (version 0.0.4), without a client library dependency.
+
+Collected:
+- HTTP: requests by route/method/status, latency histograms, in-flight gauge
+  (recorded by utils.asgi_middleware.MetricsMiddleware)
+- Caches: hit/miss counters per cache plus lru_cache statistics
+- Groq: call latency and outcome counters
+- Database: connection pool stats (only once the database module is loaded)
+
+Usage:
+from services.metrics_service import metrics_service
+metrics_service.record_cache("catalog_pages", hit=True)
+text = metrics_service.render()
+"""
+
+import bisect
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+GROQ_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class: one metric family with a fixed label set"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        super().__init__(name, documentation, labels)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self.values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self.values[labels] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self.series: Dict[LabelValues, list] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def snapshot(self, *labels: str) -> Optional[Tuple[List[int], float]]:
+        with self._lock:
+            series = self.series.get(labels)
+            return (list(series[0]), series[1]) if series else None
+
+    def quantile(self, q: float, *labels: str) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (Prometheus-style estimate)"""
+        snapshot = self.snapshot(*labels)
+        if not snapshot or not sum(snapshot[0]):
+            return None
+        counts, _ = snapshot
+        target = q * sum(counts)
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1])) for labels, s in self.series.items())
+        lines = self.header()
+        for labels, (counts, total) in items:
+            running = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {running}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {repr(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {running}")
+        return lines
+
+
+class MetricsService:
+    """Registry of the application's metrics plus scrape-time collectors"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.http_requests = Counter(
+            "http_requests_total", "HTTP requests by route template, method and status", ("route", "method", "status"))
+        self.http_latency = Histogram(
+            "http_request_duration_seconds", "Time until the response finished, by route", ("route", "method"))
+        self.http_in_flight = Gauge(
+            "http_requests_in_flight", "Requests currently being served", ("method",))
+        self.cache_requests = Counter(
+            "cache_requests_total", "Cache lookups by cache and result (hit/miss)", ("cache", "result"))
+        self.groq_requests = Counter(
+            "groq_requests_total", "Groq chat completions by model and outcome", ("model", "outcome"))
+        self.groq_latency = Histogram(
+            "groq_request_duration_seconds", "Groq chat completion latency", ("model",), buckets=GROQ_BUCKETS)
+        self._metrics: List[Metric] = [
+            self.http_requests, self.http_latency, self.http_in_flight,
+            self.cache_requests, self.groq_requests, self.groq_latency,
+        ]
+        self._collectors: List[Callable[[], List[Metric]]] = [
+            self._collect_cache_ratios, self._collect_lru_caches, self._collect_db_pool,
+        ]
+        self._lru_caches: Dict[str, Callable] = {}
+
+    # ---------- Recording ----------
+    def record_cache(self, cache: str, hit: bool) -> None:
+        self.cache_requests.inc(cache, "hit" if hit else "miss")
+
+    def register_lru_cache(self, name: str, cached_function: Callable) -> None:
+        """Expose a functools.lru_cache's cache_info() at scrape time"""
+        self._lru_caches[name] = cached_function
+
+    def register_collector(self, collector: Callable[[], List[Metric]]) -> None:
+        self._collectors.append(collector)
+
+    # ---------- Scrape-time collectors ----------
+    def _cache_totals(self) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, Dict[str, float]] = {}
+        with self.cache_requests._lock:
+            for (cache, result), value in self.cache_requests.values.items():
+                totals.setdefault(cache, {"hit": 0.0, "miss": 0.0})[result] = value
+        for name, function in self._lru_caches.items():
+            info = function.cache_info()
+            totals[name] = {"hit": info.hits, "miss": info.misses}
+        return totals
+
+    def _collect_cache_ratios(self) -> List[Metric]:
+        ratio = Gauge("cache_hit_ratio", "Hits / lookups since process start", ("cache",))
+        for cache, counts in self._cache_totals().items():
+            lookups = counts["hit"] + counts["miss"]
+            if lookups:
+                ratio.set(cache, value=counts["hit"] / lookups)
+        return [ratio]
+
+    def _collect_lru_caches(self) -> List[Metric]:
+        lookups = Counter("lru_cache_requests_total", "functools.lru_cache lookups by result", ("cache", "result"))
+        size = Gauge("lru_cache_entries", "functools.lru_cache current size", ("cache",))
+        for name, function in self._lru_caches.items():
+            info = function.cache_info()
+            lookups.inc(name, "hit", amount=info.hits)
+            lookups.inc(name, "miss", amount=info.misses)
+            size.set(name, value=info.currsize)
+        return [lookups, size]
+
+    def _collect_db_pool(self) -> List[Metric]:
+        # Only report once the app has imported the database module, so a
+        # scrape never pulls SQLAlchemy into a lightweight process
+        database = sys.modules.get("database")
+        pool = getattr(getattr(database, "engine", None), "pool", None)
+        if pool is None:
+            return []
+        stats = Gauge("db_pool_connections", "SQLAlchemy pool connections by state", ("state",))
+        for state, method in (("size", "size"), ("checked_out", "checkedout"),
+                              ("checked_in", "checkedin"), ("overflow", "overflow")):
+            if hasattr(pool, method):
+                stats.set(state, value=getattr(pool, method)())
+        return [stats]
+
+    # ---------- Exposition ----------
+    def collect(self) -> List[Metric]:
+        collected = list(self._metrics)
+        for collector in self._collectors:
+            try:
+                collected.extend(collector())
+            except Exception as e:
+                print(f"Metrics collector failed: {e}")
+        return collected
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format"""
+        uptime = Gauge("process_uptime_seconds", "Seconds since the metrics service started")
+        uptime.set(value=time.time() - self.started_at)
+        lines = []
+        for metric in self.collect() + [uptime]:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict:
+        """JSON-friendly per-route view (counts, errors, p50/p95/p99 bucket bounds)"""
+        routes: Dict[str, Dict] = {}
+        with self.http_requests._lock:
+            request_items = list(self.http_requests.values.items())
+        for (route, method, status), count in request_items:
+            entry = routes.setdefault(f"{method} {route}", {"requests": 0, "errors": 0})
+            entry["requests"] += int(count)
+            if status.startswith("5"):
+                entry["errors"] += int(count)
+        for key, entry in routes.items():
+            method, route = key.split(" ", 1)
+            snapshot = self.http_latency.snapshot(route, method)
+            if snapshot:
+                entry["mean_ms"] = round(snapshot[1] / max(sum(snapshot[0]), 1) * 1000, 2)
+            for q in (0.5, 0.95, 0.99):
+                bound = self.http_latency.quantile(q, route, method)
+                entry[f"p{int(q * 100)}_le_ms"] = None if bound in (None, float("inf")) else bound * 1000
+
+        with self.http_in_flight._lock:
+            in_flight = int(sum(self.http_in_flight.values.values()))
+        groq = {}
+        with self.groq_requests._lock:
+            for (model, outcome), count in self.groq_requests.values.items():
+                groq.setdefault(model, {})[outcome] = int(count)
+
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "in_flight": in_flight,
+            "routes": routes,
+            "caches": {
+                cache: {**{k: int(v) for k, v in counts.items()},
+                        "hit_ratio": round(counts["hit"] / (counts["hit"] + counts["miss"]), 4)
+                        if counts["hit"] + counts["miss"] else None}
+                for cache, counts in self._cache_totals().items()
+            },
+            "groq": groq,
+        }
+
+
+metrics_service = MetricsService()
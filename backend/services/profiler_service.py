@@ -0,0 +1,175 @@
+"""
+Profiler Service
+----------------
+On-demand profiling of the live process, for a worker that is slow right now.
+
+- CPU: a statistical sampler that snapshots every thread's stack with
+  sys._current_frames() at a fixed interval. Unlike cProfile it sees the event
+  loop and the threadpool at once and adds no per-call overhead to them; the
+  result is folded into collapsed stacks ("frame;frame;frame count" lines),
+  the input format of flamegraph.pl, speedscope and inferno.
+- Memory: a tracemalloc snapshot grouped by source line. If tracemalloc was
+  not already running it is started for the sampling window, so only
+  allocations made during the window (and still alive) are reported.
+
+One profile runs at a time. profile() only blocks the thread that calls it
+(the admin route runs it in the threadpool), so the worker keeps serving
+requests while it is being profiled.
+
+Usage:
+from services.profiler_service import profiler_service
+result = profiler_service.profile(seconds=5, interval=0.005)
+print(result.collapsed())
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional
+
+MAX_SECONDS = 60.0
+MIN_INTERVAL = 0.001
+MAX_STACK_DEPTH = 128
+TRACEMALLOC_FRAMES = 25
+# Innermost frames of a thread waiting for work (event loop select, idle pool workers)
+IDLE_FRAMES = frozenset(("select", "poll", "wait", "accept", "acquire", "get", "sleep"))
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+def _frame_label(code) -> str:
+    # ';' separates frames in the collapsed format (the count follows the last space)
+    filename = os.path.basename(code.co_filename) or "?"
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _is_idle(label: str) -> bool:
+    return label.split(" (", 1)[0] in IDLE_FRAMES
+
+
+class ProfileResult:
+    """Folded stack counts plus an optional allocation report"""
+
+    def __init__(self, stacks: Counter, samples: int, seconds: float, interval: float,
+                 allocations: Optional[Dict] = None):
+        self.stacks = stacks
+        self.samples = samples
+        self.seconds = seconds
+        self.interval = interval
+        self.allocations = allocations
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded format, heaviest stacks first"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, limit: int = 20) -> List[Dict]:
+        """Self time: how often each frame was on top of a stack"""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [
+            {"frame": frame, "samples": count, "percent": round(count / total * 100, 2)}
+            for frame, count in leaves.most_common(limit)
+        ]
+
+    def to_dict(self, top: int = 20) -> Dict:
+        return {
+            "seconds": round(self.seconds, 3),
+            "interval_ms": round(self.interval * 1000, 3),
+            "samples": self.samples,
+            "top_functions": self.top_functions(top),
+            "collapsed": self.collapsed(),
+            "allocations": self.allocations,
+        }
+
+
+class ProfilerService:
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float, interval: float = 0.005, allocations: bool = True,
+                top: int = 20, include_idle: bool = True) -> ProfileResult:
+        """
+        Sample all threads for `seconds` (blocking the calling thread only).
+        Raises ProfilerBusy if a profile is already running.
+        """
+        seconds = min(max(seconds, 0.0), MAX_SECONDS)
+        interval = max(interval, MIN_INTERVAL)
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy("A profile is already running")
+        started_tracemalloc = False
+        try:
+            if allocations and not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                started_tracemalloc = True
+            start = time.perf_counter()
+            stacks, samples = self._sample(seconds, interval, include_idle)
+            elapsed = time.perf_counter() - start
+            report = self._allocation_report(top) if allocations else None
+        finally:
+            if started_tracemalloc:
+                tracemalloc.stop()
+            self._lock.release()
+        return ProfileResult(stacks, samples, elapsed, interval, report)
+
+    @staticmethod
+    def _sample(seconds: float, interval: float, include_idle: bool):
+        me = threading.get_ident()
+        names = {}
+        stacks: Counter = Counter()
+        samples = 0
+        deadline = time.perf_counter() + seconds
+        while True:
+            names.update((t.ident, t.name) for t in threading.enumerate())
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if not include_idle and labels and _is_idle(labels[0]):
+                    continue
+                labels.append(names.get(thread_id, f"thread-{thread_id}").replace(";", ":"))
+                stacks[";".join(reversed(labels))] += 1
+            samples += 1
+            if time.perf_counter() >= deadline:
+                break
+            time.sleep(interval)
+        return stacks, samples
+
+    @staticmethod
+    def _allocation_report(top: int) -> Dict:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # the sampler's own stack strings
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        stats = snapshot.statistics("lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "traced_current_bytes": current,
+            "traced_peak_bytes": peak,
+            "total_blocks": sum(stat.count for stat in stats),
+            "top_lines": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_bytes": stat.size,
+                    "blocks": stat.count,
+                }
+                for stat in stats[:top]
+            ],
+        }
+
+
+profiler_service = ProfilerService()
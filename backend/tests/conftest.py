@@ -0,0 +1,10 @@
+import os
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+# In-memory database: importing database.py must not create or restore
+# backend/university_system.db while the suite runs
+os.environ.setdefault("DATABASE_URL", "sqlite://")
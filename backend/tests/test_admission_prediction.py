@@ -0,0 +1,120 @@
+import itertools
+import pickle
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from modules.admission_prediction import (
+    CHANCE_LEVELS,
+    predict_admission,
+    predict_admission_batch,
+    predict_admission_many,
+)
+from modules.model_registry import LinearAdmissionModel, ModelRegistry, ModelValidationError
+
+
+def legacy_predict_admission(profile):
+    """predict_admission before the model registry (weighted score and threshold chain)"""
+    gpa = profile.gpa or 0
+    ielts = profile.ielts or 0
+    budget = profile.budget or 0
+
+    final_score = (
+        min(gpa / 4.0, 1.0) * 0.45 +
+        min(ielts / 9.0, 1.0) * 0.35 +
+        min(budget / 20000, 1.0) * 0.20
+    )
+    if final_score >= 0.75:
+        chance, message = "HIGH", "Excellent profile! Strong chances of admission."
+    elif final_score >= 0.5:
+        chance, message = "MEDIUM", "Good profile. You have fair chances of admission."
+    else:
+        chance, message = "LOW", "Profile needs improvement to increase admission chances."
+    return {"chance": chance, "probability": round(final_score * 100), "message": message}
+
+
+def grid_profiles():
+    # Fine steps around the 50/75 thresholds and the feature caps
+    gpas = [round(0.05 * i, 2) for i in range(0, 91)]
+    ielts = [round(0.5 * i, 1) for i in range(0, 21)]
+    budgets = [0, None, 1000, 5000, 8000, 12000, 15000, 19999, 20000, 35000]
+    return [SimpleNamespace(gpa=g, ielts=i, budget=b) for g, i, b in itertools.product(gpas, ielts, budgets)]
+
+
+def random_profiles(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(gpa=rng.uniform(0, 4.5), ielts=rng.uniform(0, 9.5), budget=rng.uniform(0, 40000))
+        for _ in range(n)
+    ]
+
+
+def test_predict_admission_matches_legacy_scoring():
+    for profile in grid_profiles() + random_profiles(5000):
+        assert predict_admission(profile) == legacy_predict_admission(profile), vars(profile)
+
+
+def test_batch_scoring_matches_single_profile_scoring():
+    profiles = grid_profiles() + random_profiles(5000)
+    probability, chance_index = predict_admission_batch(
+        [p.gpa for p in profiles], [p.ielts for p in profiles], [p.budget for p in profiles]
+    )
+    for profile, p, i in zip(profiles, probability.tolist(), chance_index.tolist()):
+        single = predict_admission(profile)
+        assert (single["probability"], single["chance"]) == (p, CHANCE_LEVELS[i]), vars(profile)
+    assert predict_admission_many(profiles[:500]) == [predict_admission(p) for p in profiles[:500]]
+
+
+@pytest.mark.parametrize("kind", ["linear", "logistic"])
+def test_linear_model_predict_matches_predict_one(kind):
+    model = LinearAdmissionModel([0.5, 0.3, 0.4], bias=-0.1, kind=kind)
+    X = np.array([[p.gpa, p.ielts, p.budget] for p in random_profiles(2000, seed=11)])
+    single = [model.predict_one(*row) for row in X.tolist()]
+    if kind == "linear":
+        # Exact: the chance buckets floor the score, so one ulp can move a profile
+        assert model.predict(X).tolist() == single
+    else:
+        # np.exp and math.exp may differ in the last bit
+        assert model.predict(X).tolist() == pytest.approx(single, rel=1e-12)
+
+
+def test_registry_serves_pickled_model_and_keeps_it_on_bad_update(tmp_path):
+    path = tmp_path / "admission_model.pkl"
+    path.write_bytes(pickle.dumps({"version": "v1", "kind": "linear", "weights": [0.45, 0.35, 0.20]}))
+    registry = ModelRegistry(str(path), reload_check_seconds=-1)
+
+    assert registry.load()["version"] == "v1"
+    X = np.array([[3.2, 6.5, 9000.0], [4.0, 9.0, 40000.0]])
+    assert registry.predict(X).tolist() == [registry.predict_one(*row) for row in X.tolist()]
+
+    path.write_bytes(pickle.dumps({"version": "v2", "kind": "linear", "weights": [float("nan"), 0.3, 0.2]}))
+    metadata = registry.load()
+    assert metadata["version"] == "v1"
+    assert metadata["load_error"]
+
+
+def test_linear_model_rejects_wrong_shape():
+    with pytest.raises(ModelValidationError):
+        LinearAdmissionModel([0.5, 0.5])
+
+
+def test_registry_predict_one_follows_hot_swap(tmp_path):
+    path = tmp_path / "admission_model.pkl"
+    path.write_bytes(pickle.dumps({"version": "v1", "kind": "linear", "weights": [0.45, 0.35, 0.20]}))
+    registry = ModelRegistry(str(path), reload_check_seconds=0)
+    assert registry.predict_one(4.0, 9.0, 0.0) == pytest.approx(0.8)
+
+    path.write_bytes(pickle.dumps({"version": "v2", "kind": "linear", "weights": [0.5, 0.5, 0.0], "bias": 0.001}))
+    assert registry.predict_one(4.0, 9.0, 0.0) == 1.0
+    assert registry.metadata["version"] == "v2"
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf"), -1.0, 0.0, 1e9])
+def test_linear_predict_one_keeps_min_max_semantics(value):
+    model = LinearAdmissionModel([0.45, 0.35, 0.20])
+    z = 0.0
+    for v, w, s in zip((value, 7.0, value), model.weights, model.scales):
+        z += min(v / s, 1.0) * w
+    assert model.predict_one(value, 7.0, value) == max(0.0, min(z, 1.0))
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from routes import analytics
+
+
+@pytest.fixture
+def outcomes_csv(tmp_path, monkeypatch):
+    now = datetime.now(timezone.utc)
+    stamp = lambda days: (now - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    path = tmp_path / "prediction_outcomes.csv"
+    path.write_text("\n".join([
+        "timestamp,probability,admitted",
+        f"{stamp(1)},80,1",
+        f"{stamp(2)},30,0",
+        f"{stamp(3)},60,0",
+        f"{stamp(40)},90,1",
+        f"{stamp(1)},,1",       # blank probability
+        f"{stamp(1)},nan,0",
+        f"{stamp(1)},45,",      # blank outcome
+        "not a date,50,1",
+        f"{stamp(1)},140,0",    # out of range
+        f"{stamp(1)},20,2",
+    ]) + "\n")
+    monkeypatch.setattr(analytics, "PREDICTION_OUTCOMES_PATH", str(path))
+    return str(path)
+
+
+def test_loader_skips_malformed_rows(outcomes_csv):
+    timestamps, probabilities, admitted = analytics._load_prediction_outcomes(outcomes_csv)
+    assert probabilities.tolist() == [0.8, 0.3, 0.6, 0.9]
+    assert admitted.tolist() == [1, 0, 0, 1]
+    assert len(timestamps) == 4
+
+
+def test_accuracy_endpoint_scores_the_requested_window(outcomes_csv):
+    recent = analytics.get_prediction_accuracy("30d", 0.5, 10)
+    assert recent["status"] == "success"
+    assert recent["predictions"] == 3
+    assert recent["confusion_matrix"] == {
+        "true_positives": 1, "true_negatives": 1, "false_positives": 1, "false_negatives": 0
+    }
+    assert analytics.get_prediction_accuracy("all", 0.5, 10)["predictions"] == 4
+    assert analytics.get_prediction_accuracy("soon", 0.5, 10)["status"] == "error"
+
+
+def test_accuracy_endpoint_without_outcome_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(analytics, "PREDICTION_OUTCOMES_PATH", str(tmp_path / "missing.csv"))
+    result = analytics.get_prediction_accuracy("all", 0.5, 10)
+    assert (result["status"], result["predictions"], result["calibration_score"]) == ("success", 0, 0.0)
+
+
+def test_app_mounts_only_the_accuracy_endpoint(outcomes_csv):
+    from fastapi.testclient import TestClient
+    from app import app
+
+    client = TestClient(app)
+    assert client.get("/analytics/predictions/accuracy", params={"time_period": "all"}).json()["predictions"] == 4
+    for placeholder in ("/analytics/summary", "/analytics/recommendations/trends", "/analytics/user/insights/1"):
+        assert client.get(placeholder).status_code == 404
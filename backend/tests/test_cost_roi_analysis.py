@@ -0,0 +1,95 @@
+import pytest
+
+from modules import cost_roi_analysis
+from modules.cost_roi_analysis import (
+    BREAK_EVEN_CAP_YEARS,
+    LIVING_EXPENSES,
+    MAX_SIMULATION_DRAWS,
+    CostRoiMatrix,
+    analyze_total_cost,
+    predict_career_roi,
+    rank_by_roi,
+    simulate_career_roi,
+)
+from scripts.generate_synthetic_data import generate_universities
+
+EDGE_UNIVERSITIES = [
+    {"university": "Lowercase Country", "country": "germany", "field": "Data Science", "average_fees_eur": 1500},
+    {"university": "Unknown Country", "country": "Atlantis", "field": "Law", "average_fees_eur": 9000},
+    {"university": "No Field", "country": "Spain", "field": "", "average_fees_eur": 0},
+    {"university": "Free Arts", "country": "Italy", "field": "Fine Arts", "average_fees_eur": None},
+]
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return list(generate_universities(2000, seed=3)) + EDGE_UNIVERSITIES
+
+
+def scalar_metrics(uni, field=None, duration_years=2, expected_salary=None):
+    """Per-university cost and ROI through the original one-call-per-row functions"""
+    country = str(uni.get("country") or "")
+    cost = analyze_total_cost(float(uni.get("average_fees_eur") or 0), country, duration_years)
+    roi = predict_career_roi(field or uni.get("field", ""), country, cost["total_combined_cost"], expected_salary)
+    return cost["total_combined_cost"], roi
+
+
+@pytest.mark.parametrize("field,duration_years,expected_salary", [
+    (None, 2, None),
+    ("Computer Science", 1, None),
+    ("Arts / Humanities", 3, None),
+    (None, 2, 30000),
+])
+def test_matrix_matches_per_university_functions(catalog, field, duration_years, expected_salary):
+    metrics = CostRoiMatrix(catalog).compute(field, duration_years, expected_salary)
+    for i, uni in enumerate(catalog):
+        total_cost, roi = scalar_metrics(uni, field, duration_years, expected_salary)
+        assert metrics["total_cost"][i] == pytest.approx(total_cost)
+        assert metrics["estimated_starting_salary"][i] == roi["estimated_starting_salary"]
+        assert metrics["break_even_years"][i] == roi["break_even_years"]
+        assert metrics["roi_score"][i] == roi["roi_score"]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"field": "Engineering", "limit": 25},
+    {"country": " Germany ", "max_fees": 5000, "limit": 0},
+    {"expected_salary": 80000, "duration_years": 1, "limit": 50},
+])
+def test_matrix_ranking_matches_scalar_ranking(catalog, kwargs):
+    assert CostRoiMatrix(catalog).rank_by_roi(**kwargs) == rank_by_roi(catalog, **kwargs)
+
+
+def test_simulation_is_reproducible_by_seed():
+    first = simulate_career_roi("Data Science", "germany", 40000, draws=5000, seed=7)
+    assert simulate_career_roi("Data Science", "germany", 40000, draws=5000, seed=7) == first
+    assert simulate_career_roi("Data Science", "germany", 40000, draws=5000, seed=8) != first
+
+
+def test_simulation_caps_draws_and_defaults_living_cost():
+    result = simulate_career_roi("Engineering", "Atlantis", 30000, draws=10 * MAX_SIMULATION_DRAWS)
+    assert result["draws"] == MAX_SIMULATION_DRAWS
+    assert result["assumptions"]["mean_living_cost_per_year"] == LIVING_EXPENSES["Default"]
+    assert simulate_career_roi("Engineering", "Germany", 30000, draws=0)["draws"] == 1
+
+
+def test_simulation_without_spread_matches_point_estimate(monkeypatch):
+    # With every distribution collapsed onto the point estimate's assumptions
+    # (30% tax, fixed post-graduation living cost, no job search) every draw
+    # breaks even exactly when predict_career_roi says
+    for name in ("SALARY_SPREAD", "TAX_SPREAD", "LIVING_COST_SPREAD"):
+        monkeypatch.setattr(cost_roi_analysis, name, 0.0)
+    monkeypatch.setitem(cost_roi_analysis.EFFECTIVE_TAX_RATES, "Netherlands", 1 - cost_roi_analysis.NET_INCOME_FACTOR)
+    monkeypatch.setitem(LIVING_EXPENSES, "Netherlands", cost_roi_analysis.POST_GRADUATION_LIVING_COST)
+    monkeypatch.setitem(cost_roi_analysis.JOB_SEARCH_MONTHS, "Business / MBA", 0)
+
+    for investment in (0, 15000, 48000, 120000):
+        point = predict_career_roi("Business", "Netherlands", investment)
+        simulated = simulate_career_roi("Business", "Netherlands", investment, draws=200)
+        assert set(simulated["break_even_years_percentiles"].values()) == {simulated["mean_break_even_years"]}
+        assert simulated["mean_break_even_years"] == pytest.approx(point["break_even_years"], abs=0.05)
+
+
+def test_simulation_caps_unprofitable_salaries():
+    result = simulate_career_roi("Arts", "Switzerland", 50000, expected_salary=1000, draws=1000)
+    assert result["break_even_years_percentiles"]["p50"] == BREAK_EVEN_CAP_YEARS
@@ -0,0 +1,55 @@
+import sqlite3
+
+import database
+
+
+def use_default_url(monkeypatch):
+    # restore_snapshot only applies to the default SQLite file
+    monkeypatch.setattr(database, "DATABASE_URL", database.DEFAULT_DATABASE_URL)
+
+
+def test_restore_copies_snapshot_when_database_missing(tmp_path, monkeypatch):
+    use_default_url(monkeypatch)
+    snapshot = tmp_path / "snapshot.db"
+    snapshot.write_bytes(b"snapshot")
+    target = tmp_path / "live.db"
+
+    assert database.restore_snapshot(str(snapshot), str(target)) is True
+    assert target.read_bytes() == b"snapshot"
+
+
+def test_restore_without_snapshot_leaves_database_to_init(tmp_path, monkeypatch):
+    use_default_url(monkeypatch)
+    target = tmp_path / "live.db"
+
+    assert database.restore_snapshot(str(tmp_path / "missing.db"), str(target)) is False
+    assert not target.exists()
+
+
+def test_restore_never_overwrites_existing_database(tmp_path, monkeypatch):
+    use_default_url(monkeypatch)
+    snapshot = tmp_path / "snapshot.db"
+    snapshot.write_bytes(b"snapshot")
+    target = tmp_path / "live.db"
+    target.write_bytes(b"live")
+
+    assert database.restore_snapshot(str(snapshot), str(target)) is False
+    assert target.read_bytes() == b"live"
+
+
+def test_restore_skipped_for_other_database_urls(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DATABASE_URL", "postgresql://db/app")
+    snapshot = tmp_path / "snapshot.db"
+    snapshot.write_bytes(b"snapshot")
+
+    assert database.restore_snapshot(str(snapshot), str(tmp_path / "live.db")) is False
+
+
+def test_committed_snapshot_matches_current_schema():
+    # Rebuild with scripts/build_db_snapshot.py when this fails (a stale
+    # snapshot is still safe, but every cold start re-initializes it)
+    with sqlite3.connect(database.DB_SNAPSHOT_PATH) as connection:
+        stored = connection.execute(f"SELECT version FROM {database.SCHEMA_MARKER_TABLE}").fetchone()[0]
+        users = [row[0] for row in connection.execute("SELECT username FROM user")]
+    assert stored == database.schema_version()
+    assert users == ["demo"]
@@ -0,0 +1,185 @@
+import random
+
+import numpy as np
+import pytest
+
+from modules import evaluation_metrics
+from modules.evaluation_metrics import BatchRecommendationEvaluator, PredictionEvaluator, RecommendationEvaluator
+from modules.field_taxonomy import field_categories, normalize_field
+from scripts.evaluate_recommendations import ANY_COUNTRY, ANY_FIELD, SilverLabeler
+from scripts.generate_synthetic_data import generate_profiles, generate_universities
+
+K_VALUES = [1, 5, 10]
+
+
+def random_queries(n, seed=1, catalog_size=200):
+    rng = random.Random(seed)
+    rankings = [rng.sample(range(catalog_size), rng.randint(0, 15)) for _ in range(n)]
+    truths = [rng.sample(range(catalog_size), rng.randint(0, 20)) for _ in range(n)]
+    return rankings, truths
+
+
+def scalar_metrics(ranking, truth):
+    metrics = RecommendationEvaluator.evaluate([(item, 0.0) for item in ranking], truth, K_VALUES)
+    values = {f"precision@{k}": v for k, v in metrics.precision_at_k.items()}
+    values.update({f"recall@{k}": v for k, v in metrics.recall_at_k.items()})
+    values.update({"ndcg": metrics.ndcg, "mrr": metrics.mrr, "map": metrics.map_score, "f1": metrics.f1_score})
+    return values
+
+
+def test_batch_per_query_matches_scalar_evaluator():
+    rankings, truths = random_queries(300)
+    ranked = BatchRecommendationEvaluator.pad_rankings(rankings, depth=K_VALUES[-1])
+    relevance, num_relevant = BatchRecommendationEvaluator.relevance_mask(ranked, truths)
+    batch = BatchRecommendationEvaluator.per_query(relevance, num_relevant, K_VALUES)
+
+    for i, (ranking, truth) in enumerate(zip(rankings, truths)):
+        if not truth:
+            continue  # the batch evaluator scores and averages labelled queries only
+        expected = scalar_metrics(ranking[:K_VALUES[-1]], truth)
+        for name, value in expected.items():
+            assert batch[name][i] == pytest.approx(value, abs=1e-12), (i, name)
+
+
+def test_batch_mean_matches_scalar_mean():
+    rankings, truths = random_queries(300, seed=2)
+    ranked = BatchRecommendationEvaluator.pad_rankings(rankings, depth=K_VALUES[-1])
+    metrics = BatchRecommendationEvaluator.evaluate(
+        *BatchRecommendationEvaluator.relevance_mask(ranked, truths), K_VALUES
+    )
+    labelled = [scalar_metrics(r[:K_VALUES[-1]], t) for r, t in zip(rankings, truths) if t]
+
+    for k in K_VALUES:
+        assert metrics.precision_at_k[k] == pytest.approx(np.mean([m[f"precision@{k}"] for m in labelled]))
+        assert metrics.recall_at_k[k] == pytest.approx(np.mean([m[f"recall@{k}"] for m in labelled]))
+    assert metrics.ndcg == pytest.approx(np.mean([m["ndcg"] for m in labelled]))
+    assert metrics.mrr == pytest.approx(np.mean([m["mrr"] for m in labelled]))
+    assert metrics.map_score == pytest.approx(np.mean([m["map"] for m in labelled]))
+    assert metrics.f1_score == pytest.approx(np.mean([m["f1"] for m in labelled]))
+
+
+def test_batch_counts_repeated_ground_truth_once():
+    rankings, truths = random_queries(100, seed=3)
+    repeated = [truth + truth[:2] for truth in truths]
+    ranked = BatchRecommendationEvaluator.pad_rankings(rankings, depth=K_VALUES[-1])
+    once = BatchRecommendationEvaluator.per_query(*BatchRecommendationEvaluator.relevance_mask(ranked, truths))
+    twice = BatchRecommendationEvaluator.per_query(*BatchRecommendationEvaluator.relevance_mask(ranked, repeated))
+    for name in once:
+        assert twice[name].tolist() == once[name].tolist(), name
+
+
+def test_pad_rankings_truncates_and_pads():
+    padded = BatchRecommendationEvaluator.pad_rankings([[3, 1, 2], [], [7]], depth=2)
+    assert padded.tolist() == [[3, 1], [-1, -1], [7, -1]]
+    assert BatchRecommendationEvaluator.pad_rankings([]).shape == (0, 0)
+
+
+def test_empty_batch_evaluates_to_zero():
+    relevance, num_relevant = BatchRecommendationEvaluator.relevance_mask(
+        BatchRecommendationEvaluator.pad_rankings([[]]), [[]]
+    )
+    assert BatchRecommendationEvaluator.evaluate(relevance, num_relevant).mrr == 0.0
+
+
+def test_silver_labels_match_row_filter():
+    catalog = list(generate_universities(1500, seed=4))
+    labeler = SilverLabeler(catalog)
+    profiles = list(generate_profiles(200, seed=4)) + [
+        {"gpa": 3.0, "budget": 0, "country": "All Europe", "field": "Select Field of Study"},
+        {"gpa": 0, "budget": 15000, "country": "Germany", "field": "Underwater Basket Weaving"},
+    ]
+
+    for profile in profiles:
+        country = str(profile.get("country") or "").strip().lower()
+        field = str(profile.get("field") or "").strip()
+        category = normalize_field(field) if field.lower() not in ANY_FIELD and field_categories(field) else None
+        expected = [
+            i for i, u in enumerate(catalog)
+            if (country in ANY_COUNTRY or u["country"].lower() == country)
+            and (category is None or category in field_categories(u["field"]))
+            and (not profile.get("gpa") or u["min_gpa"] <= profile["gpa"])
+            and (not profile.get("budget") or u["average_fees_eur"] <= profile["budget"])
+        ]
+        assert labeler.relevant(profile).tolist() == expected, profile
+
+
+def legacy_confusion_matrix(predictions, ground_truth):
+    """PredictionEvaluator.confusion_matrix before vectorization (four passes)"""
+    return {
+        "true_positives": sum(1 for p, g in zip(predictions, ground_truth) if p == 1 and g == 1),
+        "true_negatives": sum(1 for p, g in zip(predictions, ground_truth) if p == 0 and g == 0),
+        "false_positives": sum(1 for p, g in zip(predictions, ground_truth) if p == 1 and g == 0),
+        "false_negatives": sum(1 for p, g in zip(predictions, ground_truth) if p == 0 and g == 1),
+    }
+
+
+def random_outcomes(n, seed=5):
+    rng = random.Random(seed)
+    probabilities = [rng.choice([0.0, 0.5, 1.0, 0.1 * rng.randint(0, 10), rng.random()]) for _ in range(n)]
+    admitted = [int(rng.random() < p) for p in probabilities]
+    return probabilities, admitted
+
+
+def test_confusion_matrix_matches_legacy_loops():
+    rng = random.Random(6)
+    predictions = [rng.choice([0, 1, 1, 2]) for _ in range(2000)]  # 2 is not counted by either
+    ground_truth = [rng.choice([0, 1]) for _ in range(2000)]
+    assert PredictionEvaluator.confusion_matrix(predictions, ground_truth) == \
+        legacy_confusion_matrix(predictions, ground_truth)
+
+
+@pytest.mark.parametrize("threshold,n_bins", [(0.5, 10), (0.3, 7), (1.0, 1)])
+def test_evaluate_probabilities_matches_scalar_definitions(threshold, n_bins):
+    probabilities, admitted = random_outcomes(3000)
+    metrics = PredictionEvaluator.evaluate_probabilities(probabilities, admitted, threshold, n_bins)
+
+    predictions = [int(p >= threshold) for p in probabilities]
+    matrix = legacy_confusion_matrix(predictions, admitted)
+    assert metrics.count == len(probabilities)
+    assert metrics.confusion_matrix == matrix
+    assert metrics.accuracy == PredictionEvaluator.accuracy(predictions, admitted)
+    assert metrics.precision == PredictionEvaluator.precision(predictions, admitted)
+    assert metrics.recall == PredictionEvaluator.recall(predictions, admitted)
+    assert metrics.brier_score == pytest.approx(
+        sum((p - a) ** 2 for p, a in zip(probabilities, admitted)) / len(probabilities)
+    )
+
+    bins = [[] for _ in range(n_bins)]
+    for p, a in zip(probabilities, admitted):
+        bins[min(int(p * n_bins), n_bins - 1)].append((p, a))
+    for i, (row, members) in enumerate(zip(metrics.reliability, bins)):
+        assert (row["lower"], row["upper"], row["count"]) == (i / n_bins, (i + 1) / n_bins, len(members))
+        if members:
+            assert row["mean_predicted"] == pytest.approx(sum(p for p, _ in members) / len(members))
+            assert row["observed_rate"] == pytest.approx(sum(a for _, a in members) / len(members))
+        else:
+            assert row["mean_predicted"] is None and row["observed_rate"] is None
+    assert metrics.expected_calibration_error == pytest.approx(sum(
+        abs(sum(p for p, _ in members) - sum(a for _, a in members)) for members in bins
+    ) / len(probabilities))
+
+
+def test_evaluate_probabilities_without_predictions():
+    metrics = PredictionEvaluator.evaluate_probabilities([], [])
+    assert (metrics.count, metrics.accuracy, metrics.brier_score, metrics.expected_calibration_error) == (0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("probabilities", [[0.2, float("nan")], [0.2, float("inf")], [0.2, 1.2], [-0.1, 0.5]])
+def test_evaluate_probabilities_rejects_invalid_probabilities(probabilities):
+    with pytest.raises(ValueError):
+        PredictionEvaluator.evaluate_probabilities(probabilities, [0, 1])
+
+
+def test_confusion_matrix_without_numpy(monkeypatch):
+    rng = random.Random(7)
+    predictions = [rng.choice([0, 1, 1.0, True, 2, None]) for _ in range(2000)]
+    ground_truth = [rng.choice([0, 1, 0.0, -1]) for _ in range(2000)]
+    expected = (PredictionEvaluator.confusion_matrix(predictions, ground_truth),
+                PredictionEvaluator.precision(predictions, ground_truth),
+                PredictionEvaluator.recall(predictions, ground_truth))
+
+    monkeypatch.setattr(evaluation_metrics, "np", None)
+    matrix = PredictionEvaluator.confusion_matrix(predictions, ground_truth)
+    assert matrix == legacy_confusion_matrix(predictions, ground_truth)
+    assert (matrix, PredictionEvaluator.precision(predictions, ground_truth),
+            PredictionEvaluator.recall(predictions, ground_truth)) == expected
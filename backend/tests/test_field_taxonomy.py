@@ -0,0 +1,40 @@
+import pytest
+
+from modules.field_taxonomy import DEFAULT_CATEGORY, field_categories, normalize_field
+
+
+@pytest.mark.parametrize("field,category", [
+    ("Political Science", "Social Sciences"),
+    ("Computer Science", "Computer Science / AI"),
+    ("Data Science", "Data Science"),
+    ("Chemical Engineering", "Engineering"),
+    ("Engineering Physics", "Engineering"),
+    ("Biotechnology Engineering", "Engineering"),
+    ("Computer Engineering", "Computer Science / AI"),
+    ("Biomedical Engineering", "Engineering"),
+    ("Medicine and Health Sciences", "Medicine / Healthcare"),
+    ("Mechanical Engineering", "Engineering"),
+    ("Physics", "Natural Sciences"),
+    ("Biology", "Natural Sciences"),
+    ("Economics", "Business / MBA"),
+    ("Human Resources Management", "Business / MBA"),
+    ("Humanities", "Arts / Humanities"),
+    ("Artificial Intelligence", "Computer Science / AI"),
+    ("Sustainability", DEFAULT_CATEGORY),
+    ("International Relations", "Social Sciences"),
+    ("Law", "Law & Legal Studies"),
+    ("Psychology", "Psychology"),
+    ("  COMPUTER   science ", "Computer Science / AI"),
+    ("", DEFAULT_CATEGORY),
+    (None, DEFAULT_CATEGORY),
+])
+def test_normalize_field(field, category):
+    assert normalize_field(field) == category
+
+
+def test_field_categories_lists_every_discipline():
+    assert field_categories("Mechanical Engineering, AI, Robotics") == {"Engineering", "Computer Science / AI"}
+    assert field_categories("Arts, Social Sciences, Law, Natural Sciences") == {
+        "Arts / Humanities", "Social Sciences", "Law & Legal Studies", "Natural Sciences"
+    }
+    assert field_categories("") == frozenset()
@@ -0,0 +1,79 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from modules.admission_prediction import predict_admission
+
+PROFILES = [
+    {"id": "a", "gpa": 3.8, "ielts": 7.5, "budget": 25000},
+    {"id": "b", "gpa": 2.4, "ielts": 5.5, "budget": 4000},
+    {"gpa": 3.1, "ielts": 6.5, "budget": 12000},
+]
+
+
+@pytest.fixture
+def client():
+    return TestClient(app_module.app)
+
+
+def ndjson(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def expected(profile, index):
+    result = predict_admission(SimpleNamespace(
+        gpa=profile.get("gpa"), ielts=profile.get("ielts"), budget=profile.get("budget")
+    ))
+    record = {"index": index, **result}
+    if profile.get("id") is not None:
+        record["id"] = profile["id"]
+    return record
+
+
+def test_json_list_matches_single_predictions(client):
+    records = ndjson(client.post("/predict/batch", json=PROFILES))
+    assert records == [expected(p, i) for i, p in enumerate(PROFILES)]
+
+
+def test_json_object_body(client):
+    records = ndjson(client.post("/predict/batch", json={"profiles": PROFILES[:2]}))
+    assert [r["id"] for r in records] == ["a", "b"]
+
+
+def test_csv_upload_and_raw_csv(client):
+    body = "id,gpa,ielts,budget\na,3.8,7.5,25000\nb,2.4,5.5,4000\n"
+    uploaded = ndjson(client.post("/predict/batch", files={"file": ("profiles.csv", body, "text/csv")}))
+    raw = ndjson(client.post("/predict/batch", content=body, headers={"content-type": "text/csv"}))
+    assert uploaded == raw == [expected(p, i) for i, p in enumerate(PROFILES[:2])]
+
+
+def test_missing_values_count_as_zero(client):
+    body = "gpa,ielts,budget\n3.5,,\n,,\n"
+    records = ndjson(client.post("/predict/batch", content=body, headers={"content-type": "text/csv"}))
+    assert records == [expected({"gpa": 3.5}, 0), expected({}, 1)]
+    assert ndjson(client.post("/predict/batch", json=[])) == []
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"json": [{"gpa": "excellent", "ielts": 7, "budget": 1000}]},
+    {"json": [3.5]},
+    {"json": {"profiles": "none"}},
+    {"content": "not json", "headers": {"content-type": "application/json"}},
+    {"files": {"upload": ("profiles.csv", "gpa\n3\n", "text/csv")}},
+])
+def test_malformed_batches_return_an_error(client, kwargs):
+    response = client.post("/predict/batch", **kwargs)
+    assert response.status_code == 200
+    assert response.json()["status"] == "error"
+
+
+def test_without_numpy_uses_the_scalar_kernel(client, monkeypatch):
+    with_numpy = client.post("/predict/batch", json=PROFILES + [{"gpa": "nan", "ielts": 9, "budget": 1e9}]).text
+    monkeypatch.setattr(app_module, "NUMPY_AVAILABLE", False)
+    monkeypatch.setattr(app_module, "predict_admission_batch", None)  # must not be reached
+    assert client.post("/predict/batch", json=PROFILES + [{"gpa": "nan", "ielts": 9, "budget": 1e9}]).text == with_numpy
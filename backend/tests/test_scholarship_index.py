@@ -0,0 +1,122 @@
+import csv
+import random
+
+import pytest
+
+from data_fetcher import scholarship_index
+from data_fetcher.scholarship_index import ScholarshipIndex, parse_amount, tokenize
+from modules.cost_roi_analysis import match_scholarships
+from scripts.generate_synthetic_data import SCHOLARSHIP_COLUMNS, generate_scholarships, write_csv
+
+EDGE_ROWS = [
+    {"scholarship_name": "Comma Amount", "country": "germany ", "coverage": "FULL", "amount_eur": "12,000",
+     "eligibility": "Merit-based, STEM"},
+    {"scholarship_name": "No Amount", "country": "Germany", "coverage": "Partial", "amount_eur": "varies",
+     "eligibility": ""},
+    {"scholarship_name": "Boundary", "country": "France", "coverage": "Tuition", "amount_eur": "5000",
+     "eligibility": "Need-based"},
+]
+
+
+@pytest.fixture(scope="module")
+def scholarships_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp("scholarships") / "scholarships.csv"
+    write_csv(str(path), generate_scholarships(1000, seed=5), SCHOLARSHIP_COLUMNS)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def rows(scholarships_csv):
+    with open(scholarships_csv, encoding="utf-8") as f:
+        return list(csv.DictReader(f)) + [{**dict.fromkeys(SCHOLARSHIP_COLUMNS, ""), **row} for row in EDGE_ROWS]
+
+
+def scan(rows, country=None, coverage=None, min_amount=None, max_amount=None, eligibility=None):
+    """The documented filter semantics, one row at a time"""
+    results = []
+    for row in rows:
+        if country and str(row.get("country", "")).lower() != country.strip().lower():
+            continue
+        if coverage and str(row.get("coverage", "")).lower() != coverage.strip().lower():
+            continue
+        amount = parse_amount(row.get("amount_eur"))
+        if min_amount is not None and amount < min_amount:
+            continue
+        if max_amount is not None and amount > max_amount:
+            continue
+        if eligibility:
+            tokens = tokenize(row.get("eligibility", ""))
+            if not all(any(t.startswith(term) for t in tokens) for term in tokenize(eligibility)):
+                continue
+        results.append(row)
+    return results
+
+
+def random_queries(rows, n, seed=9):
+    rng = random.Random(seed)
+    countries = sorted({row["country"] for row in rows}) + ["GERMANY", " france", "Atlantis"]
+    coverages = sorted({row["coverage"] for row in rows}) + ["full", "Unknown"]
+    terms = sorted({t for row in rows for t in tokenize(row["eligibility"])})
+    for _ in range(n):
+        query = {}
+        if rng.random() < 0.6:
+            query["country"] = rng.choice(countries)
+        if rng.random() < 0.5:
+            query["coverage"] = rng.choice(coverages)
+        if rng.random() < 0.4:
+            query["min_amount"] = rng.choice([0, 2000, 5000, 9999.5, 12000])
+        if rng.random() < 0.4:
+            query["max_amount"] = rng.choice([0, 5000, 8000, 15000])
+        if rng.random() < 0.4:
+            picked = rng.sample(terms, rng.randint(1, 2))
+            query["eligibility"] = " ".join(term[:rng.randint(1, len(term))] for term in picked)
+        yield query
+
+
+def test_index_matches_linear_scan(rows):
+    index = ScholarshipIndex(rows)
+    assert index.query() == rows
+    for query in random_queries(rows, 500):
+        assert index.query(**query) == scan(rows, **query), query
+
+
+def test_index_returns_copies(rows):
+    index = ScholarshipIndex(rows)
+    index.query(country="Germany")[0]["country"] = "changed"
+    assert "changed" not in {row["country"] for row in rows}
+
+
+def legacy_match_scholarships(csv_path, country):
+    """match_scholarships before the scholarship index (exact country, CSV scan)"""
+    results = []
+    with open(csv_path, mode="r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row.get("country") == country:
+                try:
+                    amount = float(row.get("amount_eur", 0))
+                except (ValueError, TypeError):
+                    amount = 0
+                results.append({
+                    "name": row.get("scholarship_name"),
+                    "country": row.get("country"),
+                    "coverage": row.get("coverage"),
+                    "amount_eur": amount,
+                    "eligibility": row.get("eligibility"),
+                    "website_url": row.get("website_url", "#")
+                })
+    return results
+
+
+def test_match_scholarships_matches_legacy_scan(scholarships_csv, monkeypatch):
+    monkeypatch.setattr(scholarship_index, "SCHOLARSHIPS_CSV", scholarships_csv)
+    with open(scholarships_csv, encoding="utf-8") as f:
+        countries = sorted({row["country"] for row in csv.DictReader(f)})
+
+    for country in countries + ["germany", "Atlantis"]:
+        assert match_scholarships(None, country) == legacy_match_scholarships(scholarships_csv, country), country
+
+
+@pytest.mark.parametrize("country", [None, ""])
+def test_match_scholarships_without_country_is_empty(scholarships_csv, monkeypatch, country):
+    monkeypatch.setattr(scholarship_index, "SCHOLARSHIPS_CSV", scholarships_csv)
+    assert match_scholarships(None, country) == []
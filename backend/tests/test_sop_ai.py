@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from routes.sop_ai import SOPRequest, _sop_prompts, _template_sop
+from services.groq_service import groq_service
+from services.llm_backends import FakeLLMBackend, LLMBackend
+
+REQUEST = {
+    "universityName": "TU Munich",
+    "courseName": "Data Engineering",
+    "studentBackground": "a BSc in Computer Science",
+    "careerGoals": "building data platforms",
+    "tone": "Academic",
+}
+
+
+class UnconfiguredBackend(LLMBackend):
+    async def complete(self, messages, model, temperature=0.7):
+        raise AssertionError("unconfigured backends are never called")
+
+
+@pytest.fixture
+def client():
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def use_backend(monkeypatch):
+    def use(backend):
+        monkeypatch.setattr(groq_service, "backend", backend)
+    return use
+
+
+def stream_text(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    return response.text
+
+
+def test_stream_matches_generated_sop(client, use_backend):
+    backend = FakeLLMBackend(latency_ms=0, tokens_per_second=0)
+    use_backend(backend)
+    text = stream_text(client.post("/ai/sop/generate/stream", json=REQUEST))
+
+    prompt, system_prompt = _sop_prompts(SOPRequest(**REQUEST))
+    assert text == backend.respond(groq_service._messages(prompt, system_prompt))
+    assert text == client.post("/ai/sop/generate", json=REQUEST).json()["sop_text"]
+
+
+@pytest.mark.parametrize("backend", [UnconfiguredBackend(), FakeLLMBackend(latency_ms=0, error_rate=1.0)])
+def test_stream_falls_back_to_template(client, use_backend, backend):
+    use_backend(backend)
+    text = stream_text(client.post("/ai/sop/generate/stream", json=REQUEST))
+    assert text == _template_sop(SOPRequest(**REQUEST))
@@ -0,0 +1,182 @@
+"""
+Backend Utilities - ASGI Middleware Module
+Pure ASGI middleware for CORS, path-prefix stripping, request timing and
+metrics (request tracing lives in utils.tracing).
+
+Each one only touches the scope or appends pre-encoded header pairs to the
+`http.response.start` message; response bodies are forwarded untouched, so
+streaming responses keep streaming and no per-request Response objects are
+built (unlike @app.middleware("http") / BaseHTTPMiddleware).
+"""
+
+import time
+from typing import List, Tuple
+
+from services.metrics_service import metrics_service
+from utils.compression import MIN_COMPRESS_SIZE, CompressionMiddleware
+from utils.tracing import TracingMiddleware
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+PREFLIGHT_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+PREFLIGHT_VARY = b"Access-Control-Request-Headers"
+
+
+def _header(raw: RawHeaders, name: bytes) -> bytes:
+    for key, value in raw:
+        if key == name:
+            return value
+    return b""
+
+
+class CORSMiddleware:
+    """
+    Public-API CORS: any origin, method and header, never with credentials.
+
+    Every response gets Access-Control-Allow-Origin: * and no
+    Allow-Credentials, so browsers never send cookies cross-site (the API
+    authenticates with bearer tokens; preflights echo the requested headers,
+    which lets Authorization through). Preflights are answered here without
+    reaching the application.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.cors_headers = [
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-methods", b"*"),
+            (b"access-control-allow-headers", b"*"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = scope["headers"]
+        if (
+            scope["method"] == "OPTIONS"
+            and _header(request_headers, b"origin")
+            and _header(request_headers, b"access-control-request-method")
+        ):
+            await self._preflight(_header(request_headers, b"access-control-request-headers"), send)
+            return
+
+        cors_headers = self.cors_headers
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(requested_headers: bytes, send) -> None:
+        headers = [
+            (b"vary", PREFLIGHT_VARY),
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-methods", PREFLIGHT_METHODS),
+            (b"access-control-allow-headers", requested_headers or b"*"),
+            (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+            (b"content-length", b"2"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
+
+
+class StripPrefixMiddleware:
+    """
+    Remove a path prefix before routing.
+
+    Vercel forwards the full request path (e.g. /api/recommend) while the
+    FastAPI routes are defined without the /api prefix (e.g. /recommend).
+    """
+
+    def __init__(self, app, prefix: str = "/api"):
+        self.app = app
+        self.prefix = prefix
+        self.raw_prefix = prefix.encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            path = scope.get("path", "")
+            if path.startswith(self.prefix):
+                scope = dict(scope)
+                scope["path"] = path[len(self.prefix):] or "/"
+                raw_path = scope.get("raw_path")
+                if raw_path and raw_path.startswith(self.raw_prefix):
+                    scope["raw_path"] = raw_path[len(self.raw_prefix):] or b"/"
+        await self.app(scope, receive, send)
+
+
+class TimingMiddleware:
+    """Adds `Server-Timing: app;dur=<ms>` (time until the response headers were ready)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                raw = list(message.get("headers", []))
+                raw.append((b"server-timing", b"app;dur=%.1f" % elapsed_ms))
+                message["headers"] = raw
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+class MetricsMiddleware:
+    """
+    Request count, latency and in-flight gauge per route.
+
+    Routes are labelled by their path template (e.g. /visa/requirements/{country_code})
+    as set in the scope by the router, so label cardinality stays bounded;
+    requests that matched no route are labelled "unmatched".
+    """
+
+    def __init__(self, app, registry=metrics_service):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status = "500"
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        self.registry.http_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.registry.http_in_flight.dec(method)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.registry.http_requests.inc(route, method, status)
+            self.registry.http_latency.observe(route, method, value=elapsed)
+
+
+def install_middleware(app, minimum_size: int = MIN_COMPRESS_SIZE) -> None:
+    """The standard stack, outermost last: timing -> CORS -> gzip/brotli -> metrics -> tracing"""
+    app.add_middleware(TimingMiddleware)
+    app.add_middleware(CORSMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(TracingMiddleware)
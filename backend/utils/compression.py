@@ -0,0 +1,196 @@
+"""
+Backend Utilities - Response Compression Module
+Accept-Encoding negotiation (brotli when installed, gzip otherwise) and an
+ASGI middleware that compresses JSON/text responses above a size threshold.
+
+Responses that already carry a Content-Encoding (precomputed catalog, visa
+and relocation payloads compressed once at startup) pass through untouched,
+so their bytes are never compressed twice.
+"""
+
+import zlib
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_COMPRESS_SIZE = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+# Server preference order, used to break q-value ties
+AVAILABLE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript", "application/xml")
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """{coding: q} from an Accept-Encoding header"""
+    preferences = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        preferences[name] = q
+    return preferences
+
+
+def choose_encoding(accept_encoding: Optional[str], available: Sequence[str] = AVAILABLE_ENCODINGS) -> Optional[str]:
+    """Best encoding the client accepts (q > 0), or None for identity"""
+    preferences = parse_accept_encoding(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = preferences.get(encoding, preferences.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """One-shot compression; gzip output is deterministic (mtime 0)"""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY if level is None else level)
+    compressor = zlib.compressobj(GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETags must differ per content-coding; weak ones may be shared"""
+    if etag.startswith('"') and etag.endswith('"'):
+        return etag[:-1] + f'-{encoding}"'
+    return etag
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class _StreamCompressor:
+    """Incremental compressor; each chunk is flushed so NDJSON rows arrive promptly"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compress compressible responses of at least `minimum_size` bytes.
+
+    Args:
+        app: ASGI application
+        minimum_size: Smaller bodies are sent as-is (compression would not pay off)
+        gzip_level: zlib level for gzip responses
+        brotli_quality: Brotli quality (0-11) when the brotli package is installed
+    """
+
+    def __init__(self, app, minimum_size: int = MIN_COMPRESS_SIZE,
+                 gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+        pending = []  # body chunks held back until the size threshold is known
+        pending_size = 0
+        stream: Optional[_StreamCompressor] = None
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough, pending_size, stream
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_length = headers.get("content-length")
+                if (
+                    "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type"))
+                    or (content_length is not None and int(content_length) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message  # wait for the body to decide
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is not None:
+                data = stream.chunk(body) if more_body else stream.chunk(body) + stream.finish()
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            pending.append(body)
+            pending_size += len(body)
+            if more_body and pending_size < self.minimum_size:
+                return
+            body = b"".join(pending)
+            pending.clear()
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], encoding)
+
+            if more_body:
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                stream = _StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+                await send(start_message)
+                await send({"type": "http.response.body", "body": stream.chunk(body), "more_body": True})
+                return
+
+            level = self.brotli_quality if encoding == "br" else self.gzip_level
+            data = compress(body, encoding, level)
+            headers["Content-Length"] = str(len(data))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": data})
+
+        await self.app(scope, receive, send_compressed)
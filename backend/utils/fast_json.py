@@ -0,0 +1,109 @@
+"""
+Backend Utilities - Fast JSON Module
+orjson-backed response rendering for every API route.
+
+FastAPI normally walks each returned dict/list with jsonable_encoder and then
+encodes it again with the stdlib json module. Our responses are almost all
+plain records (str/int/float/None in dicts and lists), which orjson encodes
+natively, so routes without a response_model hand their result straight to
+orjson and only unknown objects (pydantic models, sets, Decimals, ...) go
+through the `default` hook. Falls back to the stdlib path without orjson.
+"""
+
+import functools
+import inspect
+import json
+from decimal import Decimal
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from fastapi.datastructures import DefaultPlaceholder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def _default(obj: Any) -> Any:
+    """Called by orjson only for types it does not know"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "item"):  # numpy / pandas scalars
+        return obj.item()
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, byte-compatible with Starlette's JSONResponse for plain data"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _returns_fast_json(endpoint: Callable, status_code: int) -> Callable:
+    def wrap(result: Any) -> Any:
+        if isinstance(result, Response):
+            return result
+        return FastJSONResponse(result, status_code=status_code)
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapped(*args, **kwargs):
+            return wrap(await endpoint(*args, **kwargs))
+    else:
+        @functools.wraps(endpoint)
+        def wrapped(*args, **kwargs):
+            return wrap(endpoint(*args, **kwargs))
+    return wrapped
+
+
+class FastJSONRoute(APIRoute):
+    """
+    APIRoute that skips jsonable_encoder for routes without a response model.
+
+    Routes that declare a response_model (or a return annotation) keep
+    FastAPI's validation and filtering, as do routes with a non-JSON
+    response_class or an injected Response parameter.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_model = kwargs.get("response_model")
+        response_class = kwargs.get("response_class")
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        signature = inspect.signature(endpoint)
+
+        fast_path = (
+            (response_model is None or isinstance(response_model, DefaultPlaceholder))
+            and signature.return_annotation is inspect.Signature.empty
+            and (response_class is None or issubclass(response_class, JSONResponse))
+            and not any(
+                inspect.isclass(p.annotation) and issubclass(p.annotation, Response)
+                for p in signature.parameters.values()
+            )
+        )
+        if fast_path:
+            endpoint = _returns_fast_json(endpoint, kwargs.get("status_code") or 200)
+        super().__init__(path, endpoint, **kwargs)
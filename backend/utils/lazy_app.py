@@ -0,0 +1,80 @@
+"""
+Backend Utilities - Lazy ASGI Loading Module
+Defers importing the full application (pandas, numpy, SQLAlchemy and every
+router) until a request actually needs it. Lightweight routers are mounted on
+their own small app on first use, so e.g. /visa/countries on a cold serverless
+instance never imports the analytics stack or the Groq SDK.
+
+Usage:
+from utils.lazy_app import LazyApp, PrefixDispatcher, import_from_string, router_app
+app = PrefixDispatcher(
+    {"/visa": LazyApp(lambda: router_app("routes.visa_data:router"))},
+    default=LazyApp(lambda: import_from_string("app:app")),
+)
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict
+
+
+def import_from_string(path: str) -> Any:
+    """Resolve "package.module:attribute" """
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def router_app(router_path: str):
+    """Minimal app serving a single router with the standard middleware stack"""
+    from fastapi import FastAPI
+    from utils.asgi_middleware import install_middleware
+    from utils.fast_json import FastJSONResponse
+
+    app = FastAPI(default_response_class=FastJSONResponse, openapi_url=None)
+    app.include_router(import_from_string(router_path))
+    install_middleware(app)
+    return app
+
+
+class LazyApp:
+    """ASGI app built by `factory` on the first call (once, thread-safe)"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self._app = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._app is not None
+
+    def load(self):
+        if self._app is None:
+            with self._lock:
+                if self._app is None:
+                    self._app = self.factory()
+        return self._app
+
+    async def __call__(self, scope, receive, send):
+        await self.load()(scope, receive, send)
+
+
+class PrefixDispatcher:
+    """
+    Route requests to sub-apps by path prefix (longest prefix wins).
+
+    Anything unmatched, and the lifespan protocol, goes to `default`.
+    """
+
+    def __init__(self, routes: Dict[str, Any], default):
+        self.routes = sorted(routes.items(), key=lambda item: len(item[0]), reverse=True)
+        self.default = default
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            path = scope.get("path", "")
+            for prefix, app in self.routes:
+                if path == prefix or path.startswith(prefix + "/"):
+                    await app(scope, receive, send)
+                    return
+        await self.default(scope, receive, send)
@@ -1,101 +1,210 @@
 """
 Backend Utilities - Logging Module
 Provides centralized logging for the FastAPI application
+
+Request threads only put records on an in-memory queue (QueueHandler); a
+single QueueListener thread formats them as JSON lines and does the disk and
+console I/O. The log file rotates at midnight (logs/app.log ->
+logs/app.log.YYYY-MM-DD). Debug payloads are only serialized when DEBUG is
+enabled, and then on the listener thread.
 """
 
-import logging
+import atexit
+import copy
 import json
-from datetime import datetime
+import logging
+import os
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional, Any, Dict
 
-# Create logs directory if it doesn't exist
 LOG_DIR = Path(__file__).parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
+LOG_FILE = "app.log"
+LOG_BACKUP_DAYS = int(os.getenv("LOG_BACKUP_DAYS", "14"))
+# "json" (default) or "text" for the console handler; the file is always JSON lines
+LOG_CONSOLE_FORMAT = os.getenv("LOG_FORMAT", "json")
+
+# Attributes every LogRecord has; anything else was passed via `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that only interpolates the message on the calling thread.
+
+    The stock prepare() fully formats the record (and drops exc_info), which
+    would serialize extra fields on the request thread and flatten tracebacks
+    into the message; here JSON encoding is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        # The listener formats later: snapshot mutable `extra` payloads (dicts
+        # the caller may keep changing) so the log shows their value right now
+        for key, value in list(record.__dict__.items()):
+            if key not in _RECORD_ATTRIBUTES and isinstance(value, (dict, list, set)):
+                try:
+                    record.__dict__[key] = copy.deepcopy(value)
+                except Exception:
+                    record.__dict__[key] = repr(value)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listeners: Dict[str, QueueListener] = {}
+
+
+def stop_logging():
+    """Stop every listener thread, writing out queued records first (app shutdown)"""
+    for listener in _listeners.values():
+        listener.stop()  # drains the queue before returning
+    _listeners.clear()
+
+
+atexit.register(stop_logging)
+
 
 # Configure logging
 def setup_logger(name: str = "ai-university-system", level=logging.INFO):
     """
     Setup centralized logger for the application
-    
+
     Args:
         name: Logger name
         level: Logging level (default: INFO)
-    
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # File handler
-    file_handler = logging.FileHandler(
-        LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.log"
-    )
-    file_handler.setLevel(level)
-    
+    if name in _listeners:
+        return logger
+
+    # Restarted after stop_logging(): replace the previous queue handler
+    for handler in [h for h in logger.handlers if isinstance(h, _DeferredQueueHandler)]:
+        logger.removeHandler(handler)
+
+    handlers = []
+
+    # File handler (daily rotation, opened on the first record)
+    try:
+        LOG_DIR.mkdir(exist_ok=True)
+        file_handler = TimedRotatingFileHandler(
+            LOG_DIR / LOG_FILE, when="midnight", backupCount=LOG_BACKUP_DAYS, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    except OSError:
+        pass  # read-only filesystem (e.g. serverless): console only
+
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    if LOG_CONSOLE_FORMAT == "text":
+        console_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+    else:
+        console_handler.setFormatter(JsonFormatter())
+    handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    _listeners[name] = listener
     return logger
 
 # Initialize default logger
 logger = setup_logger()
 
+
+def start_logging():
+    """(Re)start the default logger's listener thread (app startup)"""
+    return setup_logger(logger.name, logger.level)
+
 class RequestLogger:
     """Log API requests and responses"""
-    
+
     @staticmethod
     def log_request(endpoint: str, method: str, data: Optional[Dict] = None):
         """Log incoming request"""
-        logger.info(f"[{method}] {endpoint} - Request received")
-        if data:
-            logger.debug(f"Request data: {json.dumps(data, default=str)}")
-    
+        logger.info("[%s] %s - Request received", method, endpoint, extra={"endpoint": endpoint, "method": method})
+        if data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request data", extra={"endpoint": endpoint, "data": data})
+
     @staticmethod
     def log_response(endpoint: str, status_code: int, duration: float):
         """Log outgoing response"""
-        logger.info(f"[{status_code}] {endpoint} - Response sent ({duration:.3f}s)")
-    
+        logger.info(
+            "[%s] %s - Response sent (%.3fs)", status_code, endpoint, duration,
+            extra={"endpoint": endpoint, "status_code": status_code, "duration_s": round(duration, 6)}
+        )
+
     @staticmethod
     def log_error(endpoint: str, error: Exception, status_code: int = 500):
         """Log error"""
-        logger.error(f"[{status_code}] {endpoint} - Error: {str(error)}")
-        logger.debug(f"Stack trace:", exc_info=True)
+        logger.error(
+            "[%s] %s - Error: %s", status_code, endpoint, error,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+            extra={"endpoint": endpoint, "status_code": status_code}
+        )
 
 class AnalyticsLogger:
     """Log analytics events for monitoring"""
-    
+
     @staticmethod
     def log_prediction(student_id: str, prediction: Dict[str, Any]):
         """Log admission prediction"""
-        logger.info(f"Prediction generated for student: {student_id}")
-        logger.debug(f"Prediction result: {json.dumps(prediction, default=str)}")
-    
+        logger.info("Prediction generated for student: %s", student_id, extra={"student_id": student_id})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prediction result", extra={"student_id": student_id, "prediction": prediction})
+
     @staticmethod
     def log_recommendation(student_id: str, recommendations: list, count: int):
         """Log university recommendations"""
-        logger.info(f"Recommended {count} universities for student: {student_id}")
-        logger.debug(f"Recommendations: {json.dumps(recommendations, default=str)}")
-    
+        logger.info(
+            "Recommended %s universities for student: %s", count, student_id,
+            extra={"student_id": student_id, "count": count}
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recommendations", extra={"student_id": student_id, "recommendations": recommendations})
+
     @staticmethod
     def log_analysis(analysis_type: str, data: Dict[str, Any]):
         """Log analysis operation"""
-        logger.info(f"Analysis completed: {analysis_type}")
-        logger.debug(f"Analysis data: {json.dumps(data, default=str)}")
+        logger.info("Analysis completed: %s", analysis_type, extra={"analysis_type": analysis_type})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Analysis data", extra={"analysis_type": analysis_type, "data": data})
 
 # Convenience functions
 def log_info(message: str):
@@ -109,7 +218,7 @@ def log_warning(message: str):
 def log_error(message: str, exception: Optional[Exception] = None):
     """Log error level message"""
     if exception:
-        logger.error(f"{message}: {str(exception)}", exc_info=True)
+        logger.error("%s: %s", message, exception, exc_info=exception)
     else:
         logger.error(message)
 
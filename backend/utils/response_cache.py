@@ -0,0 +1,97 @@
+"""
+Backend Utilities - Precomputed Response Module
+Serialize immutable payloads once, tag them with a strong ETag and answer
+conditional requests with 304 Not Modified
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from utils.compression import (
+    AVAILABLE_ENCODINGS, MIN_COMPRESS_SIZE, choose_encoding, compress as compress_body, encoded_etag
+)
+from services.metrics_service import metrics_service
+from utils.fast_json import dumps
+
+DEFAULT_CACHE_CONTROL = "public, no-cache"
+STATIC_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+# Compressed once per payload, so spend the CPU on the smallest output
+PRECOMPRESS_LEVELS = {"gzip": 9, "br": 11}
+
+
+def serialize_json(payload: Any) -> bytes:
+    """Serialize exactly like the app's default response class"""
+    return dumps(payload)
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag derived from the serialized bytes"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison, so W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class PrecomputedResponse:
+    """
+    Serialized body plus validators, built once and served many times.
+    With compress=True every supported content-coding (gzip, and brotli when
+    installed) is also prepared up front at maximum level and served to
+    clients that accept it.
+    """
+
+    def __init__(self, payload: Any, cache_control: str = DEFAULT_CACHE_CONTROL,
+                 media_type: str = "application/json", compress: bool = False):
+        self.body = serialize_json(payload)
+        self.etag = etag_for(self.body)
+        self.cache_control = cache_control
+        self.media_type = media_type
+
+        self.encoded: Dict[str, bytes] = {}
+        if compress and len(self.body) >= MIN_COMPRESS_SIZE:
+            self.encoded = {
+                encoding: compress_body(self.body, encoding, PRECOMPRESS_LEVELS[encoding])
+                for encoding in AVAILABLE_ENCODINGS
+            }
+        # Each encoding is a distinct representation, so it gets its own strong tag
+        self.etags = {encoding: encoded_etag(self.etag, encoding) for encoding in self.encoded}
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def to_response(self, request: Optional[Request] = None) -> Response:
+        encoding = None
+        if self.encoded and request is not None:
+            encoding = choose_encoding(request.headers.get("accept-encoding"), tuple(self.encoded))
+        etag = self.etags[encoding] if encoding else self.etag
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+
+        if request is not None:
+            if_none_match = request.headers.get("if-none-match")
+            not_modified = any(etag_matches(if_none_match, tag) for tag in (self.etag, *self.etags.values()))
+            if if_none_match:
+                metrics_service.record_cache("etag_revalidation", hit=not_modified)
+            if not_modified:
+                return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            return Response(content=self.encoded[encoding], media_type=self.media_type, headers=headers)
+        return Response(content=self.body, media_type=self.media_type, headers=headers)
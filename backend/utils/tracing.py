@@ -0,0 +1,400 @@
+"""
+Backend Utilities - Tracing Module
+Sampled request tracing with per-stage spans, exported as OpenTelemetry
+(OTLP/JSON) lines to stdout or a local file.
+
+A root span is opened per sampled request by TracingMiddleware and stored in
+a context variable; `span("stage")` blocks and `@traced` functions nested
+under it become child spans (contextvars follow awaits and run_in_threadpool).
+Outside a sampled trace both are no-ops that cost one ContextVar lookup, so
+stages can stay instrumented in production with sampling off.
+
+Finished traces are written as one `{"resourceSpans": [...]}` document per
+line by a background thread, the same payload an OTLP/HTTP JSON collector
+accepts. Configuration:
+
+    TRACE_SAMPLE_RATE   fraction of requests traced, 0.0 (default) to 1.0
+    TRACE_EXPORT        "stdout" (default) or a file path (appended to)
+    TRACE_SERVICE_NAME  resource service.name (default "europath-backend")
+
+An incoming W3C `traceparent` header with the sampled flag set is always
+traced and continues the caller's trace id.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Dict, List, Optional
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0") or 0)
+TRACE_EXPORT = os.getenv("TRACE_EXPORT", "stdout")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "europath-backend")
+INSTRUMENTATION_SCOPE = "europath.tracing"
+
+# OTLP span kinds / status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation; attributes are exported as OTLP key/value pairs"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns",
+                 "attributes", "status", "status_message")
+
+    def __init__(self, trace: "_Trace", name: str, parent_id: str = "", kind: int = SPAN_KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes or {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        if not self.end_ns:
+            self.end_ns = time.time_ns()
+            self.trace.finish(self)
+
+    def to_otlp(self) -> Dict:
+        data = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status, "message": self.status_message} if self.status else {},
+        }
+        if self.parent_id:
+            data["parentSpanId"] = self.parent_id
+        return data
+
+
+class _NoopSpan:
+    """Returned outside a sampled trace so callers never need to branch"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _Trace:
+    """Spans of one trace, exported together when the root span ends"""
+
+    __slots__ = ("trace_id", "root", "spans")
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or f"{random.getrandbits(128):032x}"
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+
+    def finish(self, span: Span) -> None:
+        self.spans.append(span)
+        if span is self.root:
+            export(self.spans)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span():
+    """The active span, or NOOP_SPAN when the current request is not sampled"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def should_sample(rate: Optional[float] = None) -> bool:
+    rate = TRACE_SAMPLE_RATE if rate is None else rate
+    return rate > 0 and (rate >= 1 or random.random() < rate)
+
+
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+    """
+    Child of the active span (not made current; call .end() yourself).
+    Used where start and end happen in different callbacks, e.g. SQL events.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, kind, attributes)
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+    """Time a block as a child of the active span; a no-op when not sampled"""
+    parent = _current_span.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+    child = Span(parent.trace, name, parent.span_id, kind, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+@contextmanager
+def root_span(name: str, trace_id: Optional[str] = None, parent_id: str = "",
+              kind: int = SPAN_KIND_SERVER, **attributes):
+    """Start a new trace (callers decide sampling, see should_sample())"""
+    trace = _Trace(trace_id)
+    trace.root = Span(trace, name, parent_id, kind, attributes)
+    token = _current_span.set(trace.root)
+    try:
+        yield trace.root
+    except BaseException as e:
+        trace.root.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        trace.root.end()
+
+
+def traced(name: Optional[str] = None, kind: int = SPAN_KIND_INTERNAL):
+    """Decorator version of span() for sync and async functions"""
+
+    def decorator(function):
+        span_name = name or f"{function.__module__}.{function.__qualname__}"
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await function(*args, **kwargs)
+                with span(span_name, kind):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return function(*args, **kwargs)
+            with span(span_name, kind):
+                return function(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# ---------- Export ----------
+
+def _otlp_value(value: Any) -> Dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict:
+    return {"key": key, "value": _otlp_value(value)}
+
+
+def otlp_document(spans: List[Span]) -> Dict:
+    """OTLP/JSON ExportTraceServiceRequest body for the given spans"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", TRACE_SERVICE_NAME)]},
+            "scopeSpans": [{
+                "scope": {"name": INSTRUMENTATION_SCOPE},
+                "spans": [s.to_otlp() for s in spans],
+            }],
+        }]
+    }
+
+
+class _OtlpFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(otlp_document(record.msg), separators=(",", ":"))
+
+
+_export_logger: Optional[logging.Logger] = None
+_listener: Optional[QueueListener] = None
+
+
+def _exporter() -> logging.Logger:
+    """Queue-backed writer started on the first export (nothing runs while sampling is off)"""
+    global _export_logger, _listener
+    if _export_logger is None:
+        if TRACE_EXPORT == "stdout":
+            handler = logging.StreamHandler(sys.stdout)
+        else:
+            try:
+                handler = logging.FileHandler(TRACE_EXPORT, encoding="utf-8")
+            except OSError as e:
+                print(f"Trace export to {TRACE_EXPORT} unavailable, using stdout: {e}")
+                handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_OtlpFormatter())
+        span_queue: SimpleQueue = SimpleQueue()
+        _listener = QueueListener(span_queue, handler)
+        _listener.start()
+        atexit.register(flush)
+
+        export_logger = logging.getLogger(INSTRUMENTATION_SCOPE)
+        export_logger.setLevel(logging.INFO)
+        # The stock QueueHandler.prepare() would format the spans on the request thread
+        queue_handler = QueueHandler(span_queue)
+        queue_handler.prepare = lambda record: record
+        export_logger.addHandler(queue_handler)
+        export_logger.propagate = False
+        _export_logger = export_logger
+    return _export_logger
+
+
+def flush() -> None:
+    """Write out queued traces and stop the writer (it restarts on the next export)"""
+    global _export_logger, _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        if _export_logger is not None:
+            for handler in list(_export_logger.handlers):
+                _export_logger.removeHandler(handler)
+    _export_logger = _listener = None
+
+
+def export(spans: List[Span]) -> None:
+    """Hand a finished trace to the background writer"""
+    _exporter().info(spans)
+
+
+# ---------- Integrations ----------
+
+def parse_traceparent(value: bytes):
+    """(trace_id, parent_span_id, sampled) from a W3C traceparent header, or None"""
+    try:
+        version, trace_id, parent_id, flags = value.decode("latin-1").strip().split("-")[:4]
+        int(trace_id, 16), int(parent_id, 16)
+        if len(trace_id) != 32 or len(parent_id) != 16 or trace_id == "0" * 32:
+            return None
+        return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+    except ValueError:
+        return None
+
+
+class TracingMiddleware:
+    """
+    Root span per sampled HTTP request (pure ASGI, see utils.asgi_middleware).
+
+    The span is named after the matched route template once routing has run,
+    and a `traceresponse` header carries the trace id back to the client.
+    """
+
+    def __init__(self, app, sample_rate: Optional[float] = None):
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id, parent_id = None, ""
+        sampled = False
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                parsed = parse_traceparent(value)
+                if parsed:
+                    trace_id, parent_id, sampled = parsed
+                break
+        if not sampled and not should_sample(self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with root_span(f"{method} {scope['path']}", trace_id, parent_id,
+                       **{"http.request.method": method, "url.path": scope["path"]}) as root:
+
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.response.status_code", message["status"])
+                    raw = list(message.get("headers", []))
+                    raw.append((b"traceresponse", f"00-{root.trace.trace_id}-{root.span_id}-01".encode()))
+                    message["headers"] = raw
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    root.name = f"{method} {route}"
+                    root.set_attribute("http.route", route)
+
+
+def instrument_engine(engine) -> None:
+    """Child span per SQL statement executed on a SQLAlchemy engine"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        query_span = start_span("db.query", SPAN_KIND_CLIENT, **{
+            "db.system": engine.dialect.name,
+            "db.statement": statement[:500],
+        })
+        if query_span:
+            conn.info.setdefault("_trace_spans", []).append(query_span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("_trace_spans")
+        if spans:
+            query_span = spans.pop()
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                query_span.set_attribute("db.rows_affected", cursor.rowcount)
+            query_span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        connection = exception_context.connection
+        spans = connection.info.get("_trace_spans") if connection is not None else None
+        if spans:
+            query_span = spans.pop()
+            query_span.record_exception(exception_context.original_exception)
+            query_span.end()